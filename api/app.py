@@ -20,6 +20,9 @@ Run this script to start the FastAPI server:
     
 Or with custom settings:
     uv run python api/app.py --host 0.0.0.0 --port 8080 --reload
+
+Or with pipelines running in separate worker processes (see api/worker.py):
+    uv run python api/app.py --task-execution worker
 """
 
 import sys
@@ -33,12 +36,13 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 import argparse
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
-from api.config import api_config
+from api.config import TASK_EXECUTION_ENV, api_config
 from api.tasks import task_manager
 from api.dependencies import shutdown_pixelle_video
 
@@ -165,8 +169,17 @@ if __name__ == "__main__":
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    parser.add_argument(
+        "--task-execution",
+        choices=["local", "worker"],
+        default=api_config.task_execution,
+        help="Run async tasks in this process (local) or in separate api/worker.py processes (worker)"
+    )
     
     args = parser.parse_args()
+    api_config.task_execution = args.task_execution
+    # uvicorn --reload serves from a child process that re-imports the config
+    os.environ[TASK_EXECUTION_ENV] = args.task_execution
     
     # Print startup banner
     print(f"""
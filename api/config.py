@@ -14,9 +14,14 @@
 API Configuration
 """
 
+import os
 from typing import Optional
 from pydantic import BaseModel
 
+# Environment variable overriding APIConfig.task_execution (set by `api/app.py
+# --task-execution`, so uvicorn reload/worker child processes see it too)
+TASK_EXECUTION_ENV = "PIXELLE_VIDEO_TASK_EXECUTION"
+
 
 class APIConfig(BaseModel):
     """API configuration"""
@@ -31,9 +36,25 @@ class APIConfig(BaseModel):
     cors_origins: list[str] = ["*"]
     
     # Task settings
-    max_concurrent_tasks: int = 5
+    max_concurrent_tasks: int = 5       # Tasks executing at once (others wait in the queue)
+    max_queued_tasks: int = 100         # Pending tasks before new submissions get HTTP 429
+    max_queued_tasks_per_client: int = 20  # Pending tasks per client before HTTP 429
     task_cleanup_interval: int = 3600  # Clean completed tasks every hour
     task_retention_time: int = 86400   # Keep task results for 24 hours
+    task_store: str = "sqlite"          # Task persistence backend: "sqlite" or "memory"
+    task_db_path: Optional[str] = None  # SQLite database path (default: data/tasks.db)
+    resume_orphaned_tasks: bool = True  # Re-queue tasks interrupted by a restart (else mark failed)
+    
+    # Task execution: "local" (in the API process) or "worker" (separate api/worker.py processes)
+    task_execution: str = os.environ.get(TASK_EXECUTION_ENV, "local")
+    
+    # Progress streaming
+    progress_persist_interval: float = 1.0    # Min seconds between progress writes to the store per task
+    progress_stream_interval: float = 0.25    # Min seconds between events on a progress stream
+    progress_keepalive_interval: float = 15.0 # Seconds between keep-alive comments on idle streams
+    worker_poll_interval: float = 1.0       # Seconds between queue polls when idle
+    worker_heartbeat_interval: float = 5.0  # Seconds between heartbeats of running tasks
+    worker_stale_timeout: float = 60.0      # Re-queue running tasks without heartbeat for this long
     
     # File upload settings
     max_upload_size: int = 100 * 1024 * 1024  # 100MB
@@ -20,7 +20,7 @@ from loguru import logger
 from api.dependencies import PixelleVideoDep
 from api.schemas.frame import FrameRenderRequest, FrameRenderResponse
 from pixelle_video.services.frame_html import HTMLFrameGenerator
-from pixelle_video.utils.template_util import parse_template_size, resolve_template_path
+from pixelle_video.utils.template_util import resolve_template_path
 
 router = APIRouter(prefix="/frame", tags=["Frame Rendering"])
 
@@ -59,11 +59,9 @@ async def render_frame(
         # Resolve template path (returns absolute path with "templates/" or "data/templates/" prefix)
         template_path = resolve_template_path(request.template)
         
-        # Parse template size
-        width, height = parse_template_size(template_path)
-        
-        # Create HTML frame generator
+        # Create HTML frame generator (compiled template and size come from the shared cache)
         generator = HTMLFrameGenerator(template_path)
+        width, height = generator.width, generator.height
         
         # Generate frame
         frame_path = await generator.generate_frame(
@@ -16,11 +16,16 @@ Task management endpoints
 Endpoints for managing async tasks (checking status, canceling, etc.)
 """
 
+import asyncio
+import time
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from api.config import api_config
 from api.tasks import task_manager, Task, TaskStatus
+from api.tasks.store import FINISHED_STATUSES
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -58,7 +63,8 @@ async def get_task(task_id: str):
     
     - **task_id**: Task ID
     
-    Returns task details including status, progress, and result (if completed).
+    Returns task details including status, queue position (if pending),
+    progress, and result (if completed).
     """
     try:
         task = task_manager.get_task(task_id)
@@ -75,12 +81,82 @@ async def get_task(task_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{task_id}/events")
+async def stream_task_events(task_id: str, request: Request):
+    """
+    Stream task progress (Server-Sent Events)
+    
+    Pushes the task (same shape as `GET /tasks/{task_id}`) whenever its status,
+    queue position or progress changes, instead of polling.
+    
+    - **task_id**: Task ID
+    
+    Events:
+    - `progress`: task changed (at most one every few hundred ms; intermediate
+      updates are coalesced, so slow clients always get the latest state)
+    - `done`: task finished (completed/failed/cancelled); the stream then ends
+    
+    Progress includes `event_type`, `frame_current`, `step`, `action` and
+    `elapsed` (seconds since start) for per-frame step timing.
+    """
+    if not task_manager.get_task(task_id):
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    
+    async def event_stream():
+        last_payload = None
+        last_sent = 0.0
+        last_activity = time.monotonic()
+        
+        while True:
+            task = task_manager.get_task(task_id)
+            if task is None:
+                yield f"event: error\ndata: Task {task_id} not found\n\n"
+                return
+            
+            finished = task.status in FINISHED_STATUSES
+            payload = task.model_dump_json()
+            
+            if payload != last_payload:
+                # Rate limit: wait out the interval, then send whatever is latest
+                wait = api_config.progress_stream_interval - (time.monotonic() - last_sent)
+                if wait > 0 and not finished:
+                    await asyncio.sleep(wait)
+                    continue
+                
+                yield f"event: {'done' if finished else 'progress'}\ndata: {payload}\n\n"
+                last_payload = payload
+                last_sent = last_activity = time.monotonic()
+                
+                if finished:
+                    return
+            
+            if await request.is_disconnected():
+                return
+            
+            # Live tasks wake us up immediately; tasks run by workers are re-read from the store
+            changed = await task_manager.wait_for_update(
+                task_id, timeout=api_config.progress_persist_interval
+            )
+            if not changed and time.monotonic() - last_activity >= api_config.progress_keepalive_interval:
+                yield ": keep-alive\n\n"
+                last_activity = time.monotonic()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        }
+    )
+
+
 @router.delete("/{task_id}")
 async def cancel_task(task_id: str):
     """
     Cancel task
     
-    Cancel a running or pending task.
+    Cancel a running or pending task (409 if the task already finished).
     
     - **task_id**: Task ID
     
@@ -90,6 +166,9 @@ async def cancel_task(task_id: str):
         success = task_manager.cancel_task(task_id)
         
         if not success:
+            task = task_manager.get_task(task_id)
+            if task:
+                raise HTTPException(status_code=409, detail=f"Task {task_id} already {task.status.value}")
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         
         return {
@@ -19,7 +19,7 @@ from loguru import logger
 
 from api.dependencies import PixelleVideoDep
 from api.schemas.tts import TTSSynthesizeRequest, TTSSynthesizeResponse
-from pixelle_video.utils.tts_util import get_audio_duration
+from pixelle_video.utils.tts_util import get_audio_duration_async
 
 router = APIRouter(prefix="/tts", tags=["Basic Services"])
 
@@ -80,8 +80,8 @@ async def tts_synthesize(
         # Call TTS service
         audio_path = await pixelle_video.tts(**tts_params)
         
-        # Get audio duration
-        duration = get_audio_duration(audio_path)
+        # Get audio duration (async probe: the sync bridge would block this handler)
+        duration = await get_audio_duration_async(audio_path)
         
         return TTSSynthesizeResponse(
             audio_path=audio_path,
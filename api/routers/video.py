@@ -20,27 +20,40 @@ import os
 from fastapi import APIRouter, HTTPException, Request
 from loguru import logger
 
-from api.dependencies import PixelleVideoDep
+from api.dependencies import PixelleVideoDep, get_pixelle_video
 from api.schemas.video import (
     VideoGenerateRequest,
     VideoGenerateResponse,
     VideoGenerateAsyncResponse,
 )
-from api.tasks import task_manager, TaskType
+from api.tasks import task_manager, Task, TaskType, QueueFullError
 
 router = APIRouter(prefix="/video", tags=["Video Generation"])
 
 
 def path_to_url(request: Request, file_path: str) -> str:
     """Convert file path to accessible URL"""
+    return build_file_url(str(request.base_url), file_path)
+
+
+def build_file_url(base_url: str, file_path: str) -> str:
+    """Convert file path to accessible URL under the given server base URL"""
     # file_path is like "output/abc123.mp4"
     # Remove "output/" prefix for cleaner URL
     if file_path.startswith("output/"):
         file_path = file_path[7:]  # Remove "output/"
-    base_url = str(request.base_url).rstrip('/')
+    base_url = base_url.rstrip('/')
     return f"{base_url}/api/files/{file_path}"
 
 
+def get_client_id(request: Request) -> str:
+    """Identify submitting client for queue fairness (X-Client-ID header, else remote address)"""
+    client_id = request.headers.get("X-Client-ID")
+    if client_id:
+        return client_id
+    return request.client.host if request.client else "anonymous"
+
+
 @router.post("/generate/sync", response_model=VideoGenerateResponse)
 async def generate_video_sync(
     request_body: VideoGenerateRequest,
@@ -119,9 +132,11 @@ async def generate_video_sync(
         return VideoGenerateResponse(
             video_url=video_url,
             duration=result.duration,
-            file_size=file_size
+            file_size=file_size,
+            poster_url=path_to_url(request, result.poster_path) if result.poster_path else None,
+            preview_url=path_to_url(request, result.preview_path) if result.preview_path else None
         )
-        
+    
     except Exception as e:
         logger.error(f"Sync video generation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -141,8 +156,8 @@ async def generate_video_async(
     
     **Workflow:**
     1. Submit video generation request
-    2. Receive task_id in response
-    3. Poll `/api/tasks/{task_id}` to check status
+    2. Receive task_id in response (HTTP 429 with Retry-After if the queue is full)
+    3. Poll `/api/tasks/{task_id}` to check status and queue position
     4. When status is "completed", retrieve video from result
     
     Request body includes all video generation parameters.
@@ -153,86 +168,106 @@ async def generate_video_async(
     try:
         logger.info(f"Async video generation: {request_body.text[:50]}...")
         
-        # Create task
+        # Create task (raises QueueFullError when the queue is full)
         task = task_manager.create_task(
             task_type=TaskType.VIDEO_GENERATION,
-            request_params=request_body.model_dump()
+            request_params=request_body.model_dump(),
+            priority=request_body.priority,
+            client_id=get_client_id(request),
+            context={"base_url": str(request.base_url)}
         )
         
-        # Define async execution function
-        async def execute_video_generation():
-            """Execute video generation in background"""
-            # Auto-determine media_width and media_height from template meta tags (required)
-            if not request_body.frame_template:
-                raise ValueError("frame_template is required to determine media size")
-            
-            from pixelle_video.services.frame_html import HTMLFrameGenerator
-            from pixelle_video.utils.template_util import resolve_template_path
-            template_path = resolve_template_path(request_body.frame_template)
-            generator = HTMLFrameGenerator(template_path)
-            media_width, media_height = generator.get_media_size()
-            logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
-            
-            # Build video generation parameters
-            video_params = {
-                "text": request_body.text,
-                "mode": request_body.mode,
-                "title": request_body.title,
-                "n_scenes": request_body.n_scenes,
-                "min_narration_words": request_body.min_narration_words,
-                "max_narration_words": request_body.max_narration_words,
-                "min_image_prompt_words": request_body.min_image_prompt_words,
-                "max_image_prompt_words": request_body.max_image_prompt_words,
-                "media_width": media_width,
-                "media_height": media_height,
-                "media_workflow": request_body.media_workflow,
-                "video_fps": request_body.video_fps,
-                "frame_template": request_body.frame_template,
-                "prompt_prefix": request_body.prompt_prefix,
-                "bgm_path": request_body.bgm_path,
-                "bgm_volume": request_body.bgm_volume,
-                # Progress callback can be added here if needed
-                # "progress_callback": lambda event: task_manager.update_progress(...)
-            }
-            
-            # Add TTS workflow if specified
-            if request_body.tts_workflow:
-                video_params["tts_workflow"] = request_body.tts_workflow
-            
-            # Add ref_audio if specified
-            if request_body.ref_audio:
-                video_params["ref_audio"] = request_body.ref_audio
-            
-            # Legacy voice_id support (deprecated)
-            if request_body.voice_id:
-                logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
-                video_params["voice_id"] = request_body.voice_id
-            
-            result = await pixelle_video.generate_video(**video_params)
-            
-            # Get file size
-            file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
-            
-            # Convert path to URL
-            video_url = path_to_url(request, result.video_path)
-            
-            return {
-                "video_url": video_url,
-                "duration": result.duration,
-                "file_size": file_size
-            }
-        
-        # Start execution
-        await task_manager.execute_task(
-            task_id=task.task_id,
-            coro_func=execute_video_generation
-        )
+        # Start execution (queued; resumed after a restart if interrupted)
+        await task_manager.submit_task(task)
         
         return VideoGenerateAsyncResponse(
             task_id=task.task_id
         )
-        
+    
+    except QueueFullError as e:
+        logger.warning(f"Async video generation rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
     except Exception as e:
         logger.error(f"Async video generation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+async def run_video_generation_task(task: Task) -> dict:
+    """
+    Execute async video generation task from its persisted request
+    
+    Registered with the task manager, so queued or interrupted tasks can be
+    (re)run after a restart without the original HTTP request.
+    """
+    request_body = VideoGenerateRequest(**task.request_params)
+    pixelle_video = await get_pixelle_video()
+    
+    # Auto-determine media_width and media_height from template meta tags (required)
+    if not request_body.frame_template:
+        raise ValueError("frame_template is required to determine media size")
+    
+    from pixelle_video.services.frame_html import HTMLFrameGenerator
+    from pixelle_video.utils.template_util import resolve_template_path
+    template_path = resolve_template_path(request_body.frame_template)
+    generator = HTMLFrameGenerator(template_path)
+    media_width, media_height = generator.get_media_size()
+    logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
+    
+    # Build video generation parameters
+    video_params = {
+        "text": request_body.text,
+        "mode": request_body.mode,
+        "title": request_body.title,
+        "n_scenes": request_body.n_scenes,
+        "min_narration_words": request_body.min_narration_words,
+        "max_narration_words": request_body.max_narration_words,
+        "min_image_prompt_words": request_body.min_image_prompt_words,
+        "max_image_prompt_words": request_body.max_image_prompt_words,
+        "media_width": media_width,
+        "media_height": media_height,
+        "media_workflow": request_body.media_workflow,
+        "video_fps": request_body.video_fps,
+        "frame_template": request_body.frame_template,
+        "prompt_prefix": request_body.prompt_prefix,
+        "bgm_path": request_body.bgm_path,
+        "bgm_volume": request_body.bgm_volume,
+        # Pipeline progress events -> task progress (streamed via /api/tasks/{task_id}/events)
+        "progress_callback": lambda event: task_manager.report_progress(task.task_id, event),
+    }
+    
+    # Add TTS workflow if specified
+    if request_body.tts_workflow:
+        video_params["tts_workflow"] = request_body.tts_workflow
+    
+    # Add ref_audio if specified
+    if request_body.ref_audio:
+        video_params["ref_audio"] = request_body.ref_audio
+    
+    # Legacy voice_id support (deprecated)
+    if request_body.voice_id:
+        logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
+        video_params["voice_id"] = request_body.voice_id
+    
+    result = await pixelle_video.generate_video(**video_params)
+    
+    # Get file size
+    file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
+    
+    # Convert path to URL
+    video_url = build_file_url(task.context["base_url"], result.video_path)
+    
+    # Poster / preview clip let clients list tasks without downloading the full video
+    return {
+        "video_url": video_url,
+        "duration": result.duration,
+        "file_size": file_size,
+        "poster_url": build_file_url(task.context["base_url"], result.poster_path) if result.poster_path else None,
+        "preview_url": build_file_url(task.context["base_url"], result.preview_path) if result.preview_path else None
+    }
+
+
+task_manager.register_handler(TaskType.VIDEO_GENERATION, run_video_generation_task)
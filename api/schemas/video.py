@@ -76,6 +76,9 @@ class VideoGenerateRequest(BaseModel):
     bgm_path: Optional[str] = Field(None, description="Background music path")
     bgm_volume: float = Field(0.3, ge=0.0, le=1.0, description="BGM volume (0.0-1.0)")
     
+    # === Scheduling (async only) ===
+    priority: int = Field(0, ge=-10, le=10, description="Queue priority for async generation (higher runs first)")
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -95,6 +98,8 @@ class VideoGenerateResponse(BaseModel):
     video_url: str = Field(..., description="URL to access generated video")
     duration: float = Field(..., description="Video duration in seconds")
     file_size: int = Field(..., description="File size in bytes")
+    poster_url: Optional[str] = Field(None, description="URL of the poster image (thumbnail)")
+    preview_url: Optional[str] = Field(None, description="URL of the short low-bitrate preview clip")
 
 
 class VideoGenerateAsyncResponse(BaseModel):
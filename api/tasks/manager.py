@@ -13,48 +13,176 @@
 """
 Task Manager
 
-In-memory task management for video generation jobs.
+Task management for video generation jobs, persisted through a pluggable
+TaskStore (SQLite by default) so queued and running work survives restarts.
+
+Scheduling:
+- At most `max_concurrent_tasks` tasks execute at once; the rest wait in a queue
+- Higher priority runs first; within a priority level clients are served
+  round-robin (one busy client cannot starve the others), FIFO per client
+- Admission is bounded (`max_queued_tasks`, `max_queued_tasks_per_client`);
+  beyond that submissions are rejected with QueueFullError (HTTP 429)
+
+Recovery:
+- Tasks left pending/running by a previous process are re-queued on start()
+  if a handler is registered for their type (see register_handler), and
+  marked failed otherwise
+
+Progress:
+- report_progress() takes pipeline ProgressEvents; the latest state is kept
+  in memory, persisted at most every `progress_persist_interval` seconds
+  (coalesced) and pushed to watchers (see wait_for_update, used by the SSE
+  endpoint)
+
+Worker mode (`task_execution = "worker"`):
+- Handler tasks are only persisted as pending; separate worker processes
+  (api/worker.py) claim them from the SQLite store, run them and write
+  progress/results back, so the API process never runs pipelines
 """
 
 import asyncio
+import heapq
+import itertools
+import time
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 from loguru import logger
 
 from api.tasks.models import Task, TaskStatus, TaskType, TaskProgress
+from api.tasks.store import FINISHED_STATUSES
+
+if TYPE_CHECKING:
+    from pixelle_video.models.progress import ProgressEvent
+from api.tasks.store import TaskStore, create_task_store
 from api.config import api_config
 
+# Re-runs a task from its persisted state (request_params / context)
+TaskHandler = Callable[[Task], Awaitable[Any]]
+
+# Client ID used when the submitter is unknown
+DEFAULT_CLIENT_ID = "anonymous"
+
+# Retry-After (seconds) suggested before any task duration has been observed
+DEFAULT_RETRY_AFTER = 30
+
+# Smoothing factor for the moving average of task durations
+_DURATION_EMA_ALPHA = 0.2
+
+
+class QueueFullError(Exception):
+    """Raised when a task cannot be admitted because the queue is full"""
+    
+    def __init__(self, message: str, retry_after: int = DEFAULT_RETRY_AFTER):
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class TaskManager:
     """
     Task manager for handling async video generation tasks
     
     Features:
-    - In-memory storage (can be replaced with Redis later)
+    - Durable storage via TaskStore (SQLite WAL by default)
     - Task lifecycle management
+    - Recovery of orphaned tasks on startup
+    - Bounded worker pool with priority queue and per-client fairness
+    - Backpressure when the queue is full
     - Progress tracking
     - Auto cleanup of old tasks
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[TaskStore] = None):
+        """
+        Initialize task manager
+        
+        Args:
+            store: Task store (default: created from api_config on first use)
+        """
+        self._store = store
+        
+        # Live (pending/running) tasks of this process; finished tasks live only in the store
         self._tasks: Dict[str, Task] = {}
         self._task_futures: Dict[str, asyncio.Task] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
+        
+        # Pending work: client_id -> heap of (-priority, seq, task_id)
+        self._pending: Dict[str, List[Tuple[int, int, str]]] = {}
+        # Round-robin order of clients with pending work
+        self._client_order: Deque[str] = deque()
+        # task_id -> (coro_func, args, kwargs) for tasks waiting in the queue
+        self._jobs: Dict[str, Tuple[Callable, tuple, dict]] = {}
+        self._seq = itertools.count()
+        self._active = 0
+        
+        # Moving average of task run time (for Retry-After estimates)
+        self._avg_duration: Optional[float] = None
+        
+        # Task type -> handler able to (re)run a task from its persisted state
+        self._handlers: Dict[TaskType, TaskHandler] = {}
+        
+        # Progress: last persist time and pending coalesced flush per task,
+        # and one-shot events waking up watchers on any task change
+        # (task_id -> (event, number of waiters); dropped when the last waiter leaves)
+        self._progress_saved_at: Dict[str, float] = {}
+        self._progress_flushes: Dict[str, asyncio.TimerHandle] = {}
+        self._watchers: Dict[str, Tuple[asyncio.Event, int]] = {}
+    
+    @property
+    def store(self) -> TaskStore:
+        """Task store (created from api_config on first use)"""
+        if self._store is None:
+            self._store = create_task_store(api_config.task_store, api_config.task_db_path)
+            logger.info(f"Task store: {api_config.task_store}")
+        return self._store
+    
+    def register_handler(self, task_type: TaskType, handler: TaskHandler):
+        """
+        Register handler that runs tasks of a type from their persisted state
+        
+        Registered types can be submitted with submit_task() and are resumed
+        after a restart.
+        
+        Args:
+            task_type: Task type
+            handler: Async function receiving the Task and returning its result
+        """
+        self._handlers[task_type] = handler
+    
+    @property
+    def uses_workers(self) -> bool:
+        """Whether handler tasks are executed by separate worker processes"""
+        return api_config.task_execution == "worker"
     
     async def start(self):
-        """Start task manager and cleanup scheduler"""
+        """Start task manager, recover orphaned tasks and start cleanup scheduler"""
         if self._running:
             logger.warning("Task manager already running")
             return
         
+        if self.uses_workers and not hasattr(self.store, "claim_next"):
+            raise ValueError("task_execution='worker' requires the sqlite task store")
+        
         self._running = True
+        if not self.uses_workers:
+            # In worker mode, workers re-queue tasks of dead workers themselves
+            self._recover_orphaned_tasks()
+            self._dispatch()
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-        logger.info("✅ Task manager started")
+        logger.info(
+            f"✅ Task manager started (max {api_config.max_concurrent_tasks} concurrent, "
+            f"{api_config.max_queued_tasks} queued)"
+        )
     
     async def stop(self):
-        """Stop task manager and cancel all tasks"""
+        """
+        Stop task manager and cancel all tasks
+        
+        Interrupted tasks keep their pending/running state in the store and
+        are recovered by the next start().
+        """
         self._running = False
         
         # Cancel cleanup task
@@ -65,20 +193,137 @@ class TaskManager:
             except asyncio.CancelledError:
                 pass
         
+        # Drop queued work and pending progress writes
+        for flush in self._progress_flushes.values():
+            flush.cancel()
+        self._progress_flushes.clear()
+        self._progress_saved_at.clear()
+        self._pending.clear()
+        self._client_order.clear()
+        self._jobs.clear()
+        
         # Cancel all running tasks
+        futures = [future for future in self._task_futures.values() if not future.done()]
         for task_id, future in self._task_futures.items():
             if not future.done():
                 future.cancel()
                 logger.info(f"Cancelled task: {task_id}")
+        await asyncio.gather(*futures, return_exceptions=True)
         
         self._tasks.clear()
         self._task_futures.clear()
+        self._active = 0
+        
+        if self._store is not None:
+            self._store.close()
+            self._store = None
         logger.info("✅ Task manager stopped")
     
+    def _save(self, task: Task):
+        """Persist task state (store errors are logged, never raised into the pipeline)"""
+        # A full save supersedes any pending coalesced progress flush
+        flush = self._progress_flushes.pop(task.task_id, None)
+        if flush:
+            flush.cancel()
+        
+        try:
+            self.store.save(task)
+        except Exception as e:
+            logger.error(f"Failed to persist task {task.task_id}: {e}")
+        
+        if task.status in FINISHED_STATUSES:
+            self._progress_saved_at.pop(task.task_id, None)
+        else:
+            self._progress_saved_at[task.task_id] = time.monotonic()
+        self._notify(task.task_id)
+    
+    def _notify(self, task_id: str):
+        """Wake up everyone waiting in wait_for_update() for this task"""
+        watcher = self._watchers.pop(task_id, None)
+        if watcher:
+            watcher[0].set()
+    
+    async def wait_for_update(self, task_id: str, timeout: float) -> bool:
+        """
+        Wait until a live task of this process changes (progress or status)
+        
+        Args:
+            task_id: Task ID
+            timeout: Max seconds to wait
+        
+        Returns:
+            True if the task changed, False on timeout (tasks run by other
+            processes never notify; callers re-read the store on timeout)
+        """
+        event, waiters = self._watchers.get(task_id) or (asyncio.Event(), 0)
+        self._watchers[task_id] = (event, waiters + 1)
+        
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            # On timeout or disconnect, the last waiter removes the event (tasks
+            # run by other processes never notify, so nothing else would)
+            watcher = self._watchers.get(task_id)
+            if watcher is not None and watcher[0] is event:
+                if watcher[1] <= 1:
+                    del self._watchers[task_id]
+                else:
+                    self._watchers[task_id] = (event, watcher[1] - 1)
+    
+    def _recover_orphaned_tasks(self):
+        """Re-queue or fail tasks left pending/running by a previous process"""
+        try:
+            orphans = [t for t in self.store.list_unfinished() if t.task_id not in self._tasks]
+        except Exception as e:
+            logger.error(f"Failed to load unfinished tasks: {e}")
+            return
+        
+        resumed = 0
+        for task in orphans:
+            handler = self._handlers.get(task.task_type)
+            if handler and api_config.resume_orphaned_tasks:
+                # Restart from scratch (the previous attempt's progress is gone)
+                task.status = TaskStatus.PENDING
+                task.started_at = None
+                task.progress = None
+                self._tasks[task.task_id] = task
+                self._save(task)
+                self._enqueue(task, handler, (task,), {})
+                resumed += 1
+            else:
+                task.status = TaskStatus.FAILED
+                task.error = "Interrupted by server restart"
+                task.completed_at = datetime.now()
+                self._save(task)
+        
+        if orphans:
+            logger.info(
+                f"♻️  Recovered {len(orphans)} orphaned tasks "
+                f"({resumed} re-queued, {len(orphans) - resumed} marked failed)"
+            )
+    
+    @property
+    def queued_count(self) -> int:
+        """Number of tasks waiting in the queue"""
+        if self.uses_workers:
+            return self.store.count_pending()
+        return sum(len(heap) for heap in self._pending.values())
+    
+    @property
+    def active_count(self) -> int:
+        """Number of tasks currently executing"""
+        return self._active
+    
     def create_task(
         self,
         task_type: TaskType,
-        request_params: Optional[dict] = None
+        request_params: Optional[dict] = None,
+        priority: int = 0,
+        client_id: Optional[str] = None,
+        context: Optional[dict] = None
     ) -> Task:
         """
         Create a new task
@@ -86,22 +331,108 @@ class TaskManager:
         Args:
             task_type: Type of task
             request_params: Original request parameters
-            
+            priority: Scheduling priority (higher runs first)
+            client_id: Submitting client, for per-client fairness and limits
+            context: Extra state needed to re-run the task after a restart
+        
         Returns:
             Created task
+        
+        Raises:
+            QueueFullError: If the queue (global or per-client) is full
         """
+        client_id = client_id or DEFAULT_CLIENT_ID
+        self._check_admission(client_id)
+        
         task_id = str(uuid.uuid4())
         task = Task(
             task_id=task_id,
             task_type=task_type,
             status=TaskStatus.PENDING,
             request_params=request_params,
+            priority=priority,
+            client_id=client_id,
+            context=context,
         )
         
         self._tasks[task_id] = task
-        logger.info(f"Created task {task_id} ({task_type})")
+        self._save(task)
+        logger.info(f"Created task {task_id} ({task_type}, client={client_id}, priority={priority})")
         return task
     
+    async def submit_task(self, task: Task):
+        """
+        Queue task for execution by its registered handler
+        
+        Unlike execute_task() with an ad-hoc coroutine, such tasks can be
+        resumed after a restart.
+        
+        Args:
+            task: Task created by create_task()
+        
+        Raises:
+            ValueError: If no handler is registered for the task type
+        """
+        handler = self._handlers.get(task.task_type)
+        if handler is None:
+            raise ValueError(f"No handler registered for task type: {task.task_type}")
+        
+        if self.uses_workers:
+            # Already persisted as pending: a worker process will claim it
+            self._tasks.pop(task.task_id, None)
+            logger.info(f"Task {task.task_id} queued for workers")
+            return
+        
+        await self.execute_task(task.task_id, handler, task)
+    
+    def start_claimed_task(self, task: Task) -> asyncio.Task:
+        """
+        Run a task claimed from the store by this (worker) process
+        
+        Args:
+            task: Claimed task (status RUNNING)
+        
+        Returns:
+            asyncio.Task running the handler (cancel it to cancel the task)
+        """
+        handler = self._handlers.get(task.task_type)
+        if handler is None:
+            raise ValueError(f"No handler registered for task type: {task.task_type}")
+        
+        self._tasks[task.task_id] = task
+        self._active += 1
+        future = asyncio.create_task(self._run_task(task, handler, (task,), {}))
+        self._task_futures[task.task_id] = future
+        return future
+    
+    def _check_admission(self, client_id: str):
+        """Reject new tasks when the global or per-client queue is full"""
+        queued = self.queued_count
+        if queued >= api_config.max_queued_tasks:
+            raise QueueFullError(
+                f"Task queue is full ({queued} tasks waiting)",
+                retry_after=self._estimate_retry_after()
+            )
+        
+        if self.uses_workers:
+            client_queued = self.store.count_pending(client_id)
+        else:
+            client_queued = len(self._pending.get(client_id, ()))
+        if client_queued >= api_config.max_queued_tasks_per_client:
+            raise QueueFullError(
+                f"Too many queued tasks for client {client_id} ({client_queued} waiting)",
+                retry_after=self._estimate_retry_after()
+            )
+    
+    def _estimate_retry_after(self) -> int:
+        """Estimate seconds until a queue slot frees up"""
+        if self._avg_duration is None:
+            return DEFAULT_RETRY_AFTER
+        
+        # One slot frees roughly every avg_duration / max_concurrent seconds
+        workers = max(1, api_config.max_concurrent_tasks)
+        return max(1, int(self._avg_duration / workers) + 1)
+    
     async def execute_task(
         self,
         task_id: str,
@@ -110,7 +441,10 @@ class TaskManager:
         **kwargs
     ):
         """
-        Execute task asynchronously
+        Queue task for execution
+        
+        The task starts as soon as a worker slot is free, in priority /
+        client round-robin order. It stays PENDING until then.
         
         Args:
             task_id: Task ID
@@ -123,35 +457,172 @@ class TaskManager:
             logger.error(f"Task {task_id} not found")
             return
         
-        # Create async task
-        async def _execute():
-            try:
-                task.status = TaskStatus.RUNNING
-                task.started_at = datetime.now()
-                logger.info(f"Task {task_id} started")
-                
-                # Execute the actual work
-                result = await coro_func(*args, **kwargs)
-                
-                # Update task with result
-                task.status = TaskStatus.COMPLETED
-                task.result = result
-                task.completed_at = datetime.now()
-                logger.info(f"Task {task_id} completed")
-                
-            except Exception as e:
-                task.status = TaskStatus.FAILED
-                task.error = str(e)
-                task.completed_at = datetime.now()
-                logger.error(f"Task {task_id} failed: {e}")
+        self._enqueue(task, coro_func, args, kwargs)
+        self._dispatch()
+        
+        if task.status == TaskStatus.PENDING:
+            logger.info(f"Task {task_id} queued (position {self.get_queue_position(task_id)})")
+    
+    def _enqueue(self, task: Task, coro_func: Callable, args: tuple, kwargs: dict):
+        """Add task to its client's queue"""
+        client_id = task.client_id or DEFAULT_CLIENT_ID
+        self._jobs[task.task_id] = (coro_func, args, kwargs)
+        
+        heap = self._pending.get(client_id)
+        if heap is None:
+            heap = self._pending[client_id] = []
+            self._client_order.append(client_id)
+        heapq.heappush(heap, (-task.priority, next(self._seq), task.task_id))
+    
+    def _select_next(
+        self,
+        pending: Dict[str, List[Tuple[int, int, str]]],
+        client_order: Deque[str]
+    ) -> Optional[str]:
+        """
+        Pop the next task to run from the given queue state
+        
+        Highest priority wins; among clients whose next task has that priority,
+        the one earliest in round-robin order is served and moved to the back.
+        """
+        best_client = None
+        best_priority = None
+        for client_id in client_order:
+            neg_priority = pending[client_id][0][0]
+            if best_priority is None or neg_priority < best_priority:
+                best_client, best_priority = client_id, neg_priority
+        
+        if best_client is None:
+            return None
         
-        # Start execution
-        future = asyncio.create_task(_execute())
-        self._task_futures[task_id] = future
+        heap = pending[best_client]
+        _, _, task_id = heapq.heappop(heap)
+        
+        client_order.remove(best_client)
+        if heap:
+            client_order.append(best_client)
+        else:
+            del pending[best_client]
+        
+        return task_id
+    
+    def _dispatch(self):
+        """Start queued tasks while worker slots are free"""
+        while self._active < api_config.max_concurrent_tasks:
+            task_id = self._select_next(self._pending, self._client_order)
+            if task_id is None:
+                return
+            
+            job = self._jobs.pop(task_id, None)
+            task = self._tasks.get(task_id)
+            if job is None or task is None or task.status != TaskStatus.PENDING:
+                continue
+            
+            coro_func, args, kwargs = job
+            self._active += 1
+            task.queue_position = None
+            self._task_futures[task_id] = asyncio.create_task(
+                self._run_task(task, coro_func, args, kwargs)
+            )
+    
+    async def _run_task(self, task: Task, coro_func: Callable, args: tuple, kwargs: dict):
+        """Execute a dequeued task and release its worker slot"""
+        task_id = task.task_id
+        try:
+            task.status = TaskStatus.RUNNING
+            task.started_at = datetime.now()
+            self._save(task)
+            logger.info(f"Task {task_id} started")
+            
+            # Execute the actual work
+            result = await coro_func(*args, **kwargs)
+            
+            # Update task with result
+            task.status = TaskStatus.COMPLETED
+            task.result = result
+            task.completed_at = datetime.now()
+            logger.info(f"Task {task_id} completed")
+        
+        except asyncio.CancelledError:
+            if self._running:
+                task.status = TaskStatus.CANCELLED
+                task.completed_at = task.completed_at or datetime.now()
+            # else: shutting down, leave the task running in the store for recovery
+            raise
+        
+        except Exception as e:
+            task.status = TaskStatus.FAILED
+            task.error = str(e)
+            task.completed_at = datetime.now()
+            logger.error(f"Task {task_id} failed: {e}")
+        
+        finally:
+            self._active -= 1
+            if self._running:
+                self._save(task)
+                self._tasks.pop(task_id, None)
+                self._task_futures.pop(task_id, None)
+                self._record_duration(task)
+                self._dispatch()
+    
+    def _record_duration(self, task: Task):
+        """Update moving average of task run time"""
+        if not task.started_at or not task.completed_at:
+            return
+        
+        duration = (task.completed_at - task.started_at).total_seconds()
+        if self._avg_duration is None:
+            self._avg_duration = duration
+        else:
+            self._avg_duration += _DURATION_EMA_ALPHA * (duration - self._avg_duration)
+    
+    def _queue_order(self) -> List[str]:
+        """Pending task IDs in the order they will start (assuming no new arrivals)"""
+        pending = {client_id: list(heap) for client_id, heap in self._pending.items()}
+        client_order = deque(self._client_order)
+        
+        order = []
+        while True:
+            task_id = self._select_next(pending, client_order)
+            if task_id is None:
+                return order
+            order.append(task_id)
+    
+    def get_queue_position(self, task_id: str) -> Optional[int]:
+        """
+        Get 1-based queue position of a pending task
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            Position (1 = next to start), or None if the task is not queued
+        """
+        if task_id not in self._jobs:
+            return None
+        
+        order = self._queue_order()
+        return order.index(task_id) + 1 if task_id in order else None
+    
+    def _refresh_queue_positions(self):
+        """Update queue_position of all pending tasks"""
+        for position, task_id in enumerate(self._queue_order(), start=1):
+            task = self._tasks.get(task_id)
+            if task:
+                task.queue_position = position
     
     def get_task(self, task_id: str) -> Optional[Task]:
-        """Get task by ID"""
-        return self._tasks.get(task_id)
+        """Get task by ID (queue position is refreshed for pending tasks)"""
+        task = self._tasks.get(task_id)
+        if task is None:
+            task = self.store.get(task_id)
+            if task and task.status == TaskStatus.PENDING and self.uses_workers:
+                task.queue_position = self.store.pending_position(task)
+            return task
+        
+        if task.status == TaskStatus.PENDING:
+            task.queue_position = self.get_queue_position(task_id)
+        return task
     
     def list_tasks(
         self,
@@ -164,19 +635,22 @@ class TaskManager:
         Args:
             status: Filter by status
             limit: Maximum number of tasks to return
-            
+        
         Returns:
             List of tasks
         """
-        tasks = list(self._tasks.values())
+        self._refresh_queue_positions()
         
-        if status:
-            tasks = [t for t in tasks if t.status == status]
+        # Indexed query (newest first); live tasks are served from memory
+        tasks = self.store.list(status=status, limit=limit)
+        tasks = [self._tasks.get(t.task_id, t) for t in tasks]
         
-        # Sort by created_at descending
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
+        if self.uses_workers:
+            for task in tasks:
+                if task.status == TaskStatus.PENDING and task.task_id not in self._tasks:
+                    task.queue_position = self.store.pending_position(task)
         
-        return tasks[:limit]
+        return tasks
     
     def update_progress(
         self,
@@ -199,27 +673,100 @@ class TaskManager:
             return
         
         percentage = (current / total * 100) if total > 0 else 0
-        task.progress = TaskProgress(
+        self._set_progress(task, TaskProgress(
             current=current,
             total=total,
             percentage=percentage,
             message=message
-        )
+        ))
+    
+    def report_progress(self, task_id: str, event: "ProgressEvent"):
+        """
+        Update task progress from a pipeline ProgressEvent
+        
+        Cheap enough to be used directly as a pipeline progress_callback.
+        
+        Args:
+            task_id: Task ID
+            event: Pipeline progress event
+        """
+        task = self._tasks.get(task_id)
+        if not task:
+            return
+        
+        elapsed = (datetime.now() - task.started_at).total_seconds() if task.started_at else None
+        self._set_progress(task, TaskProgress(
+            current=event.frame_current or 0,
+            total=event.frame_total or 0,
+            percentage=round(event.progress * 100, 1),
+            message=event.extra_info or event.event_type,
+            event_type=event.event_type,
+            frame_current=event.frame_current,
+            frame_total=event.frame_total,
+            step=event.step,
+            action=event.action,
+            elapsed=round(elapsed, 3) if elapsed is not None else None,
+        ))
+    
+    def _set_progress(self, task: Task, progress: TaskProgress):
+        """Set progress, notify watchers and persist at most every progress_persist_interval"""
+        task.progress = progress
+        self._notify(task.task_id)
+        
+        last_saved = self._progress_saved_at.get(task.task_id, 0.0)
+        wait = api_config.progress_persist_interval - (time.monotonic() - last_saved)
+        if wait <= 0:
+            self._save(task)
+            return
+        
+        # Coalesce: one delayed write persists whatever is latest by then
+        if task.task_id not in self._progress_flushes:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._save(task)
+                return
+            self._progress_flushes[task.task_id] = loop.call_later(
+                wait, self._flush_progress, task.task_id
+            )
+    
+    def _flush_progress(self, task_id: str):
+        """Persist coalesced progress of a still-running task"""
+        self._progress_flushes.pop(task_id, None)
+        task = self._tasks.get(task_id)
+        if task and task.status not in FINISHED_STATUSES:
+            self._save(task)
     
     def cancel_task(self, task_id: str) -> bool:
         """
-        Cancel a running task
+        Cancel a running or queued task
         
         Args:
             task_id: Task ID
-            
+        
         Returns:
-            True if cancelled, False otherwise
+            True if cancelled, False otherwise (unknown or already finished task)
         """
         task = self._tasks.get(task_id)
         if not task:
+            # Not live in this process: just record the cancellation
+            task = self.store.get(task_id)
+            if not task or task.status in FINISHED_STATUSES:
+                return False
+            task.status = TaskStatus.CANCELLED
+            task.completed_at = datetime.now()
+            self._save(task)
+            logger.info(f"Cancelled task {task_id}")
+            return True
+        
+        # Finished tasks keep their status (and history)
+        if task.status in FINISHED_STATUSES:
             return False
         
+        # Remove from queue if not started yet
+        if self._jobs.pop(task_id, None) is not None:
+            self._remove_pending(task)
+        
         # Cancel future if running
         future = self._task_futures.get(task_id)
         if future and not future.done():
@@ -228,9 +775,27 @@ class TaskManager:
         # Update task status
         task.status = TaskStatus.CANCELLED
         task.completed_at = datetime.now()
+        task.queue_position = None
+        self._save(task)
+        if not future:
+            # Never started; running tasks are dropped when their future finishes
+            self._tasks.pop(task_id, None)
         logger.info(f"Cancelled task {task_id}")
         return True
     
+    def _remove_pending(self, task: Task):
+        """Remove a queued task from its client's heap"""
+        client_id = task.client_id or DEFAULT_CLIENT_ID
+        heap = self._pending.get(client_id)
+        if not heap:
+            return
+        
+        heap[:] = [entry for entry in heap if entry[2] != task.task_id]
+        heapq.heapify(heap)
+        if not heap:
+            del self._pending[client_id]
+            self._client_order.remove(client_id)
+    
     async def _cleanup_loop(self):
         """Periodically clean up old completed tasks"""
         while self._running:
@@ -243,24 +808,14 @@ class TaskManager:
                 logger.error(f"Error in cleanup loop: {e}")
     
     def _cleanup_old_tasks(self):
-        """Remove old completed/failed tasks"""
+        """Remove old completed/failed tasks (single indexed delete)"""
         cutoff_time = datetime.now() - timedelta(seconds=api_config.task_retention_time)
         
-        tasks_to_remove = []
-        for task_id, task in self._tasks.items():
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                if task.completed_at and task.completed_at < cutoff_time:
-                    tasks_to_remove.append(task_id)
+        removed = self.store.delete_finished_before(cutoff_time)
         
-        for task_id in tasks_to_remove:
-            del self._tasks[task_id]
-            if task_id in self._task_futures:
-                del self._task_futures[task_id]
-        
-        if tasks_to_remove:
-            logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
+        if removed:
+            logger.info(f"Cleaned up {removed} old tasks")
 
 
 # Global task manager instance
 task_manager = TaskManager()
-
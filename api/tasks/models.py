@@ -40,6 +40,14 @@ class TaskProgress(BaseModel):
     total: int = 0
     percentage: float = 0.0
     message: str = ""
+    
+    # Pipeline progress event details (see pixelle_video.models.progress.ProgressEvent)
+    event_type: Optional[str] = None
+    frame_current: Optional[int] = None
+    frame_total: Optional[int] = None
+    step: Optional[int] = None
+    action: Optional[str] = None
+    elapsed: Optional[float] = None  # Seconds since the task started (for step timing)
 
 
 class Task(BaseModel):
@@ -60,9 +68,17 @@ class Task(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
+    # Scheduling
+    priority: int = 0  # Higher runs first
+    client_id: Optional[str] = None  # Submitting client (queue fairness)
+    queue_position: Optional[int] = None  # 1-based position while pending (1 = next to start)
+    
     # Request parameters (for reference)
     request_params: Optional[dict] = None
     
+    # Execution context needed to re-run the task after a restart (e.g. base URL for result links)
+    context: Optional[dict] = None
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
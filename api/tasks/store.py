@@ -0,0 +1,402 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Task Stores
+
+Persistence backends for TaskManager:
+- SQLiteTaskStore (default): durable, WAL mode, indexed status/created_at queries;
+  doubles as the job queue for worker processes (see api/worker.py)
+- MemoryTaskStore: process-local dict (tasks are lost on restart)
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from loguru import logger
+
+from api.tasks.models import Task, TaskStatus
+
+# Statuses of tasks that are done and will never change again
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+
+class TaskStore(ABC):
+    """
+    Task persistence backend
+    
+    Stores are synchronous; every call is a short indexed operation.
+    """
+    
+    @abstractmethod
+    def save(self, task: Task):
+        """Insert or update a task"""
+        pass
+    
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[Task]:
+        """Get task by ID"""
+        pass
+    
+    @abstractmethod
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        """List tasks (newest first), optionally filtered by status"""
+        pass
+    
+    @abstractmethod
+    def list_unfinished(self) -> List[Task]:
+        """List pending/running tasks (oldest first)"""
+        pass
+    
+    @abstractmethod
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        """
+        Delete finished tasks completed before cutoff
+        
+        Returns:
+            Number of deleted tasks
+        """
+        pass
+    
+    @abstractmethod
+    def count_pending(self, client_id: Optional[str] = None) -> int:
+        """Count pending tasks, optionally of one client"""
+        pass
+    
+    @abstractmethod
+    def pending_position(self, task: Task) -> Optional[int]:
+        """1-based position of a pending task in claim order (priority, then age)"""
+        pass
+    
+    def close(self):
+        """Release resources"""
+        pass
+
+
+class MemoryTaskStore(TaskStore):
+    """In-memory task store (no durability)"""
+    
+    def __init__(self):
+        self._tasks = {}
+    
+    def save(self, task: Task):
+        self._tasks[task.task_id] = task
+    
+    def get(self, task_id: str) -> Optional[Task]:
+        return self._tasks.get(task_id)
+    
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        tasks = [t for t in self._tasks.values() if status is None or t.status == status]
+        tasks.sort(key=lambda t: t.created_at, reverse=True)
+        return tasks[:limit]
+    
+    def list_unfinished(self) -> List[Task]:
+        tasks = [t for t in self._tasks.values() if t.status not in FINISHED_STATUSES]
+        tasks.sort(key=lambda t: t.created_at)
+        return tasks
+    
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        expired = [
+            task_id for task_id, t in self._tasks.items()
+            if t.status in FINISHED_STATUSES and t.completed_at and t.completed_at < cutoff
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+        return len(expired)
+    
+    def count_pending(self, client_id: Optional[str] = None) -> int:
+        return sum(
+            1 for t in self._tasks.values()
+            if t.status == TaskStatus.PENDING and (client_id is None or t.client_id == client_id)
+        )
+    
+    def pending_position(self, task: Task) -> Optional[int]:
+        if task.status != TaskStatus.PENDING:
+            return None
+        ahead = sum(
+            1 for t in self._tasks.values()
+            if t.status == TaskStatus.PENDING and (
+                t.priority > task.priority
+                or (t.priority == task.priority and t.created_at < task.created_at)
+            )
+        )
+        return ahead + 1
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    SQLite task store
+    
+    Indexed columns are kept alongside the full task JSON, so list/cleanup
+    queries never deserialize tasks they don't return. WAL mode lets other
+    processes (e.g. workers) read while the API writes.
+    
+    Worker processes claim pending tasks atomically (claim_next), keep them
+    alive with heartbeats and re-queue tasks of workers that died
+    (requeue_stale).
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id TEXT PRIMARY KEY,
+            task_type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            priority INTEGER NOT NULL DEFAULT 0,
+            client_id TEXT,
+            created_at REAL NOT NULL,
+            completed_at REAL,
+            worker_id TEXT,
+            heartbeat_at REAL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_created ON tasks (status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed_at);
+        CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks (status, priority DESC, created_at);
+    """
+    
+    # Columns added after the first schema version (name -> definition)
+    _MIGRATIONS = {
+        "worker_id": "TEXT",
+        "heartbeat_at": "REAL",
+    }
+    
+    def __init__(self, db_path: str):
+        """
+        Initialize SQLite task store
+        
+        Args:
+            db_path: Database file path (created if missing)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._migrate()
+        self._conn.executescript(self._SCHEMA)
+        logger.debug(f"SQLite task store opened: {db_path}")
+    
+    def _migrate(self):
+        """Add columns missing from databases created by older versions"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if not columns:
+            return
+        for name, definition in self._MIGRATIONS.items():
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE tasks ADD COLUMN {name} {definition}")
+    
+    @staticmethod
+    def _timestamp(value: Optional[datetime]) -> Optional[float]:
+        return value.timestamp() if value else None
+    
+    @staticmethod
+    def _to_tasks(rows: Iterable[tuple]) -> List[Task]:
+        return [Task.model_validate_json(row[0]) for row in rows]
+    
+    def save(self, task: Task):
+        # Upsert keeps worker_id/heartbeat_at, and never resurrects a task that
+        # was cancelled from another process while its runner reports progress
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO tasks "
+                "(task_id, task_type, status, priority, client_id, created_at, completed_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(task_id) DO UPDATE SET "
+                "status = excluded.status, priority = excluded.priority, "
+                "client_id = excluded.client_id, completed_at = excluded.completed_at, "
+                "data = excluded.data "
+                "WHERE NOT (tasks.status = ? AND excluded.status IN (?, ?))",
+                (
+                    task.task_id,
+                    task.task_type.value,
+                    task.status.value,
+                    task.priority,
+                    task.client_id,
+                    self._timestamp(task.created_at),
+                    self._timestamp(task.completed_at),
+                    task.model_dump_json(),
+                    TaskStatus.CANCELLED.value,
+                    TaskStatus.PENDING.value,
+                    TaskStatus.RUNNING.value,
+                )
+            )
+    
+    def get(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return Task.model_validate_json(row[0]) if row else None
+    
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        with self._lock:
+            if status:
+                rows = self._conn.execute(
+                    "SELECT data FROM tasks WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+                    (status.value, limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT data FROM tasks ORDER BY created_at DESC LIMIT ?",
+                    (limit,)
+                ).fetchall()
+        return self._to_tasks(rows)
+    
+    def list_unfinished(self) -> List[Task]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM tasks WHERE status IN (?, ?) ORDER BY created_at",
+                (TaskStatus.PENDING.value, TaskStatus.RUNNING.value)
+            ).fetchall()
+        return self._to_tasks(rows)
+    
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM tasks WHERE completed_at < ? AND status IN "
+                f"({', '.join('?' for _ in FINISHED_STATUSES)})",
+                (cutoff.timestamp(), *(s.value for s in FINISHED_STATUSES))
+            )
+        return cursor.rowcount
+    
+    def count_pending(self, client_id: Optional[str] = None) -> int:
+        with self._lock:
+            if client_id is None:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM tasks WHERE status = ?",
+                    (TaskStatus.PENDING.value,)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM tasks WHERE status = ? AND client_id = ?",
+                    (TaskStatus.PENDING.value, client_id)
+                ).fetchone()
+        return row[0]
+    
+    def pending_position(self, task: Task) -> Optional[int]:
+        if task.status != TaskStatus.PENDING:
+            return None
+        created_at = self._timestamp(task.created_at)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status = ? "
+                "AND (priority > ? OR (priority = ? AND created_at < ?))",
+                (TaskStatus.PENDING.value, task.priority, task.priority, created_at)
+            ).fetchone()
+        return row[0] + 1
+    
+    def claim_next(self, worker_id: str) -> Optional[Task]:
+        """
+        Atomically claim the next pending task (highest priority, then oldest)
+        
+        Args:
+            worker_id: Claiming worker
+        
+        Returns:
+            Claimed task (status RUNNING), or None if the queue is empty
+        """
+        with self._lock:
+            # IMMEDIATE takes the write lock up front: two workers never claim the same row
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT data FROM tasks WHERE status = ? "
+                    "ORDER BY priority DESC, created_at LIMIT 1",
+                    (TaskStatus.PENDING.value,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                
+                task = Task.model_validate_json(row[0])
+                task.status = TaskStatus.RUNNING
+                task.started_at = datetime.now()
+                self._conn.execute(
+                    "UPDATE tasks SET status = ?, worker_id = ?, heartbeat_at = ?, data = ? "
+                    "WHERE task_id = ?",
+                    (task.status.value, worker_id, time.time(), task.model_dump_json(), task.task_id)
+                )
+                self._conn.execute("COMMIT")
+                return task
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def heartbeat(self, task_id: str, worker_id: str) -> Optional[TaskStatus]:
+        """
+        Record that a worker is still running a task
+        
+        Returns:
+            Current task status (e.g. CANCELLED if cancelled via the API)
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE tasks SET heartbeat_at = ? WHERE task_id = ? AND worker_id = ?",
+                (time.time(), task_id, worker_id)
+            )
+            row = self._conn.execute("SELECT status FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return TaskStatus(row[0]) if row else None
+    
+    def requeue_stale(self, timeout: float, worker_id: Optional[str] = None) -> int:
+        """
+        Put running tasks of dead workers back into the queue
+        
+        Args:
+            timeout: Seconds without heartbeat after which a worker is considered dead
+            worker_id: Re-queue all running tasks of this worker regardless of heartbeat
+                (used on graceful worker shutdown)
+        
+        Returns:
+            Number of re-queued tasks
+        """
+        if worker_id is not None:
+            condition, params = "worker_id = ?", (worker_id,)
+        else:
+            condition, params = "heartbeat_at < ?", (time.time() - timeout,)
+        
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = ?, worker_id = NULL, heartbeat_at = NULL, "
+                "data = json_set(data, '$.status', ?, '$.started_at', NULL, '$.progress', NULL) "
+                f"WHERE status = ? AND heartbeat_at IS NOT NULL AND {condition}",
+                (TaskStatus.PENDING.value, TaskStatus.PENDING.value, TaskStatus.RUNNING.value, *params)
+            )
+        return cursor.rowcount
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_task_store(backend: str, db_path: Optional[str] = None) -> TaskStore:
+    """
+    Create task store by backend name
+    
+    Args:
+        backend: "sqlite" or "memory"
+        db_path: SQLite database path (default: data/tasks.db)
+    
+    Returns:
+        TaskStore instance
+    """
+    if backend == "memory":
+        return MemoryTaskStore()
+    if backend == "sqlite":
+        if not db_path:
+            from pixelle_video.utils.os_util import get_data_path
+            db_path = get_data_path("tasks.db")
+        return SQLiteTaskStore(db_path)
+    raise ValueError(f"Unknown task store backend: '{backend}'. Available: sqlite, memory")
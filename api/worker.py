@@ -0,0 +1,184 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pixelle-Video Task Worker
+
+Runs queued async tasks (video generation) outside the API process. Workers
+claim pending tasks from the shared SQLite task store, run them with
+PixelleVideoCore and write progress and results back; the API serves them
+from the same store. Start the API in worker mode and any number of workers:
+    uv run python api/app.py --task-execution worker
+    uv run python api/worker.py --concurrency 1
+
+Workers keep claimed tasks alive with heartbeats. Tasks of a worker that
+stops sending them (crash, kill -9) are re-queued by the other workers; on
+graceful shutdown (Ctrl+C / SIGTERM) a worker re-queues its tasks itself.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to sys.path for module imports
+_script_dir = Path(__file__).resolve().parent
+_project_root = _script_dir.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import time
+import uuid
+from typing import Dict, Optional
+
+from loguru import logger
+
+from api.config import api_config
+from api.tasks import task_manager, TaskStatus
+from api.tasks.store import create_task_store
+from api.dependencies import shutdown_pixelle_video
+
+# Registers task handlers (video generation) with the task manager
+import api.routers  # noqa: F401
+
+
+class TaskWorker:
+    """
+    Worker process main loop
+    
+    Usage:
+        >>> worker = TaskWorker(concurrency=2)
+        >>> await worker.run()  # until worker.stop()
+    """
+    
+    def __init__(self, concurrency: int = 1, worker_id: Optional[str] = None):
+        """
+        Initialize worker
+        
+        Args:
+            concurrency: Max tasks this worker runs at once
+            worker_id: Unique worker ID (default: hostname-pid-random)
+        """
+        self.concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._running_tasks: Dict[str, asyncio.Task] = {}
+        self._stop_event: Optional[asyncio.Event] = None
+    
+    def stop(self):
+        """Request graceful shutdown (running tasks are re-queued)"""
+        if self._stop_event:
+            self._stop_event.set()
+    
+    async def run(self):
+        """Claim and run tasks until stopped"""
+        self._stop_event = asyncio.Event()
+        store = task_manager.store
+        await task_manager.start()
+        
+        logger.info(f"👷 Worker {self.worker_id} started (concurrency={self.concurrency})")
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        last_sweep = 0.0
+        
+        try:
+            while not self._stop_event.is_set():
+                # Re-queue tasks of workers that died (any worker may do this)
+                if time.monotonic() - last_sweep >= api_config.worker_heartbeat_interval:
+                    last_sweep = time.monotonic()
+                    requeued = store.requeue_stale(api_config.worker_stale_timeout)
+                    if requeued:
+                        logger.warning(f"♻️  Re-queued {requeued} tasks of unresponsive workers")
+                
+                if len(self._running_tasks) < self.concurrency:
+                    task = store.claim_next(self.worker_id)
+                    if task is not None:
+                        logger.info(f"Worker {self.worker_id} claimed task {task.task_id}")
+                        future = task_manager.start_claimed_task(task)
+                        self._running_tasks[task.task_id] = future
+                        future.add_done_callback(
+                            lambda _, task_id=task.task_id: self._running_tasks.pop(task_id, None)
+                        )
+                        continue
+                
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=api_config.worker_poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            heartbeat_task.cancel()
+            
+            # Hand unfinished tasks back to the queue before the store is closed
+            interrupted = len(self._running_tasks)
+            await task_manager.stop()
+            if interrupted:
+                requeue_store = create_task_store("sqlite", api_config.task_db_path)
+                try:
+                    requeued = requeue_store.requeue_stale(0, worker_id=self.worker_id)
+                    logger.info(f"Re-queued {requeued} interrupted tasks")
+                finally:
+                    requeue_store.close()
+            
+            await shutdown_pixelle_video()
+            logger.info(f"✅ Worker {self.worker_id} stopped")
+    
+    async def _heartbeat_loop(self):
+        """Keep claimed tasks alive and pick up cancellations made via the API"""
+        store = task_manager.store
+        while True:
+            await asyncio.sleep(api_config.worker_heartbeat_interval)
+            for task_id, future in list(self._running_tasks.items()):
+                try:
+                    status = store.heartbeat(task_id, self.worker_id)
+                except Exception as e:
+                    logger.error(f"Heartbeat failed for task {task_id}: {e}")
+                    continue
+                
+                if status == TaskStatus.CANCELLED and not future.done():
+                    logger.info(f"Task {task_id} cancelled via API, stopping it")
+                    task_manager.cancel_task(task_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start Pixelle-Video task worker")
+    parser.add_argument("--concurrency", type=int, default=1, help="Max tasks run at once by this worker")
+    parser.add_argument("--db", default=None, help="SQLite task database (default: data/tasks.db)")
+    parser.add_argument("--worker-id", default=None, help="Unique worker ID (default: host-pid-random)")
+    
+    args = parser.parse_args()
+    
+    api_config.task_execution = "worker"
+    api_config.task_store = "sqlite"
+    if args.db:
+        api_config.task_db_path = args.db
+    
+    worker = TaskWorker(concurrency=args.concurrency, worker_id=args.worker_id)
+    
+    async def _run():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, worker.stop)
+            except NotImplementedError:
+                # Windows: Ctrl+C raises KeyboardInterrupt instead
+                pass
+        await worker.run()
+    
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pixelle-Video Command Line
+
+Batch generation without the web UI (e.g. nightly jobs):
+    pixelle-video batch topics.txt --n-scenes 5 --concurrency 3
+    pixelle-video batch --resume 20251028_143052_ab3d
+    pixelle-video batches
+
+The topics file holds one topic per line (blank lines and lines starting
+with "#" are ignored). Batch state is saved to data/batches/, so an
+interrupted or partly failed batch continues where it stopped with --resume.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+
+def _read_topics(path: str) -> List[str]:
+    """Read topics file (one topic per line)"""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+def _parse_params(pairs: List[str]) -> Dict[str, Any]:
+    """Parse KEY=VALUE pairs (values are JSON if possible, else strings)"""
+    params = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid --param '{pair}' (expected KEY=VALUE)")
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+def _build_items(args) -> List[Dict[str, Any]]:
+    """Build generate_video parameters for each topic"""
+    topics = _read_topics(args.topics)
+    if not topics:
+        raise ValueError(f"No topics found in {args.topics}")
+    
+    shared = {"pipeline": args.pipeline, "mode": "generate"}
+    if args.n_scenes:
+        shared["n_scenes"] = args.n_scenes
+    shared.update(_parse_params(args.param))
+    
+    items = []
+    for topic in topics:
+        title = f"{args.title_prefix} - {topic}" if args.title_prefix else topic
+        items.append({"text": topic, "title": title, **shared})
+    return items
+
+
+async def _run_batch(args, items: Optional[List[Dict[str, Any]]]) -> int:
+    """Create (from items) or resume a batch and run it, return exit code"""
+    from pixelle_video.service import PixelleVideoCore
+    from pixelle_video.services.batch_engine import BatchEngine
+    
+    async with PixelleVideoCore() as core:
+        engine = BatchEngine(
+            core,
+            concurrency=args.concurrency,
+            max_retries=args.retries,
+            retry_delay=args.retry_delay,
+        )
+        
+        if args.resume:
+            batch = engine.load_batch(args.resume)
+            if batch is None:
+                logger.error(f"Batch not found: {args.resume}")
+                return 2
+        else:
+            batch = engine.create_batch(items, name=Path(args.topics).name)
+        
+        def on_item_update(item, state):
+            if item["status"] in ("success", "failed"):
+                finished = sum(1 for i in state["items"] if i["status"] in ("success", "failed"))
+                logger.info(f"📊 Batch progress: {finished}/{len(state['items'])}")
+        
+        summary = await engine.run(batch, on_item_update=on_item_update)
+    
+    for item in summary["errors"]:
+        logger.error(f"   #{item['index']} {item['params']['text']}: {item['error']}")
+    if summary["failed_count"]:
+        logger.info(f"Retry failed items with: pixelle-video batch --resume {summary['batch_id']}")
+        return 1
+    return 0
+
+
+def _list_batches(args) -> int:
+    """Print persisted batches"""
+    from pixelle_video.services.batch_engine import BatchEngine
+    
+    for batch in BatchEngine().list_batches():
+        print(
+            f"{batch['batch_id']}  {batch['status']:<9}  "
+            f"{batch['success_count']}/{batch['total_count']} ok, {batch['failed_count']} failed  "
+            f"{batch['name'] or ''}"
+        )
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="pixelle-video", description="Pixelle-Video command line")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    batch_parser = subparsers.add_parser("batch", help="Generate one video per topic, several at once")
+    batch_parser.add_argument("topics", nargs="?", help="Topics file (one topic per line)")
+    batch_parser.add_argument("--resume", metavar="BATCH_ID", help="Continue an existing batch (unfinished and failed items)")
+    batch_parser.add_argument("--pipeline", default="standard", help="Pipeline name (default: standard)")
+    batch_parser.add_argument("--n-scenes", type=int, default=None, help="Scenes per video")
+    batch_parser.add_argument("--title-prefix", default=None, help="Title format: '{prefix} - {topic}'")
+    batch_parser.add_argument(
+        "--param", action="append", default=[], metavar="KEY=VALUE",
+        help="Extra generate_video parameter for every video (repeatable, JSON values allowed)"
+    )
+    batch_parser.add_argument("--concurrency", type=int, default=None, help="Videos generated at once (default: config batch.concurrency)")
+    batch_parser.add_argument("--retries", type=int, default=None, help="Retries per failed video (default: config batch.max_retries)")
+    batch_parser.add_argument("--retry-delay", type=float, default=None, help="Seconds before the first retry (default: config batch.retry_delay)")
+    
+    subparsers.add_parser("batches", help="List batches")
+    
+    args = parser.parse_args()
+    
+    if args.command == "batches":
+        sys.exit(_list_batches(args))
+    
+    items = None
+    if not args.resume:
+        if not args.topics:
+            batch_parser.error("a topics file or --resume BATCH_ID is required")
+        try:
+            items = _build_items(args)
+        except (OSError, ValueError) as e:
+            batch_parser.error(str(e))
+    
+    try:
+        sys.exit(asyncio.run(_run_batch(args, items)))
+    except KeyboardInterrupt:
+        logger.warning("Interrupted: unfinished items are kept, continue with --resume")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
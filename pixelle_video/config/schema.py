@@ -15,7 +15,7 @@ Configuration schema with Pydantic models
 
 Single source of truth for all configuration defaults and validation.
 """
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -37,11 +37,18 @@ class TTSComfyUIConfig(BaseModel):
     default_workflow: Optional[str] = Field(default=None, description="Default TTS workflow (optional)")
 
 
+class TTSCacheConfig(BaseModel):
+    """TTS audio cache configuration (content-addressed, under data/cache/tts)"""
+    enabled: bool = Field(default=True, description="Reuse generated audio for identical text/voice/speed/workflow")
+    max_size_mb: int = Field(default=512, ge=1, description="Max total size of cached audio in MB (LRU eviction)")
+
+
 class TTSSubConfig(BaseModel):
     """TTS-specific configuration (under comfyui.tts)"""
     inference_mode: str = Field(default="local", description="TTS inference mode: 'local' or 'comfyui'")
     local: TTSLocalConfig = Field(default_factory=TTSLocalConfig, description="Local TTS (Edge TTS) configuration")
     comfyui: TTSComfyUIConfig = Field(default_factory=TTSComfyUIConfig, description="ComfyUI TTS configuration")
+    cache: TTSCacheConfig = Field(default_factory=TTSCacheConfig, description="TTS audio cache configuration")
     
     # Backward compatibility: keep default_workflow at top level
     @property
@@ -85,12 +92,49 @@ class TemplateConfig(BaseModel):
     )
 
 
+class ConcurrencyConfig(BaseModel):
+    """Per-stage concurrency limits for frame processing"""
+    tts: int = Field(default=4, ge=1, le=32, description="Max frames generating TTS audio at once")
+    media: int = Field(default=1, ge=1, le=32, description="Max frames generating media (image/video) at once")
+    compose: int = Field(default=2, ge=1, le=32, description="Max frames rendering HTML templates at once")
+    encode: int = Field(default=2, ge=1, le=32, description="Max frames encoding video segments at once")
+    analysis: int = Field(default=4, ge=1, le=32, description="Max uploaded assets analyzed at once (asset-based pipeline)")
+    ffmpeg: int = Field(default=0, ge=0, le=64, description="Max ffmpeg processes at once, across all tasks (0 = half the CPU cores)")
+
+
+class HistoryConfig(BaseModel):
+    """Task history index configuration"""
+    index_workers: int = Field(default=8, ge=1, le=64, description="Threads scanning task directories during index rebuilds")
+    reconcile_interval: float = Field(default=0, ge=0, description="Seconds between background index reconcile passes (0 = disabled)")
+    storage_format: Literal["json", "binary"] = Field(default="json", description="Format of task metadata/storyboard files")
+
+
+class PreviewConfig(BaseModel):
+    """Poster image / preview clip generation (post-production)"""
+    enabled: bool = Field(default=True, description="Create a poster image and preview clip for each video")
+    poster_format: Literal["jpg", "webp"] = Field(default="jpg", description="Poster image format")
+    poster_width: int = Field(default=480, ge=64, le=1920, description="Poster width in pixels")
+    clip_duration: float = Field(default=6.0, gt=0, le=60, description="Preview clip length in seconds")
+    clip_width: int = Field(default=360, ge=64, le=1920, description="Preview clip width in pixels")
+
+
+class BatchConfig(BaseModel):
+    """Batch generation configuration"""
+    concurrency: int = Field(default=2, ge=1, le=32, description="Max videos generated at once in a batch")
+    max_retries: int = Field(default=1, ge=0, le=10, description="Retries per failed batch item")
+    retry_delay: float = Field(default=10.0, ge=0, description="Base delay before retrying a batch item (seconds, doubled per retry)")
+
+
 class PixelleVideoConfig(BaseModel):
     """Pixelle-Video main configuration"""
     project_name: str = Field(default="Pixelle-Video", description="Project name")
     llm: LLMConfig = Field(default_factory=LLMConfig)
     comfyui: ComfyUIConfig = Field(default_factory=ComfyUIConfig)
     template: TemplateConfig = Field(default_factory=TemplateConfig)
+    concurrency: ConcurrencyConfig = Field(default_factory=ConcurrencyConfig)
+    history: HistoryConfig = Field(default_factory=HistoryConfig)
+    preview: PreviewConfig = Field(default_factory=PreviewConfig)
+    batch: BatchConfig = Field(default_factory=BatchConfig)
     
     def is_llm_configured(self) -> bool:
         """Check if LLM is properly configured"""
@@ -140,4 +140,6 @@ class VideoGenerationResult:
     duration: float                            # Total duration
     file_size: int                             # File size (bytes)
     created_at: datetime = field(default_factory=datetime.now)
+    poster_path: Optional[str] = None          # Poster image (thumbnail)
+    preview_path: Optional[str] = None         # Short low-bitrate preview clip
 
@@ -32,6 +32,8 @@ Example:
     )
 """
 
+import asyncio
+import os
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
@@ -40,6 +42,7 @@ from pydantic import BaseModel, Field
 
 from pixelle_video.pipelines.linear import LinearVideoPipeline, PipelineContext
 from pixelle_video.models.progress import ProgressEvent
+from pixelle_video.models.storyboard import StoryboardFrame
 from pixelle_video.utils.os_util import (
     create_task_output_dir,
     get_task_final_video_path
@@ -71,6 +74,18 @@ class AssetBasedPipeline(LinearVideoPipeline):
     Generates videos from user-provided assets instead of AI-generated media.
     """
     
+    # Title comes from the request, so it is determined before the script
+    STAGES = (
+        "setup_environment",
+        "determine_title",
+        "generate_content",
+        "plan_visuals",
+        "initialize_storyboard",
+        "produce_assets",
+        "post_production",
+        "generate_previews",
+    )
+    
     def __init__(self, core):
         """
         Initialize pipeline
@@ -136,22 +151,38 @@ class AssetBasedPipeline(LinearVideoPipeline):
         # Store request parameters in context for easy access
         ctx.request = ctx.params
         
-        try:
-            # Execute pipeline lifecycle
-            await self.setup_environment(ctx)
-            await self.determine_title(ctx)
-            await self.generate_content(ctx)
-            await self.plan_visuals(ctx)
-            await self.initialize_storyboard(ctx)
-            await self.produce_assets(ctx)
-            await self.post_production(ctx)
-            await self.finalize(ctx)
-            
-            return ctx
+        # Execute pipeline lifecycle (checkpointed after each step)
+        return await self._run_stages(ctx)
             
-        except Exception as e:
-            await self.handle_exception(ctx, e)
-            raise
+    async def resume(
+        self,
+        task_id: str,
+        progress_callback: ProgressCallback = None,
+        **overrides
+    ) -> PipelineContext:
+        """
+        Continue a failed run from its last checkpoint (see LinearVideoPipeline.resume)
+        """
+        self._progress_callback = progress_callback
+        return await super().resume(task_id, progress_callback=progress_callback, **overrides)
+            
+    def checkpoint_state(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Asset analysis, script and scene matching results"""
+        return {
+            "asset_index": getattr(ctx, "asset_index", None),
+            "script": getattr(ctx, "script", None),
+            "matched_scenes": getattr(ctx, "matched_scenes", None),
+        }
+    
+    def restore_checkpoint_state(self, ctx: PipelineContext, state: Dict[str, Any]):
+        """Restore asset-specific context attributes"""
+        ctx.request = ctx.params
+        if ctx.task_dir:
+            ctx.task_dir = Path(ctx.task_dir)
+        for key in ("asset_index", "script", "matched_scenes"):
+            if state.get(key) is not None:
+                setattr(ctx, key, state[key])
+        self.asset_index = state.get("asset_index") or {}
     
     def _emit_progress(self, event: ProgressEvent):
         """Emit progress event to callback if available"""
@@ -195,69 +226,37 @@ class AssetBasedPipeline(LinearVideoPipeline):
             extra_info="start"
         ))
         
-        self.asset_index = {}
+        analysis_source = context.request.get("source", "runninghub")
+        concurrency = self.core.config.get("concurrency", {}).get("analysis", 4)
+        semaphore = asyncio.Semaphore(concurrency)
+        done = 0
         
-        for i, asset_path in enumerate(assets, 1):
-            asset_path_obj = Path(asset_path)
+        async def analyze(i: int, asset_path: str) -> Optional[Dict[str, Any]]:
+            nonlocal done
+            async with semaphore:
+                entry = await self._analyze_asset(i, total_assets, asset_path, analysis_source)
             
-            if not asset_path_obj.exists():
-                logger.warning(f"Asset not found: {asset_path}")
-                continue
-            
-            logger.info(f"Analyzing asset {i}/{total_assets}: {asset_path_obj.name}")
-            
-            # Emit progress for this asset
-            progress = 0.01 + (i - 1) / total_assets * 0.14  # 1% - 15%
+            # Emit progress for this asset (1% - 15%, in completion order)
+            done += 1
             self._emit_progress(ProgressEvent(
                 event_type="analyzing_asset",
-                progress=progress,
-                frame_current=i,
+                progress=0.01 + done / total_assets * 0.14,
+                frame_current=done,
                 frame_total=total_assets,
-                extra_info=asset_path_obj.name
+                extra_info=Path(asset_path).name
             ))
-            
-            # Determine asset type
-            asset_type = self._get_asset_type(asset_path_obj)
-            
-            if asset_type == "image":
-                # Analyze image using ImageAnalysisService
-                analysis_source = context.request.get("source", "runninghub")
-                description = await self.core.image_analysis(asset_path, source=analysis_source)
-                
-                self.asset_index[asset_path] = {
-                    "path": asset_path,
-                    "type": "image",
-                    "name": asset_path_obj.name,
-                    "description": description
-                }
-                
-                logger.info(f"✅ Image analyzed: {description[:50]}...")
-            
-            elif asset_type == "video":
-                # Analyze video using VideoAnalysisService
-                analysis_source = context.request.get("source", "runninghub")
-                try:
-                    description = await self.core.video_analysis(asset_path, source=analysis_source)
-                    
-                    self.asset_index[asset_path] = {
-                        "path": asset_path,
-                        "type": "video",
-                        "name": asset_path_obj.name,
-                        "description": description
-                    }
-                    
-                    logger.info(f"✅ Video analyzed: {description[:50]}...")
-                except Exception as e:
-                    logger.warning(f"Video analysis failed for {asset_path_obj.name}: {e}, using fallback")
-                    self.asset_index[asset_path] = {
-                        "path": asset_path,
-                        "type": "video",
-                        "name": asset_path_obj.name,
-                        "description": "Video asset (analysis failed)"
-                    }
-            
-            else:
-                logger.warning(f"Unknown asset type: {asset_path}")
+            return entry
+        
+        # Analyze assets concurrently (each is a remote workflow call); the index keeps upload order
+        tasks = [asyncio.ensure_future(analyze(i, asset_path)) for i, asset_path in enumerate(assets, 1)]
+        try:
+            entries = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        self.asset_index = {entry["path"]: entry for entry in entries if entry is not None}
         
         logger.success(f"✅ Asset analysis complete: {len(self.asset_index)} assets indexed")
         
@@ -275,6 +274,55 @@ class AssetBasedPipeline(LinearVideoPipeline):
         
         return context
     
+    async def _analyze_asset(
+        self,
+        i: int,
+        total_assets: int,
+        asset_path: str,
+        analysis_source: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Analyze one uploaded asset
+        
+        Returns:
+            Asset index entry, or None if the asset is missing or of unknown type
+        """
+        asset_path_obj = Path(asset_path)
+        
+        if not asset_path_obj.exists():
+            logger.warning(f"Asset not found: {asset_path}")
+            return None
+        
+        logger.info(f"Analyzing asset {i}/{total_assets}: {asset_path_obj.name}")
+        
+        # Determine asset type
+        asset_type = self._get_asset_type(asset_path_obj)
+        
+        if asset_type == "image":
+            # Analyze image using ImageAnalysisService
+            description = await self.core.image_analysis(asset_path, source=analysis_source)
+            logger.info(f"✅ Image analyzed: {description[:50]}...")
+        
+        elif asset_type == "video":
+            # Analyze video using VideoAnalysisService
+            try:
+                description = await self.core.video_analysis(asset_path, source=analysis_source)
+                logger.info(f"✅ Video analyzed: {description[:50]}...")
+            except Exception as e:
+                logger.warning(f"Video analysis failed for {asset_path_obj.name}: {e}, using fallback")
+                description = "Video asset (analysis failed)"
+        
+        else:
+            logger.warning(f"Unknown asset type: {asset_path}")
+            return None
+        
+        return {
+            "path": asset_path,
+            "type": asset_type,
+            "name": asset_path_obj.name,
+            "description": description
+        }
+    
     async def determine_title(self, context: PipelineContext) -> PipelineContext:
         """
         Use user-provided title if available, otherwise leave empty
@@ -535,158 +583,95 @@ class AssetBasedPipeline(LinearVideoPipeline):
         """
         Generate scene videos using FrameProcessor (asset + multiple narrations + template)
         
+        All scenes run concurrently: each scene synthesizes its narrations in
+        parallel (within the FrameProcessor "tts" budget), joins them into one
+        audio track, then goes through FrameProcessor, which bounds the
+        compose / encode stages. Scenes finished in an earlier run are skipped.
+        
         Args:
             context: Pipeline context
         
         Returns:
             Updated context with processed frames
         """
-        logger.info("🎬 Producing scene videos...")
-        
         storyboard = context.storyboard
-        config = context.config
         total_frames = len(storyboard.frames)
         
+        logger.info(f"🎬 Producing {total_frames} scene videos concurrently...")
+        
         # Progress range: 30% - 85% for frame production
         base_progress = 0.30
         progress_range = 0.55  # 85% - 30%
+        per_frame_progress = progress_range / total_frames
+        completed_count = 0
         
-        for i, frame in enumerate(storyboard.frames, 1):
-            logger.info(f"Producing scene {i}/{total_frames}...")
+        async def produce_scene(i: int, frame: StoryboardFrame) -> StoryboardFrame:
+            nonlocal completed_count
             
-            # Emit progress for this frame (each frame has 4 steps: audio, combine, duration, compose)
-            frame_progress = base_progress + (i - 1) / total_frames * progress_range
-            self._emit_progress(ProgressEvent(
-                event_type="frame_step",
-                progress=frame_progress,
-                frame_current=i,
-                frame_total=total_frames,
-                step=1,
-                action="audio"
-            ))
+            # Finished in an earlier run (resume)
+            if self._is_frame_done(frame):
+                completed_count += 1
+                logger.info(f"⏭️  Scene {i} already produced, skipping")
+                return frame
             
-            # Get scene data with narrations
-            scene = frame._scene_data
-            narrations = scene.get("narrations", [scene.get("narration", "")])
-            if isinstance(narrations, str):
-                narrations = [narrations]
-            
-            logger.info(f"Scene {i} has {len(narrations)} narration(s)")
-            
-            # Step 1: Generate audio for each narration and combine
-            narration_audios = []
-            for j, narration_text in enumerate(narrations, 1):
-                audio_path = Path(context.task_dir) / "frames" / f"{i:02d}_narration_{j}.mp3"
-                audio_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                await self.core.tts(
-                    text=narration_text,
-                    output_path=str(audio_path),
-                    voice_id=config.voice_id,
-                    speed=config.tts_speed
-                )
-                
-                narration_audios.append(str(audio_path))
-                logger.debug(f"  Narration {j}/{len(narrations)}: {narration_text[:30]}...")
-            
-            # Concatenate all narration audios for this scene
-            if len(narration_audios) > 1:
-                from pixelle_video.utils.os_util import get_task_frame_path
-                
-                # Emit progress for combining audio
-                frame_progress = base_progress + ((i - 1) + 0.25) / total_frames * progress_range
+            # Each frame has 4 steps: audio, combine (FrameProcessor: compose, video)
+            def frame_progress_callback(event: ProgressEvent):
                 self._emit_progress(ProgressEvent(
                     event_type="frame_step",
-                    progress=frame_progress,
+                    progress=min(
+                        base_progress + per_frame_progress * (completed_count + event.progress),
+                        base_progress + progress_range
+                    ),
                     frame_current=i,
                     frame_total=total_frames,
-                    step=2,
-                    action="audio"
+                    step=event.step,
+                    action=event.action
                 ))
                 
-                combined_audio_path = Path(context.task_dir) / "frames" / f"{i:02d}_audio.mp3"
-                
-                # Use FFmpeg to concatenate audio files
-                import subprocess
-                
-                # Create a file list for FFmpeg concat
-                filelist_path = Path(context.task_dir) / "frames" / f"{i:02d}_audiolist.txt"
-                with open(filelist_path, 'w') as f:
-                    for audio_file in narration_audios:
-                        escaped_path = str(Path(audio_file).absolute()).replace("'", "'\\''")
-                        f.write(f"file '{escaped_path}'\n")
-                
-                # Concatenate audio files
-                concat_cmd = [
-                    'ffmpeg',
-                    '-f', 'concat',
-                    '-safe', '0',
-                    '-i', str(filelist_path),
-                    '-c', 'copy',
-                    '-y',
-                    str(combined_audio_path)
-                ]
-                
-                subprocess.run(concat_cmd, check=True, capture_output=True)
-                frame.audio_path = str(combined_audio_path)
-                
-                logger.info(f"✅ Combined {len(narration_audios)} narrations into one audio")
+            # Scene data is not part of the checkpointed frame, fall back to matched scenes
+            if frame.audio_path and frame.duration and os.path.exists(frame.audio_path):
+                logger.debug(f"  Scene {i}: using audio from a previous run: {frame.audio_path}")
             else:
-                frame.audio_path = narration_audios[0]
-            
-            # Step 2: Use FrameProcessor to generate composed frame and video
-            # FrameProcessor will handle:
-            # - Template rendering (with proper dimensions)
-            # - Subtitle composition
-            # - Video segment creation
-            # - Proper file naming in frames/
+                scene = getattr(frame, "_scene_data", None) or context.matched_scenes[frame.index]
+                await self._produce_scene_audio(context, i, frame, scene, frame_progress_callback)
             
-            # Since we already have the audio and image, we bypass some steps
-            # by manually calling the composition steps
-            
-            # Emit progress for duration calculation
-            frame_progress = base_progress + ((i - 1) + 0.5) / total_frames * progress_range
-            self._emit_progress(ProgressEvent(
-                event_type="frame_step",
-                progress=frame_progress,
-                frame_current=i,
-                frame_total=total_frames,
-                step=3,
-                action="compose"
-            ))
-            
-            # Get audio duration for frame duration
-            import subprocess
-            duration_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                frame.audio_path
-            ]
-            duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-            frame.duration = float(duration_result.stdout.strip())
-            
-            # Emit progress for video composition
-            frame_progress = base_progress + ((i - 1) + 0.75) / total_frames * progress_range
-            self._emit_progress(ProgressEvent(
-                event_type="frame_step",
-                progress=frame_progress,
-                frame_current=i,
-                frame_total=total_frames,
-                step=4,
-                action="video"
-            ))
-            
-            # Use FrameProcessor for proper composition
+            # FrameProcessor handles template rendering, subtitles and the video segment
             processed_frame = await self.core.frame_processor(
                 frame=frame,
                 storyboard=storyboard,
-                config=config,
-                total_frames=total_frames
+                config=context.config,
+                total_frames=total_frames,
+                progress_callback=frame_progress_callback
             )
             
-            logger.success(f"✅ Scene {i} complete")
+            completed_count += 1
+            logger.success(f"✅ Scene {i} complete ({processed_frame.duration:.2f}s) [{completed_count}/{total_frames}]")
+            
+            # Checkpoint finished scenes so a failure later doesn't redo them
+            storyboard.frames[i - 1] = processed_frame
+            await self.save_checkpoint(context)
+            return processed_frame
+        
+        tasks = [
+            asyncio.create_task(produce_scene(i, frame))
+            for i, frame in enumerate(storyboard.frames, 1)
+        ]
+        
+        try:
+            # gather keeps results in storyboard order
+            processed_frames = await asyncio.gather(*tasks)
+        except BaseException:
+            # One scene failed (or we were cancelled): stop the others
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Keep scene audio finished by unfinished scenes for resume
+            await self.save_checkpoint(context)
+            raise
+        
+        storyboard.frames = list(processed_frames)
+        storyboard.total_duration = sum(frame.duration for frame in processed_frames)
         
         # Emit completion of frame production
         self._emit_progress(ProgressEvent(
@@ -698,6 +683,76 @@ class AssetBasedPipeline(LinearVideoPipeline):
         
         return context
     
+    async def _produce_scene_audio(
+        self,
+        context: PipelineContext,
+        i: int,
+        frame: StoryboardFrame,
+        scene: Dict[str, Any],
+        report: Callable[[ProgressEvent], None]
+    ):
+        """
+        Synthesize all narrations of a scene concurrently and join them into the frame audio
+        
+        Sets frame.audio_path and frame.duration.
+        """
+        from pixelle_video.services.media_info import get_media_info
+        
+        config = context.config
+        frames_dir = Path(context.task_dir) / "frames"
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        
+        narrations = scene.get("narrations", [scene.get("narration", "")])
+        if isinstance(narrations, str):
+            narrations = [narrations]
+        
+        logger.info(f"Scene {i} has {len(narrations)} narration(s)")
+        report(ProgressEvent(event_type="frame_step", progress=0.0, step=1, action="audio"))
+        
+        async def synthesize(j: int, narration_text: str) -> str:
+            audio_path = frames_dir / f"{i:02d}_narration_{j}.mp3"
+            async with self.core.frame_processor.stage("tts"):
+                await self.core.tts(
+                    text=narration_text,
+                    output_path=str(audio_path),
+                    voice_id=config.voice_id,
+                    speed=config.tts_speed
+                )
+            logger.debug(f"  Scene {i} narration {j}/{len(narrations)}: {narration_text[:30]}...")
+            return str(audio_path)
+        
+        # gather keeps narration order; a failed narration cancels its siblings
+        tts_tasks = [
+            asyncio.create_task(synthesize(j, narration_text))
+            for j, narration_text in enumerate(narrations, 1)
+        ]
+        try:
+            narration_audios = await asyncio.gather(*tts_tasks)
+        except BaseException:
+            for task in tts_tasks:
+                task.cancel()
+            await asyncio.gather(*tts_tasks, return_exceptions=True)
+            raise
+        
+        # Concatenate all narration audios for this scene
+        if len(narration_audios) > 1:
+            report(ProgressEvent(event_type="frame_step", progress=0.25, step=2, action="audio"))
+            
+            combined_audio_path = str(frames_dir / f"{i:02d}_audio.mp3")
+            audio_path = await self.core.video.concat_audios_async(narration_audios, combined_audio_path)
+            
+            logger.info(f"✅ Combined {len(narration_audios)} narrations into one audio")
+        else:
+            audio_path = narration_audios[0]
+        
+        # Audio duration sets the frame duration (probe result is cached for encoding);
+        # audio_path is only set together with it, so a checkpoint never holds one without the other
+        info = await get_media_info(audio_path)
+        if info.duration is None:
+            raise ValueError(f"No duration in probe result for {audio_path}")
+        frame.audio_path = audio_path
+        frame.duration = info.duration
+    
     async def post_production(self, context: PipelineContext) -> PipelineContext:
         """
         Concatenate scene videos and add BGM
@@ -735,7 +790,7 @@ class AssetBasedPipeline(LinearVideoPipeline):
         if bgm_path:
             logger.info(f"🎵 Adding BGM: {bgm_path} (volume={bgm_volume}, mode={bgm_mode})")
         
-        self.core.video.concat_videos(
+        await self.core.video.concat_videos_async(
             videos=scene_videos,
             output=str(final_video_path),
             bgm_path=bgm_path,
@@ -825,7 +880,9 @@ class AssetBasedPipeline(LinearVideoPipeline):
                     "video_path": ctx.final_video_path,
                     "duration": storyboard.total_duration if storyboard else 0,
                     "file_size": file_size,
-                    "n_frames": len(storyboard.frames) if storyboard else 0
+                    "n_frames": len(storyboard.frames) if storyboard else 0,
+                    "poster_path": ctx.poster_path,
+                    "preview_path": ctx.preview_path
                 },
                 
                 "config": {
@@ -335,7 +335,7 @@ class CustomPipeline(BasePipeline):
             from pixelle_video.services.video import VideoService
             video_service = VideoService()
             
-            final_video_path = video_service.concat_videos(
+            final_video_path = await video_service.concat_videos_async(
                 videos=segment_paths,
                 output=output_path,
                 bgm_path=bgm_path,
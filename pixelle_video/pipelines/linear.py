@@ -16,8 +16,14 @@ Linear Video Pipeline Base Class
 This module defines the template method pattern for linear video generation workflows.
 It introduces `PipelineContext` for state management and `LinearVideoPipeline` for
 process orchestration.
+
+The context is checkpointed to the task directory after every step (and by
+pipelines after every finished frame), so a failed run can be continued with
+`pipeline.resume(task_id)` without redoing completed work.
 """
 
+import asyncio
+import os
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable
 from loguru import logger
@@ -60,8 +66,13 @@ class PipelineContext:
     
     # === Output ===
     final_video_path: Optional[str] = None
+    poster_path: Optional[str] = None
+    preview_path: Optional[str] = None
     result: Optional[VideoGenerationResult] = None
 
+    # === Checkpointing ===
+    completed_stages: List[str] = field(default_factory=list)
+
 
 class LinearVideoPipeline(BasePipeline):
     """
@@ -75,12 +86,29 @@ class LinearVideoPipeline(BasePipeline):
     5. initialize_storyboard
     6. produce_assets
     7. post_production
-    8. finalize
+    8. generate_previews
+    9. finalize
     
     Subclasses should override specific steps to customize behavior while maintaining
     the overall workflow structure.
+    
+    After each step the context is saved to {task_dir}/checkpoint.json; if a run
+    fails, `resume(task_id)` restores it and continues with the first
+    unfinished step. The checkpoint is removed once the run succeeds.
     """
     
+    # Steps 1-8 in execution order (each is checkpointed when done); finalize runs last
+    STAGES = (
+        "setup_environment",    # === Phase 1: Preparation ===
+        "generate_content",     # === Phase 2: Content Creation ===
+        "determine_title",
+        "plan_visuals",         # === Phase 3: Visual Planning ===
+        "initialize_storyboard",
+        "produce_assets",       # === Phase 4: Asset Production ===
+        "post_production",      # === Phase 5: Post Production ===
+        "generate_previews",
+    )
+    
     async def __call__(
         self,
         text: str,
@@ -97,30 +125,127 @@ class LinearVideoPipeline(BasePipeline):
             progress_callback=progress_callback
         )
         
+        return await self._run_stages(ctx)
+    
+    async def resume(
+        self,
+        task_id: str,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        **overrides
+    ):
+        """
+        Continue a failed or interrupted run from its last checkpoint
+        
+        Completed steps are skipped; inside produce_assets, frames whose video
+        segment already exists are skipped too.
+        
+        Args:
+            task_id: Task ID of the failed run
+            progress_callback: Optional callback for progress updates
+            **overrides: Parameters to set again (e.g. ones that could not be
+                checkpointed because they are not JSON-serializable)
+        
+        Returns:
+            Same as __call__
+        
+        Raises:
+            ValueError: If the task has no checkpoint or belongs to another pipeline
+        """
+        checkpoint = await self.core.persistence.load_checkpoint(task_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for task {task_id}")
+        if checkpoint.get("pipeline") != type(self).__name__:
+            raise ValueError(
+                f"Task {task_id} was created by {checkpoint.get('pipeline')}, not {type(self).__name__}"
+            )
+        
+        ctx = PipelineContext(
+            input_text=checkpoint["input_text"],
+            params={**checkpoint.get("params", {}), **overrides},
+            progress_callback=progress_callback,
+            task_id=task_id,
+            task_dir=checkpoint.get("task_dir"),
+            title=checkpoint.get("title"),
+            narrations=checkpoint.get("narrations") or [],
+            image_prompts=checkpoint.get("image_prompts") or [],
+            storyboard=checkpoint.get("storyboard"),
+            final_video_path=checkpoint.get("final_video_path"),
+            poster_path=checkpoint.get("poster_path"),
+            preview_path=checkpoint.get("preview_path"),
+            completed_stages=list(checkpoint.get("completed_stages") or []),
+        )
+        if ctx.storyboard is not None:
+            ctx.config = ctx.storyboard.config
+        self.restore_checkpoint_state(ctx, checkpoint.get("extra") or {})
+        
+        done = ", ".join(ctx.completed_stages) or "none"
+        logger.info(f"♻️  Resuming task {task_id} (completed steps: {done})")
+        return await self._run_stages(ctx)
+    
+    async def _run_stages(self, ctx: PipelineContext):
+        """Run all steps not yet completed, checkpointing after each, then finalize"""
         try:
-            # === Phase 1: Preparation ===
-            await self.setup_environment(ctx)
-            
-            # === Phase 2: Content Creation ===
-            await self.generate_content(ctx)
-            await self.determine_title(ctx)
-            
-            # === Phase 3: Visual Planning ===
-            await self.plan_visuals(ctx)
-            await self.initialize_storyboard(ctx)
-            
-            # === Phase 4: Asset Production ===
-            await self.produce_assets(ctx)
-            
-            # === Phase 5: Post Production ===
-            await self.post_production(ctx)
+            for stage in self.STAGES:
+                if stage in ctx.completed_stages:
+                    continue
+                await getattr(self, stage)(ctx)
+                ctx.completed_stages.append(stage)
+                await self.save_checkpoint(ctx)
             
             # === Phase 6: Finalization ===
-            return await self.finalize(ctx)
+            result = await self.finalize(ctx)
+            
+            if ctx.task_id:
+                await self.core.persistence.delete_checkpoint(ctx.task_id)
+            return result
             
         except Exception as e:
             await self.handle_exception(ctx, e)
             raise
+    
+    # ==================== Checkpointing ====================
+    
+    async def save_checkpoint(self, ctx: PipelineContext):
+        """
+        Save the context to the task directory (no-op before setup_environment)
+        
+        Pipelines may call this inside long steps (e.g. after each frame).
+        Failures are logged, never raised.
+        """
+        if not ctx.task_id:
+            return
+        
+        checkpoint = {
+            "pipeline": type(self).__name__,
+            "completed_stages": list(ctx.completed_stages),
+            "input_text": ctx.input_text,
+            "params": ctx.params,
+            "task_dir": str(ctx.task_dir) if ctx.task_dir else None,
+            "title": ctx.title,
+            "narrations": ctx.narrations,
+            "image_prompts": ctx.image_prompts,
+            "final_video_path": ctx.final_video_path,
+            "poster_path": ctx.poster_path,
+            "preview_path": ctx.preview_path,
+            "extra": self.checkpoint_state(ctx),
+        }
+        try:
+            await self.core.persistence.save_checkpoint(ctx.task_id, checkpoint, ctx.storyboard)
+        except Exception as e:
+            logger.warning(f"Failed to save checkpoint for task {ctx.task_id}: {e}")
+    
+    def checkpoint_state(self, ctx: PipelineContext) -> Dict[str, Any]:
+        """Pipeline-specific JSON-serializable state to checkpoint (override if needed)"""
+        return {}
+    
+    def restore_checkpoint_state(self, ctx: PipelineContext, state: Dict[str, Any]):
+        """Restore state returned by checkpoint_state (override if needed)"""
+        pass
+    
+    @staticmethod
+    def _is_frame_done(frame) -> bool:
+        """Check whether a frame's video segment was produced by an earlier run"""
+        return bool(frame.video_segment_path) and os.path.exists(frame.video_segment_path)
 
     # ==================== Lifecycle Methods ====================
     
@@ -152,10 +277,54 @@ class LinearVideoPipeline(BasePipeline):
         """Step 7: Concatenate videos and add BGM."""
         pass
         
+    async def generate_previews(self, ctx: PipelineContext):
+        """
+        Step 8: Create a poster image and a short preview clip of the final video.
+        
+        Listings (History page, tasks API) show these instead of loading the
+        full video. Config `preview`: enabled, poster_format (jpg/webp),
+        poster_width, clip_duration, clip_width. Failures are logged, never raised.
+        """
+        preview_config = self.core.config.get("preview", {})
+        if not preview_config.get("enabled", True) or not ctx.final_video_path or not ctx.task_dir:
+            return
+        
+        poster_path = os.path.join(ctx.task_dir, f"poster.{preview_config.get('poster_format', 'jpg')}")
+        preview_path = os.path.join(ctx.task_dir, "preview.mp4")
+        
+        poster, preview = await asyncio.gather(
+            self.core.video.create_poster_async(
+                ctx.final_video_path,
+                poster_path,
+                width=preview_config.get("poster_width", 480)
+            ),
+            self.core.video.create_preview_clip_async(
+                ctx.final_video_path,
+                preview_path,
+                duration=preview_config.get("clip_duration", 6.0),
+                width=preview_config.get("clip_width", 360)
+            ),
+            return_exceptions=True
+        )
+        
+        if isinstance(poster, Exception):
+            logger.warning(f"Failed to create poster: {poster}")
+        else:
+            ctx.poster_path = poster
+        if isinstance(preview, Exception):
+            logger.warning(f"Failed to create preview clip: {preview}")
+        else:
+            ctx.preview_path = preview
+    
     async def finalize(self, ctx: PipelineContext) -> VideoGenerationResult:
-        """Step 8: Create result object and persist metadata."""
+        """Step 9: Create result object and persist metadata."""
         raise NotImplementedError("finalize must be implemented by subclass")
 
     async def handle_exception(self, ctx: PipelineContext, error: Exception):
         """Handle exceptions during pipeline execution."""
         logger.error(f"Pipeline execution failed: {error}")
+        
+        # Work done inside the failed step (e.g. finished frame assets) is kept for resume
+        await self.save_checkpoint(ctx)
+        if ctx.task_id and ctx.completed_stages:
+            logger.info(f"   Completed steps are checkpointed: resume with pipeline.resume('{ctx.task_id}')")
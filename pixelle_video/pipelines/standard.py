@@ -26,6 +26,7 @@ import shutil
 
 from loguru import logger
 
+from pixelle_video.config import config_manager
 from pixelle_video.pipelines.linear import LinearVideoPipeline, PipelineContext
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import (
@@ -50,10 +51,6 @@ from pixelle_video.utils.prompt_helper import build_image_prompt
 from pixelle_video.services.video import VideoService
 
 
-# Parallel limit for RunningHub workflows (Call by sequential if set to 1)
-RUNNING_HUB_PARALLEL_LIMIT = 1
-
-
 class StandardPipeline(LinearVideoPipeline):
     """
     Standard video generation pipeline
@@ -295,112 +292,94 @@ class StandardPipeline(LinearVideoPipeline):
         """Step 6: Generate audio, images, and render frames (Core processing)."""
         storyboard = ctx.storyboard
         config = ctx.config
+        total_frames = len(storyboard.frames)
         
-        # Check if using RunningHub workflows for parallel processing
-        is_runninghub = (
-            (config.tts_workflow and config.tts_workflow.startswith("runninghub/")) or
-            (config.media_workflow and config.media_workflow.startswith("runninghub/"))
+        # All frames run concurrently; FrameProcessor bounds each stage
+        # (tts / media / compose / encode) with its own limit from config, so
+        # frame N's encode overlaps with frame N+1's media generation.
+        limits = config_manager.config.concurrency
+        logger.info(
+            f"🚀 Processing {total_frames} frames concurrently "
+            f"(tts={limits.tts}, media={limits.media}, compose={limits.compose}, encode={limits.encode})"
         )
         
-        if is_runninghub and RUNNING_HUB_PARALLEL_LIMIT > 1:
-            logger.info(f"🚀 Using parallel processing for RunningHub workflows (max {RUNNING_HUB_PARALLEL_LIMIT} concurrent)")
+        base_progress = 0.2
+        frame_range = 0.6
+        per_frame_progress = frame_range / total_frames
+        completed_count = 0
+        
+        async def process_frame(i: int, frame: StoryboardFrame) -> StoryboardFrame:
+            nonlocal completed_count
             
-            semaphore = asyncio.Semaphore(RUNNING_HUB_PARALLEL_LIMIT)
-            completed_count = 0
+            # Finished in an earlier run (resume)
+            if self._is_frame_done(frame):
+                completed_count += 1
+                logger.info(f"⏭️  Frame {i+1} already produced, skipping")
+                return frame
             
-            async def process_frame_with_semaphore(i: int, frame: StoryboardFrame):
-                nonlocal completed_count
-                async with semaphore:
-                    base_progress = 0.2
-                    frame_range = 0.6
-                    per_frame_progress = frame_range / len(storyboard.frames)
-                    
-                    # Create frame-specific progress callback
-                    def frame_progress_callback(event: ProgressEvent):
-                        overall_progress = base_progress + (per_frame_progress * completed_count) + (per_frame_progress * event.progress)
-                        if ctx.progress_callback:
-                            adjusted_event = ProgressEvent(
-                                event_type=event.event_type,
-                                progress=overall_progress,
-                                frame_current=i+1,
-                                frame_total=len(storyboard.frames),
-                                step=event.step,
-                                action=event.action
-                            )
-                            ctx.progress_callback(adjusted_event)
-                    
-                    # Report frame start
-                    self._report_progress(
-                        ctx.progress_callback,
-                        "processing_frame",
-                        base_progress + (per_frame_progress * completed_count),
+            # Create frame-specific progress callback
+            def frame_progress_callback(event: ProgressEvent):
+                overall_progress = base_progress + (per_frame_progress * completed_count) + (per_frame_progress * event.progress)
+                if ctx.progress_callback:
+                    adjusted_event = ProgressEvent(
+                        event_type=event.event_type,
+                        progress=min(overall_progress, base_progress + frame_range),
                         frame_current=i+1,
-                        frame_total=len(storyboard.frames)
+                        frame_total=total_frames,
+                        step=event.step,
+                        action=event.action
                     )
-                    
-                    processed_frame = await self.core.frame_processor(
-                        frame=frame,
-                        storyboard=storyboard,
-                        config=config,
-                        total_frames=len(storyboard.frames),
-                        progress_callback=frame_progress_callback
-                    )
-                    
-                    completed_count += 1
-                    logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s) [{completed_count}/{len(storyboard.frames)}]")
-                    return i, processed_frame
+                    ctx.progress_callback(adjusted_event)
             
-            # Create all tasks and execute in parallel
-            tasks = [process_frame_with_semaphore(i, frame) for i, frame in enumerate(storyboard.frames)]
-            results = await asyncio.gather(*tasks)
+            # Report frame start
+            self._report_progress(
+                ctx.progress_callback,
+                "processing_frame",
+                base_progress + (per_frame_progress * completed_count),
+                frame_current=i+1,
+                frame_total=total_frames
+            )
             
-            # Update frames in order and calculate total duration
-            for idx, processed_frame in sorted(results, key=lambda x: x[0]):
-                storyboard.frames[idx] = processed_frame
-                storyboard.total_duration += processed_frame.duration
+            processed_frame = await self.core.frame_processor(
+                frame=frame,
+                storyboard=storyboard,
+                config=config,
+                total_frames=total_frames,
+                progress_callback=frame_progress_callback
+            )
             
-            logger.info(f"✅ All frames processed in parallel (total duration: {storyboard.total_duration:.2f}s)")
-        else:
-            # Serial processing for non-RunningHub workflows
-            logger.info("⚙️ Using serial processing (non-RunningHub workflow)")
+            completed_count += 1
+            logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s) [{completed_count}/{total_frames}]")
             
-            for i, frame in enumerate(storyboard.frames):
-                base_progress = 0.2
-                frame_range = 0.6
-                per_frame_progress = frame_range / len(storyboard.frames)
-                
-                # Create frame-specific progress callback
-                def frame_progress_callback(event: ProgressEvent):
-                    overall_progress = base_progress + (per_frame_progress * i) + (per_frame_progress * event.progress)
-                    if ctx.progress_callback:
-                        adjusted_event = ProgressEvent(
-                            event_type=event.event_type,
-                            progress=overall_progress,
-                            frame_current=event.frame_current,
-                            frame_total=event.frame_total,
-                            step=event.step,
-                            action=event.action
-                        )
-                        ctx.progress_callback(adjusted_event)
-                
-                # Report frame start
-                self._report_progress(
-                    ctx.progress_callback,
-                    "processing_frame",
-                    base_progress + (per_frame_progress * i),
-                    frame_current=i+1,
-                    frame_total=len(storyboard.frames)
-                )
-                
-                processed_frame = await self.core.frame_processor(
-                    frame=frame,
-                    storyboard=storyboard,
-                    config=config,
-                    total_frames=len(storyboard.frames),
-                    progress_callback=frame_progress_callback
-                )
-                storyboard.total_duration += processed_frame.duration
-                logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s)")
+            # Checkpoint finished frames so a failure later doesn't redo them
+            storyboard.frames[i] = processed_frame
+            await self.save_checkpoint(ctx)
+            return processed_frame
+        
+        tasks = [
+            asyncio.create_task(process_frame(i, frame))
+            for i, frame in enumerate(storyboard.frames)
+        ]
+        
+        try:
+            # gather keeps results in storyboard order
+            processed_frames = await asyncio.gather(*tasks)
+        except BaseException:
+            # One frame failed (or we were cancelled): stop the others
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Keep audio/media finished by unfinished frames for resume
+            await self.save_checkpoint(ctx)
+            raise
+        
+        storyboard.total_duration = 0.0
+        for idx, processed_frame in enumerate(processed_frames):
+            storyboard.frames[idx] = processed_frame
+            storyboard.total_duration += processed_frame.duration
+        
+        logger.info(f"✅ All frames processed (total duration: {storyboard.total_duration:.2f}s)")
 
     async def post_production(self, ctx: PipelineContext):
         """Step 7: Concatenate videos and add BGM."""
@@ -411,7 +390,7 @@ class StandardPipeline(LinearVideoPipeline):
         
         video_service = VideoService()
         
-        final_video_path = video_service.concat_videos(
+        final_video_path = await video_service.concat_videos_async(
             videos=segment_paths,
             output=ctx.final_video_path,
             bgm_path=ctx.params.get("bgm_path"),
@@ -434,7 +413,7 @@ class StandardPipeline(LinearVideoPipeline):
         logger.success(f"🎬 Video generation completed: {ctx.final_video_path}")
 
     async def finalize(self, ctx: PipelineContext) -> VideoGenerationResult:
-        """Step 8: Create result object and persist metadata."""
+        """Step 9: Create result object and persist metadata."""
         self._report_progress(ctx.progress_callback, "completed", 1.0)
         
         video_path_obj = Path(ctx.final_video_path)
@@ -444,7 +423,9 @@ class StandardPipeline(LinearVideoPipeline):
             video_path=ctx.final_video_path,
             storyboard=ctx.storyboard,
             duration=ctx.storyboard.total_duration,
-            file_size=file_size
+            file_size=file_size,
+            poster_path=ctx.poster_path,
+            preview_path=ctx.preview_path
         )
         
         ctx.result = result
@@ -490,7 +471,9 @@ class StandardPipeline(LinearVideoPipeline):
                     "video_path": result.video_path,
                     "duration": result.duration,
                     "file_size": result.file_size,
-                    "n_frames": len(storyboard.frames)
+                    "n_frames": len(storyboard.frames),
+                    "poster_path": result.poster_path,
+                    "preview_path": result.preview_path
                 },
                 
                 "config": {
@@ -16,6 +16,7 @@ Pixelle-Video Core - Service Layer
 Provides unified access to all capabilities (LLM, TTS, Image, etc.)
 """
 
+import asyncio
 import hashlib
 import json
 from typing import Optional
@@ -30,9 +31,11 @@ from pixelle_video.services.media import MediaService
 from pixelle_video.services.image_analysis import ImageAnalysisService
 from pixelle_video.services.video_analysis import VideoAnalysisService
 from pixelle_video.services.video import VideoService
+from pixelle_video.services.ffmpeg_runner import set_max_workers
 from pixelle_video.services.frame_processor import FrameProcessor
 from pixelle_video.services.persistence import PersistenceService
 from pixelle_video.services.history_manager import HistoryManager
+from pixelle_video.services.http_client import HTTPClient
 from pixelle_video.pipelines.standard import StandardPipeline
 from pixelle_video.pipelines.custom import CustomPipeline
 from pixelle_video.pipelines.asset_based import AssetBasedPipeline
@@ -95,6 +98,9 @@ class PixelleVideoCore:
         self.persistence: Optional[PersistenceService] = None
         self.history: Optional[HistoryManager] = None
         
+        # Shared pooled HTTP client (media downloads)
+        self.http: Optional[HTTPClient] = None
+        
         # Video generation pipelines (dictionary of pipeline_name -> pipeline_instance)
         self.pipelines = {}
         
@@ -187,6 +193,14 @@ class PixelleVideoCore:
         logger.info("🚀 Initializing Pixelle-Video...")
         
         # 1. Initialize core services (ComfyKit will be lazy-loaded later)
+        # Shared HTTP client first (used by TTS and frame processing for downloads)
+        self.http = HTTPClient()
+        
+        # Global ffmpeg process limit (0 keeps the default: half the CPU cores)
+        ffmpeg_workers = self.config.get("concurrency", {}).get("ffmpeg")
+        if ffmpeg_workers:
+            set_max_workers(ffmpeg_workers)
+        
         # Initialize services
         self.llm = LLMService(self.config)
         self.tts = TTSService(self.config, core=self)
@@ -196,7 +210,14 @@ class PixelleVideoCore:
         self.video_analysis = VideoAnalysisService(self.config, core=self)
         self.video = VideoService()
         self.frame_processor = FrameProcessor(self)
-        self.persistence = PersistenceService(output_dir="output")
+        history_config = self.config.get("history", {})
+        self.persistence = PersistenceService(
+            output_dir="output",
+            index_workers=history_config.get("index_workers", 8),
+            storage_format=history_config.get("storage_format", "json")
+        )
+        if history_config.get("reconcile_interval"):
+            self.persistence.start_reconciler(history_config["reconcile_interval"])
         self.history = HistoryManager(self.persistence)
         
         # 2. Register video generation pipelines
@@ -215,7 +236,7 @@ class PixelleVideoCore:
     
     async def cleanup(self):
         """
-        Cleanup resources (close ComfyKit session)
+        Cleanup resources (close ComfyKit session, HTTP connections and frame-rendering browser)
         
         Example:
             await pixelle_video.cleanup()
@@ -230,7 +251,23 @@ class PixelleVideoCore:
             finally:
                 self._comfykit = None
                 self._comfykit_config_hash = None
-    
+        
+        # Close pooled HTTP connections
+        if self.http:
+            await self.http.close()
+        
+        # Stop background index reconciler and write buffered index updates
+        if self.persistence:
+            await asyncio.to_thread(self.persistence.stop_reconciler)
+            self.persistence.flush_index()
+        
+        # Shut down the persistent frame-rendering browser (if started)
+        from pixelle_video.services.browser_pool import close_browser_pool
+        try:
+            await close_browser_pool()
+        except Exception as e:
+            logger.error(f"Failed to close browser pool: {e}")
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self.initialize()
@@ -23,6 +23,7 @@ Services:
 - FrameProcessor: Frame processing orchestrator
 - PersistenceService: Task metadata and storyboard persistence
 - HistoryManager: History management business logic
+- BatchEngine: Concurrent, resumable batch video generation
 - ComfyBaseService: Base class for ComfyUI-based services
 """
 
@@ -34,6 +35,7 @@ from pixelle_video.services.video import VideoService
 from pixelle_video.services.frame_processor import FrameProcessor
 from pixelle_video.services.persistence import PersistenceService
 from pixelle_video.services.history_manager import HistoryManager
+from pixelle_video.services.batch_engine import BatchEngine
 
 # Backward compatibility alias
 ImageService = MediaService
@@ -48,5 +50,6 @@ __all__ = [
     "FrameProcessor",
     "PersistenceService",
     "HistoryManager",
+    "BatchEngine",
 ]
 
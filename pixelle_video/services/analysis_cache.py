@@ -0,0 +1,138 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed asset analysis cache
+
+Image/video descriptions are stored under data/cache/analysis, keyed by a hash
+of the asset *content* and of everything else that determines the description
+(analysis kind, workflow name and file content, extra parameters). The same photo uploaded again -
+under any name, in any task - is never sent to the analysis workflow twice.
+
+Layout:
+    data/cache/analysis/<key>.json   {"key", "description", "created_at"}
+
+Entries are a few hundred bytes each, so there is no eviction (entries of an
+edited workflow are simply never hit again); delete the directory to reset the
+cache. All methods are blocking: call them via asyncio.to_thread from async code.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import atomic_write_json, get_data_path
+
+
+class AnalysisCache:
+    """
+    Content-addressed cache of asset descriptions
+    
+    Usage:
+        >>> cache = AnalysisCache()
+        >>> key = cache.make_key(kind="image", content=cache.file_digest("a.jpg"), workflow_digest=cache.file_digest(workflow_path))
+        >>> description = cache.get(key)
+        >>> if description is None:
+        ...     description = await analyze("a.jpg")
+        ...     cache.put(key, description)
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize analysis cache
+        
+        Args:
+            cache_dir: Cache directory (default: data/cache/analysis)
+        """
+        self.cache_dir = cache_dir or get_data_path("cache", "analysis")
+        
+        # (path, size, mtime_ns) -> sha256 of asset files
+        self._file_digests: Dict[Tuple[str, int, int], str] = {}
+    
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build cache key from the parameters that determine the description
+        
+        Args:
+            **parts: JSON-serializable key parts (None values are ignored)
+        
+        Returns:
+            Hex digest
+        """
+        payload = {k: v for k, v in parts.items() if v is not None}
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def file_digest(self, path: str) -> str:
+        """
+        Content hash of a local file (blocking; memoized by size + mtime)
+        
+        Args:
+            path: Asset or workflow file path
+        
+        Returns:
+            sha256 hex digest of the file content
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._file_digests.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._file_digests[key] = digest
+        return digest
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached description
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Description, or None on miss
+        """
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                return json.load(f).get("description") or None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Analysis cache entry {key[:12]} unusable: {e}")
+            return None
+    
+    def put(self, key: str, description: str):
+        """
+        Store description (errors are logged, never raised)
+        
+        Args:
+            key: Cache key from make_key()
+            description: Analysis result
+        """
+        try:
+            atomic_write_json(
+                self._entry_path(key),
+                {"key": key, "description": description, "created_at": time.time()}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache analysis result: {e}")
@@ -0,0 +1,403 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batch Engine
+
+Runs many video generations concurrently on one event loop, sharing the
+core's services (pooled HTTP client, ComfyKit session, per-stage limits).
+
+Features:
+- Global concurrency budget (videos in flight at once); frame-level stages
+  additionally share the `concurrency` limits across all videos
+- Per-item retry with exponential backoff
+- Resumable batch state, persisted atomically to data/batches/{batch_id}.json
+  after every item transition: re-running a batch skips finished items
+
+Batch state layout:
+    {
+        "batch_id": "20251028_143052_ab3d",
+        "status": "pending" | "running" | "completed" | "failed",
+        "created_at": ..., "updated_at": ...,
+        "items": [
+            {"index": 1, "params": {...}, "status": "pending" | "running" | "success" | "failed",
+             "attempts": 0, "task_id": None, "video_path": None, "error": None, "traceback": None},
+            ...
+        ]
+    }
+"""
+
+import asyncio
+import json
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from pixelle_video.config import config_manager
+from pixelle_video.utils.os_util import atomic_write_bytes, create_task_id, get_data_path
+
+
+class BatchEngine:
+    """
+    Concurrent, resumable batch video generation
+    
+    Usage:
+        >>> engine = BatchEngine(pixelle_video, concurrency=3)
+        >>> batch = engine.create_batch([{"text": topic, "mode": "generate"} for topic in topics])
+        >>> summary = await engine.run(batch)
+        >>>
+        >>> # Later (e.g. after a crash): finish remaining / failed items
+        >>> summary = await engine.run(batch["batch_id"])
+    """
+    
+    def __init__(
+        self,
+        core=None,
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        state_dir: Optional[str] = None,
+    ):
+        """
+        Initialize batch engine
+        
+        Args:
+            core: Initialized PixelleVideoCore instance (None to only read batch state)
+            concurrency: Max videos generated at once (default: config `batch.concurrency`)
+            max_retries: Retries per item after the first failure (default: config `batch.max_retries`)
+            retry_delay: Base delay between retries in seconds, doubled per retry
+                (default: config `batch.retry_delay`)
+            state_dir: Directory for batch state files (default: data/batches)
+        """
+        batch_config = config_manager.config.batch
+        self.core = core
+        self.concurrency = max(1, concurrency or batch_config.concurrency)
+        self.max_retries = max(0, max_retries if max_retries is not None else batch_config.max_retries)
+        self.retry_delay = retry_delay if retry_delay is not None else batch_config.retry_delay
+        self.state_dir = Path(state_dir) if state_dir else Path(get_data_path("batches"))
+        
+        # State saves run in worker threads and may finish out of order:
+        # only the newest snapshot of each batch is written
+        self._save_lock = threading.Lock()
+        self._save_seq: Dict[str, int] = {}
+        self._written_seq: Dict[str, int] = {}
+    
+    # ========================================================================
+    # Batch state
+    # ========================================================================
+    
+    def get_state_path(self, batch_id: str) -> Path:
+        """Get batch state file path"""
+        return self.state_dir / f"{batch_id}.json"
+    
+    def create_batch(
+        self,
+        items: List[Dict[str, Any]],
+        batch_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create and persist a new batch
+        
+        Args:
+            items: generate_video parameters, one dict per video (must contain "text";
+                "pipeline" selects the pipeline). Non JSON-serializable values are
+                dropped: pass them to run() instead.
+            batch_id: Batch ID (auto-generated if None)
+            name: Optional display name
+        
+        Returns:
+            Batch state dict
+        
+        Raises:
+            ValueError: If an item has no "text"
+        """
+        for i, params in enumerate(items, 1):
+            if not params.get("text"):
+                raise ValueError(f"Batch item {i} has no 'text'")
+        
+        from pixelle_video.services.persistence import PersistenceService
+        
+        now = datetime.now().isoformat()
+        state = {
+            "batch_id": batch_id or create_task_id(),
+            "name": name,
+            "status": "pending",
+            "created_at": now,
+            "updated_at": now,
+            "items": [
+                {
+                    "index": i,
+                    "params": PersistenceService._json_safe_params(params),
+                    "status": "pending",
+                    "attempts": 0,
+                    "task_id": None,
+                    "video_path": None,
+                    "error": None,
+                    "traceback": None,
+                }
+                for i, params in enumerate(items, 1)
+            ],
+        }
+        self._write_state(state["batch_id"], *self._snapshot(state))
+        logger.info(f"📦 Created batch {state['batch_id']} ({len(items)} items)")
+        return state
+    
+    def load_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load batch state
+        
+        Args:
+            batch_id: Batch ID
+        
+        Returns:
+            Batch state dict, or None if not found
+        """
+        path = self.get_state_path(batch_id)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def list_batches(self) -> List[Dict[str, Any]]:
+        """
+        List persisted batches (newest first)
+        
+        Returns:
+            Batch summaries (see summarize), without per-item lists
+        """
+        batches = []
+        for path in sorted(self.state_dir.glob("*.json"), reverse=True):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read batch state {path.name}: {e}")
+                continue
+            summary = self.summarize(state)
+            summary.pop("results")
+            summary.pop("errors")
+            batches.append(summary)
+        return batches
+    
+    @staticmethod
+    def summarize(state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summarize batch state
+        
+        Returns:
+            {
+                "batch_id", "name", "status", "created_at", "updated_at",
+                "results": [successful items], "errors": [failed items],
+                "total_count", "success_count", "failed_count", "pending_count"
+            }
+        """
+        items = state["items"]
+        results = [item for item in items if item["status"] == "success"]
+        errors = [item for item in items if item["status"] == "failed"]
+        return {
+            "batch_id": state["batch_id"],
+            "name": state.get("name"),
+            "status": state["status"],
+            "created_at": state.get("created_at"),
+            "updated_at": state.get("updated_at"),
+            "results": results,
+            "errors": errors,
+            "total_count": len(items),
+            "success_count": len(results),
+            "failed_count": len(errors),
+            "pending_count": len(items) - len(results) - len(errors),
+        }
+    
+    def _snapshot(self, state: Dict[str, Any]) -> Tuple[int, bytes]:
+        """Serialize state on the event loop thread (items are mutated there)"""
+        batch_id = state["batch_id"]
+        state["updated_at"] = datetime.now().isoformat()
+        payload = json.dumps(state, ensure_ascii=False, indent=2).encode("utf-8")
+        with self._save_lock:
+            seq = self._save_seq.get(batch_id, 0) + 1
+            self._save_seq[batch_id] = seq
+        return seq, payload
+    
+    def _write_state(self, batch_id: str, seq: int, payload: bytes):
+        """Write a state snapshot unless a newer one was already written"""
+        with self._save_lock:
+            if self._written_seq.get(batch_id, 0) > seq:
+                return
+            atomic_write_bytes(str(self.get_state_path(batch_id)), payload)
+            self._written_seq[batch_id] = seq
+    
+    async def _save(self, state: Dict[str, Any]):
+        """Persist batch state without blocking the event loop"""
+        seq, payload = self._snapshot(state)
+        try:
+            await asyncio.to_thread(self._write_state, state["batch_id"], seq, payload)
+        except Exception as e:
+            logger.warning(f"Failed to save batch state {state['batch_id']}: {e}")
+    
+    # ========================================================================
+    # Execution
+    # ========================================================================
+    
+    async def run(
+        self,
+        batch: Union[str, Dict[str, Any]],
+        progress_callback_factory: Optional[Callable[[Dict[str, Any]], Optional[Callable]]] = None,
+        on_item_update: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        retry_failed: bool = True,
+        **overrides
+    ) -> Dict[str, Any]:
+        """
+        Run all unfinished items of a batch
+        
+        Items already succeeded are skipped, so this both starts a new batch and
+        resumes an interrupted one. Items left "running" by a crashed process are
+        run again.
+        
+        Args:
+            batch: Batch state (from create_batch) or batch ID
+            progress_callback_factory: Called with each item before it starts, returns
+                the progress_callback passed to generate_video (or None)
+            on_item_update: Called as (item, state) whenever an item starts or finishes
+            retry_failed: Also run items that failed in a previous run
+            **overrides: Extra generate_video parameters for every item (not
+                persisted, e.g. non-serializable objects)
+        
+        Returns:
+            Batch summary (see summarize)
+        
+        Raises:
+            ValueError: If the batch ID is unknown
+            RuntimeError: If the engine was created without a core
+        """
+        if self.core is None:
+            raise RuntimeError("BatchEngine needs a PixelleVideoCore to run batches")
+        
+        if isinstance(batch, str):
+            state = self.load_batch(batch)
+            if state is None:
+                raise ValueError(f"Batch not found: {batch}")
+        else:
+            state = batch
+        
+        runnable = {"pending", "running"} | ({"failed"} if retry_failed else set())
+        todo = [item for item in state["items"] if item["status"] in runnable]
+        batch_id = state["batch_id"]
+        
+        logger.info(
+            f"🚀 Running batch {batch_id}: {len(todo)}/{len(state['items'])} items "
+            f"(concurrency={self.concurrency}, max_retries={self.max_retries})"
+        )
+        
+        for item in todo:
+            item["status"] = "pending"
+        state["status"] = "running"
+        await self._save(state)
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run_item(item: Dict[str, Any]):
+            retries = 0
+            while True:
+                async with semaphore:
+                    success = await self._run_item_once(state, item, progress_callback_factory, on_item_update, overrides)
+                if success or retries >= self.max_retries:
+                    break
+                
+                # Back off outside the semaphore, so other items can use the slot
+                retries += 1
+                delay = self.retry_delay * (2 ** (retries - 1))
+                logger.warning(
+                    f"🔁 Batch item {item['index']} failed, retry {retries}/{self.max_retries} in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
+        
+        try:
+            await asyncio.gather(*(run_item(item) for item in todo))
+        except asyncio.CancelledError:
+            for item in state["items"]:
+                if item["status"] == "running":
+                    item["status"] = "pending"
+            state["status"] = "pending"
+            self._write_state(state["batch_id"], *self._snapshot(state))
+            logger.warning(f"⏸️  Batch {batch_id} cancelled, resume with run('{batch_id}')")
+            raise
+        
+        summary = self.summarize(state)
+        state["status"] = "completed" if summary["failed_count"] == 0 else "failed"
+        summary["status"] = state["status"]
+        await self._save(state)
+        
+        logger.info(
+            f"✅ Batch {batch_id} finished: {summary['success_count']}/{summary['total_count']} succeeded, "
+            f"{summary['failed_count']} failed"
+        )
+        return summary
+    
+    async def _run_item_once(
+        self,
+        state: Dict[str, Any],
+        item: Dict[str, Any],
+        progress_callback_factory: Optional[Callable],
+        on_item_update: Optional[Callable],
+        overrides: Dict[str, Any],
+    ) -> bool:
+        """Run one attempt of an item, record the outcome, return True on success"""
+        total = len(state["items"])
+        item["status"] = "running"
+        item["attempts"] += 1
+        item["error"] = None
+        item["traceback"] = None
+        await self._save(state)
+        self._notify(on_item_update, item, state)
+        
+        params = {**item["params"], **overrides}
+        if progress_callback_factory:
+            params["progress_callback"] = progress_callback_factory(item)
+        
+        try:
+            logger.info(f"🎬 Batch item {item['index']}/{total} started: {item['params']['text'][:50]}")
+            result = await self.core.generate_video(**params)
+            
+            item["status"] = "success"
+            item["video_path"] = result.video_path
+            # Task ID is the task directory name (output/{task_id}/final.mp4)
+            item["task_id"] = Path(result.video_path).parent.name
+            logger.info(f"✅ Batch item {item['index']}/{total} completed: {result.video_path}")
+        
+        except asyncio.CancelledError:
+            raise
+        
+        except Exception as e:
+            item["status"] = "failed"
+            item["error"] = str(e)
+            item["traceback"] = traceback.format_exc()
+            logger.error(f"❌ Batch item {item['index']}/{total} failed: {e}")
+            logger.debug(f"Error traceback:\n{item['traceback']}")
+        
+        await self._save(state)
+        self._notify(on_item_update, item, state)
+        return item["status"] == "success"
+    
+    @staticmethod
+    def _notify(callback: Optional[Callable], item: Dict[str, Any], state: Dict[str, Any]):
+        """Invoke a user callback; its errors never fail the batch"""
+        if not callback:
+            return
+        try:
+            callback(item, state)
+        except Exception as e:
+            logger.warning(f"Batch callback failed: {e}")
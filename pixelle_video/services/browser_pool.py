@@ -0,0 +1,517 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Headless Browser Pool - Persistent Chrome for HTML frame rendering
+
+Keeps a single long-lived headless Chrome process and a small pool of warm
+pages per viewport size. Pages are driven over the Chrome DevTools Protocol
+(CDP), and screenshots are returned as in-memory PNG bytes at the exact
+viewport size, so no per-frame browser spawn, CWD file shuffling or cropping
+is needed.
+
+Usage:
+    pool = await get_browser_pool(browser_executable="/usr/bin/chromium")
+    png_bytes = await pool.render_html(html, width=1080, height=1920)
+"""
+
+import asyncio
+import atexit
+import base64
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from loguru import logger
+
+
+# Maximum number of warm pages kept per (width, height) viewport
+_MAX_PAGES_PER_SIZE = 2
+
+# Timeouts (seconds)
+_BROWSER_START_TIMEOUT = 20.0
+_COMMAND_TIMEOUT = 30.0
+_PAGE_LOAD_TIMEOUT = 30.0
+
+# Executables to look for when no explicit browser path is given
+_BROWSER_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+]
+
+# Global pool (created per event loop)
+_browser_pool: Optional["BrowserPool"] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+class _CDPConnection:
+    """
+    Minimal CDP client over a single browser-level WebSocket
+
+    Uses flattened sessions (Target.attachToTarget with flatten=True), so every
+    page is addressed by its sessionId over the same connection.
+    """
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._waiters: Dict[Tuple[str, Optional[str]], List[asyncio.Future]] = {}
+
+    @property
+    def closed(self) -> bool:
+        return self._ws is None or self._ws.closed
+
+    async def connect(self):
+        """Open WebSocket connection and start the reader loop"""
+        self._session = aiohttp.ClientSession()
+        # max_msg_size=0 disables the limit (screenshots can be several MB)
+        self._ws = await self._session.ws_connect(self.ws_url, max_msg_size=0)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def send(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        timeout: float = _COMMAND_TIMEOUT
+    ) -> Dict[str, Any]:
+        """
+        Send CDP command and wait for its result
+
+        Raises:
+            RuntimeError: If the browser reports an error or the connection is closed
+        """
+        if self.closed:
+            raise RuntimeError("CDP connection is closed")
+
+        self._next_id += 1
+        message_id = self._next_id
+        message: Dict[str, Any] = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+
+        try:
+            await self._ws.send_str(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message_id, None)
+
+    def wait_event(self, method: str, session_id: Optional[str] = None) -> asyncio.Future:
+        """
+        Register a one-shot waiter for a CDP event
+
+        Must be called before the command that triggers the event.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault((method, session_id), []).append(future)
+        return future
+
+    async def _read_loop(self):
+        """Dispatch command results and events to their futures"""
+        try:
+            async for msg in self._ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+
+                data = json.loads(msg.data)
+
+                if "id" in data:
+                    future = self._pending.get(data["id"])
+                    if future is None or future.done():
+                        continue
+                    if "error" in data:
+                        error = data["error"]
+                        future.set_exception(RuntimeError(f"CDP error: {error.get('message')} ({error.get('code')})"))
+                    else:
+                        future.set_result(data.get("result", {}))
+                else:
+                    key = (data.get("method"), data.get("sessionId"))
+                    for future in self._waiters.pop(key, []):
+                        if not future.done():
+                            future.set_result(data.get("params", {}))
+        except Exception as e:
+            logger.debug(f"CDP reader stopped: {e}")
+        finally:
+            error = RuntimeError("CDP connection closed")
+            for future in list(self._pending.values()):
+                if not future.done():
+                    future.set_exception(error)
+            for futures in self._waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            self._waiters.clear()
+
+    async def close(self):
+        """Close WebSocket connection"""
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._session is not None:
+            await self._session.close()
+
+
+@dataclass
+class _PooledPage:
+    """A warm browser page bound to a fixed viewport size"""
+    target_id: str
+    session_id: str
+    width: int
+    height: int
+
+
+class BrowserPool:
+    """
+    Persistent headless Chrome with warm pages keyed by viewport size
+
+    - One Chrome process per pool (started lazily on first render)
+    - Up to `max_pages_per_size` pages per (width, height), reused across frames
+    - Renders straight to PNG bytes with a transparent default background
+    """
+
+    def __init__(
+        self,
+        browser_executable: Optional[str] = None,
+        flags: Optional[List[str]] = None,
+        max_pages_per_size: int = _MAX_PAGES_PER_SIZE
+    ):
+        """
+        Initialize browser pool (does not start the browser)
+
+        Args:
+            browser_executable: Chrome/Chromium executable (auto-detected if None)
+            flags: Extra Chrome command line flags
+            max_pages_per_size: Max warm pages per viewport size
+        """
+        self.browser_executable = browser_executable
+        self.flags = list(flags or [])
+        self.max_pages_per_size = max_pages_per_size
+
+        self._process: Optional[subprocess.Popen] = None
+        self._user_data_dir: Optional[str] = None
+        self._conn: Optional[_CDPConnection] = None
+        self._start_lock = asyncio.Lock()
+
+        self._idle_pages: Dict[Tuple[int, int], List[_PooledPage]] = {}
+        self._size_semaphores: Dict[Tuple[int, int], asyncio.Semaphore] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Check if browser process and CDP connection are alive"""
+        return (
+            self._process is not None
+            and self._process.poll() is None
+            and self._conn is not None
+            and not self._conn.closed
+        )
+
+    def _resolve_executable(self) -> str:
+        """Find Chrome executable (explicit > PATH > html2image lookup)"""
+        if self.browser_executable:
+            return self.browser_executable
+
+        for name in _BROWSER_CANDIDATES:
+            path = shutil.which(name)
+            if path:
+                return path
+
+        try:
+            from html2image.browsers.chrome import find_chrome
+            return find_chrome()
+        except Exception as e:
+            raise RuntimeError(f"No Chrome/Chromium executable found for browser pool: {e}")
+
+    async def start(self):
+        """Start Chrome (if not running) and connect over CDP"""
+        async with self._start_lock:
+            if self.is_running:
+                return
+
+            # Clean up a crashed browser before restarting
+            await self._shutdown()
+
+            executable = self._resolve_executable()
+            self._user_data_dir = tempfile.mkdtemp(prefix="pixelle_chrome_")
+
+            cmd = [
+                executable,
+                "--headless=new",
+                "--remote-debugging-port=0",
+                f"--user-data-dir={self._user_data_dir}",
+                *self.flags,
+                "about:blank",
+            ]
+
+            logger.debug(f"Starting pooled browser: {executable}")
+            self._process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+            ws_url = await self._wait_for_devtools_url()
+            self._conn = _CDPConnection(ws_url)
+            await self._conn.connect()
+
+            logger.info(f"✅ Browser pool started (pid={self._process.pid})")
+
+    async def _wait_for_devtools_url(self) -> str:
+        """Wait for Chrome to write DevToolsActivePort and build the browser WebSocket URL"""
+        port_file = Path(self._user_data_dir) / "DevToolsActivePort"
+        deadline = time.monotonic() + _BROWSER_START_TIMEOUT
+
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Browser exited during startup (code {self._process.returncode})")
+
+            if port_file.exists():
+                lines = port_file.read_text().strip().splitlines()
+                if len(lines) >= 2:
+                    return f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+
+            await asyncio.sleep(0.05)
+
+        raise RuntimeError(f"Browser did not expose DevTools within {_BROWSER_START_TIMEOUT}s")
+
+    async def _create_page(self, width: int, height: int) -> _PooledPage:
+        """Open a new page and configure its viewport"""
+        result = await self._conn.send("Target.createTarget", {"url": "about:blank"})
+        target_id = result["targetId"]
+
+        result = await self._conn.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        session_id = result["sessionId"]
+
+        await self._conn.send("Page.enable", session_id=session_id)
+        await self._conn.send(
+            "Emulation.setDeviceMetricsOverride",
+            {"width": width, "height": height, "deviceScaleFactor": 1, "mobile": False},
+            session_id=session_id
+        )
+        await self._conn.send(
+            "Emulation.setDefaultBackgroundColorOverride",
+            {"color": {"r": 0, "g": 0, "b": 0, "a": 0}},
+            session_id=session_id
+        )
+
+        logger.debug(f"Created pooled page {target_id[:8]} ({width}x{height})")
+        return _PooledPage(target_id=target_id, session_id=session_id, width=width, height=height)
+
+    async def _acquire(self, width: int, height: int) -> _PooledPage:
+        """Get a warm page for this viewport size (creates one if needed)"""
+        key = (width, height)
+        semaphore = self._size_semaphores.setdefault(key, asyncio.Semaphore(self.max_pages_per_size))
+        await semaphore.acquire()
+
+        try:
+            await self.start()
+            idle = self._idle_pages.setdefault(key, [])
+            if idle:
+                return idle.pop()
+            return await self._create_page(width, height)
+        except Exception:
+            semaphore.release()
+            raise
+
+    def _release(self, page: _PooledPage):
+        """Return page to the pool"""
+        key = (page.width, page.height)
+        self._idle_pages.setdefault(key, []).append(page)
+        self._size_semaphores[key].release()
+
+    async def _discard(self, page: _PooledPage):
+        """Close a page that failed and free its slot"""
+        key = (page.width, page.height)
+        try:
+            if self.is_running:
+                await self._conn.send("Target.closeTarget", {"targetId": page.target_id}, timeout=5.0)
+        except Exception as e:
+            logger.debug(f"Failed to close pooled page: {e}")
+        finally:
+            self._size_semaphores[key].release()
+
+    async def render_html(self, html: str, width: int, height: int) -> bytes:
+        """
+        Render HTML to PNG bytes at the exact viewport size
+
+        The HTML is loaded from a temp file (file:// origin) so relative and
+        file:// resources resolve the same way as with html2image.
+
+        Args:
+            html: Full HTML document
+            width: Viewport width in pixels
+            height: Viewport height in pixels
+
+        Returns:
+            PNG image bytes
+
+        Raises:
+            RuntimeError: If rendering fails
+        """
+        from pixelle_video.utils.os_util import get_temp_path
+
+        html_path = Path(get_temp_path(f"frame_{uuid.uuid4().hex[:16]}.html"))
+        html_path.write_text(html, encoding="utf-8")
+
+        page = await self._acquire(width, height)
+        try:
+            session_id = page.session_id
+
+            loaded = self._conn.wait_event("Page.loadEventFired", session_id)
+            await self._conn.send("Page.navigate", {"url": html_path.as_uri()}, session_id=session_id)
+            await asyncio.wait_for(loaded, _PAGE_LOAD_TIMEOUT)
+
+            # Make sure web fonts are ready before capturing
+            await self._conn.send(
+                "Runtime.evaluate",
+                {"expression": "document.fonts.ready.then(() => true)", "awaitPromise": True},
+                session_id=session_id
+            )
+
+            result = await self._conn.send(
+                "Page.captureScreenshot",
+                {
+                    "format": "png",
+                    "clip": {"x": 0, "y": 0, "width": width, "height": height, "scale": 1},
+                },
+                session_id=session_id
+            )
+            png_bytes = base64.b64decode(result["data"])
+        except Exception:
+            await self._discard(page)
+            raise
+        else:
+            self._release(page)
+            return png_bytes
+        finally:
+            try:
+                html_path.unlink()
+            except OSError:
+                pass
+
+    async def _shutdown(self):
+        """Close CDP connection, kill browser and remove its profile dir"""
+        if self._conn is not None:
+            try:
+                await self._conn.close()
+            except Exception as e:
+                logger.debug(f"Failed to close CDP connection: {e}")
+            self._conn = None
+
+        self.kill()
+        self._idle_pages.clear()
+
+    def kill(self):
+        """Terminate browser process synchronously (safe without a running loop)"""
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+            self._process = None
+
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+
+    async def close(self):
+        """Shut down the pool"""
+        async with self._start_lock:
+            await self._shutdown()
+        logger.info("Browser pool closed")
+
+
+async def get_browser_pool(
+    browser_executable: Optional[str] = None,
+    flags: Optional[List[str]] = None
+) -> BrowserPool:
+    """
+    Get or create the browser pool for the current event loop
+
+    The pool is process-wide but bound to one event loop (the CDP WebSocket
+    cannot be shared across loops). If called from a different loop, the old
+    browser is killed and a new pool is created.
+
+    Args:
+        browser_executable: Chrome/Chromium executable (only used on creation)
+        flags: Chrome command line flags (only used on creation)
+
+    Returns:
+        BrowserPool instance
+    """
+    global _browser_pool, _pool_loop, _pool_lock
+
+    current_loop = asyncio.get_running_loop()
+
+    if _pool_loop is not current_loop:
+        if _browser_pool is not None:
+            logger.debug("Event loop changed, restarting browser pool")
+            _browser_pool.kill()
+        _browser_pool = None
+        _pool_loop = current_loop
+        _pool_lock = asyncio.Lock()
+
+    async with _pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool(browser_executable=browser_executable, flags=flags)
+
+    return _browser_pool
+
+
+async def close_browser_pool():
+    """Close the global browser pool (if it belongs to the current event loop)"""
+    global _browser_pool, _pool_loop
+
+    if _browser_pool is None:
+        return
+
+    try:
+        if _pool_loop is asyncio.get_running_loop():
+            await _browser_pool.close()
+        else:
+            _browser_pool.kill()
+    finally:
+        _browser_pool = None
+        _pool_loop = None
+
+
+def _kill_browser_pool_at_exit():
+    """Make sure no orphan Chrome survives interpreter shutdown"""
+    if _browser_pool is not None:
+        _browser_pool.kill()
+
+
+atexit.register(_kill_browser_pool_at_exit)
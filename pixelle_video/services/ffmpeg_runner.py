@@ -0,0 +1,299 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Async FFmpeg Execution Layer
+
+Runs ffmpeg/ffprobe as asyncio subprocesses so encodes never block the event loop.
+
+Features:
+- Global worker limit (max concurrent ffmpeg processes per event loop)
+- Cancellation: cancelling the awaiting task kills the ffmpeg process
+- Streaming progress parsed from `-progress pipe:1`
+- Sync bridge for legacy callers (`run_sync`)
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, TypeVar, Union
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# Max concurrent ffmpeg processes (per event loop); ffmpeg is multi-threaded itself
+_max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+# Worker semaphores (one per event loop, dropped with the loop)
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# Number of stderr lines kept for error messages
+_STDERR_TAIL_LINES = 200
+
+
+class FFmpegError(RuntimeError):
+    """Raised when an ffmpeg/ffprobe process exits with a non-zero code"""
+    
+    def __init__(self, message: str, stderr: str = "", returncode: Optional[int] = None):
+        super().__init__(message)
+        self.stderr = stderr
+        self.returncode = returncode
+
+
+@dataclass
+class FFmpegProgress:
+    """Progress snapshot parsed from ffmpeg `-progress` output"""
+    out_time: float = 0.0  # Seconds of output written so far
+    frame: int = 0
+    fps: float = 0.0
+    speed: Optional[float] = None  # Encoding speed relative to realtime (e.g. 2.5x)
+    total_size: int = 0  # Bytes written so far
+    duration: Optional[float] = None  # Expected output duration (if known)
+    finished: bool = False
+    
+    @property
+    def percentage(self) -> Optional[float]:
+        """Progress in [0.0, 1.0] (None if expected duration is unknown)"""
+        if self.finished:
+            return 1.0
+        if not self.duration or self.duration <= 0:
+            return None
+        return min(1.0, max(0.0, self.out_time / self.duration))
+
+
+ProgressCallback = Callable[[FFmpegProgress], Union[None, Awaitable[None]]]
+
+
+def set_max_workers(max_workers: int):
+    """
+    Set the max number of concurrent ffmpeg processes
+    
+    Applies to semaphores created afterwards (i.e. new event loops and the
+    current one if it has not run ffmpeg yet).
+    
+    Args:
+        max_workers: Max concurrent ffmpeg processes (>= 1)
+    """
+    global _max_workers
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    _max_workers = max_workers
+    _semaphores.clear()
+    logger.debug(f"FFmpeg worker limit set to {max_workers}")
+
+
+def get_max_workers() -> int:
+    """Get the max number of concurrent ffmpeg processes"""
+    return _max_workers
+
+
+def _get_worker_semaphore() -> asyncio.Semaphore:
+    """Get or create worker semaphore for current event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_max_workers)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def _parse_float(value: str) -> Optional[float]:
+    """Parse ffmpeg progress value ("N/A", "1.5x", ...) as float"""
+    try:
+        return float(value.rstrip("x"))
+    except (ValueError, AttributeError):
+        return None
+
+
+async def _emit_progress(callback: ProgressCallback, progress: FFmpegProgress):
+    """Invoke sync or async progress callback, never letting it break the encode"""
+    try:
+        result = callback(progress)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.warning(f"FFmpeg progress callback failed: {e}")
+
+
+async def _read_progress(
+    stream: asyncio.StreamReader,
+    callback: Optional[ProgressCallback],
+    duration: Optional[float]
+):
+    """Parse `key=value` blocks from `-progress pipe:1` and report each block"""
+    progress = FFmpegProgress(duration=duration)
+    
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        
+        key, _, value = line.decode("utf-8", errors="replace").strip().partition("=")
+        
+        if key == "out_time_us" or key == "out_time_ms":
+            # Both are microseconds (out_time_ms is misnamed in ffmpeg)
+            micros = _parse_float(value)
+            if micros is not None:
+                progress.out_time = micros / 1_000_000
+        elif key == "frame":
+            progress.frame = int(_parse_float(value) or 0)
+        elif key == "fps":
+            progress.fps = _parse_float(value) or 0.0
+        elif key == "speed":
+            progress.speed = _parse_float(value)
+        elif key == "total_size":
+            progress.total_size = int(_parse_float(value) or 0)
+        elif key == "progress":
+            # End of a progress block
+            progress.finished = (value == "end")
+            if callback:
+                await _emit_progress(callback, FFmpegProgress(**progress.__dict__))
+
+
+async def _read_stderr(stream: asyncio.StreamReader, tail: deque):
+    """Drain stderr (prevents pipe deadlock), keeping the last lines for errors"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        tail.append(line.decode("utf-8", errors="replace"))
+
+
+async def run_ffmpeg(
+    args: List[str],
+    progress_callback: Optional[ProgressCallback] = None,
+    duration: Optional[float] = None,
+    description: str = "ffmpeg"
+) -> None:
+    """
+    Run ffmpeg asynchronously under the global worker limit
+    
+    Args:
+        args: ffmpeg arguments (without the leading "ffmpeg")
+        progress_callback: Optional callback (sync or async) receiving FFmpegProgress
+        duration: Expected output duration in seconds (enables progress percentage)
+        description: Short label for logs and error messages
+    
+    Raises:
+        FFmpegError: If ffmpeg exits with a non-zero code
+        asyncio.CancelledError: If cancelled (the ffmpeg process is killed)
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-nostats", "-progress", "pipe:1", *args]
+    
+    async with _get_worker_semaphore():
+        logger.debug(f"Running {description}: {' '.join(cmd)}")
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+        try:
+            await asyncio.gather(
+                _read_progress(process.stdout, progress_callback, duration),
+                _read_stderr(process.stderr, stderr_tail)
+            )
+            returncode = await process.wait()
+        finally:
+            # Cancelled (or reader failed) while ffmpeg is still running: kill it
+            if process.returncode is None:
+                logger.warning(f"Killing {description} (pid={process.pid})")
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+    
+    if returncode != 0:
+        stderr = "".join(stderr_tail)
+        raise FFmpegError(
+            f"{description} exited with code {returncode}: {stderr}",
+            stderr=stderr,
+            returncode=returncode
+        )
+
+
+async def probe(path: str) -> Dict[str, Any]:
+    """
+    Probe media file asynchronously (same output as ffmpeg.probe)
+    
+    Probes are cheap and do not count against the ffmpeg worker limit.
+    
+    Args:
+        path: Media file path
+    
+    Returns:
+        ffprobe JSON output with "format" and "streams"
+    
+    Raises:
+        FFmpegError: If ffprobe fails
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffprobe", "-v", "error", "-show_format", "-show_streams", "-of", "json", path,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    try:
+        stdout, stderr = await process.communicate()
+    finally:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+    
+    if process.returncode != 0:
+        error_msg = stderr.decode("utf-8", errors="replace")
+        raise FFmpegError(f"ffprobe failed for {path}: {error_msg}", stderr=error_msg, returncode=process.returncode)
+    
+    return json.loads(stdout.decode("utf-8"))
+
+
+_sync_executor: Optional[ThreadPoolExecutor] = None
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code
+    
+    Without a running loop this is asyncio.run(). When called from inside a
+    running loop (legacy sync call sites), the coroutine runs on a private
+    loop in a worker thread and the caller blocks as before.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        Coroutine result
+    """
+    global _sync_executor
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    if _sync_executor is None:
+        _sync_executor = ThreadPoolExecutor(thread_name_prefix="ffmpeg-sync")
+    return _sync_executor.submit(asyncio.run, coro).result()
@@ -26,8 +26,10 @@ Linux Environment Requirements:
 from math import log
 import os
 import re
+import threading
 import uuid
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from html2image import Html2Image
 from loguru import logger
@@ -36,6 +38,148 @@ from PIL import Image
 from pixelle_video.utils.template_util import parse_template_size
 
 
+# Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
+# Param name: must start with letter or underscore, can contain letters, digits, underscores
+PARAM_PATTERN = re.compile(r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}')
+
+# Preset parameters that should be ignored (auto-injected by system)
+PRESET_PARAMS = {'title', 'text', 'image', 'index'}
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    Template pre-split into literal and placeholder segments
+    
+    Rendering is a single pass over ``segments`` followed by one join,
+    instead of a regex scan of the whole HTML per frame.
+    """
+    path: str
+    mtime_ns: int
+    source: str
+    # str -> literal HTML, (name, default_str) -> placeholder
+    segments: List[Union[str, Tuple[str, Optional[str]]]]
+    width: int
+    height: int
+    # (name, type, default_str) of each custom (non-preset) parameter, first occurrence wins
+    param_specs: List[Tuple[str, str, Optional[str]]] = field(default_factory=list)
+    # Lazily parsed (BeautifulSoup is only needed for the meta tags)
+    media_size: Optional[Tuple[Optional[int], Optional[int]]] = None
+    
+    def render(self, values: Dict[str, Any]) -> str:
+        """Substitute placeholder values (see HTMLFrameGenerator._replace_parameters)"""
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            
+            param_name, default_value_str = segment
+            if param_name in values:
+                value = values[param_name]
+                # Convert bool to string for HTML
+                if isinstance(value, bool):
+                    parts.append('true' if value else 'false')
+                else:
+                    parts.append(str(value) if value is not None else '')
+            elif default_value_str:
+                parts.append(default_value_str)
+        
+        return ''.join(parts)
+
+
+def _compile_template(path: str, mtime_ns: int, source: str) -> CompiledTemplate:
+    """Split template source into literal/placeholder segments and collect parameters"""
+    segments = []
+    param_specs = []
+    seen = set()
+    position = 0
+    
+    for match in PARAM_PATTERN.finditer(source):
+        if match.start() > position:
+            segments.append(source[position:match.start()])
+        
+        param_name = match.group(1)
+        param_type = match.group(2) or 'text'  # Default to text
+        default_value = match.group(3)
+        segments.append((param_name, default_value))
+        position = match.end()
+        
+        if param_name not in PRESET_PARAMS and param_name not in seen:
+            seen.add(param_name)
+            param_specs.append((param_name, param_type, default_value))
+    
+    if position < len(source):
+        segments.append(source[position:])
+    
+    width, height = parse_template_size(path)
+    
+    return CompiledTemplate(
+        path=path,
+        mtime_ns=mtime_ns,
+        source=source,
+        segments=segments,
+        width=width,
+        height=height,
+        param_specs=param_specs,
+    )
+
+
+# Process-wide compiled template cache: absolute path -> CompiledTemplate
+_template_cache: Dict[str, CompiledTemplate] = {}
+_template_cache_lock = threading.Lock()
+
+
+def get_compiled_template(template_path: str) -> CompiledTemplate:
+    """
+    Get compiled template from the process-wide cache
+    
+    Entries are keyed by path and invalidated when the file's mtime changes,
+    so edited templates are picked up without restarting.
+    
+    Args:
+        template_path: Path to HTML template file
+    
+    Returns:
+        CompiledTemplate instance
+    
+    Raises:
+        FileNotFoundError: If template file does not exist
+    """
+    path = Path(template_path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}")
+    
+    cache_key = str(path.resolve())
+    
+    with _template_cache_lock:
+        compiled = _template_cache.get(cache_key)
+        if compiled is not None and compiled.mtime_ns == mtime_ns:
+            return compiled
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    compiled = _compile_template(template_path, mtime_ns, content)
+    logger.debug(
+        f"Template compiled: {template_path} ({len(content)} chars, "
+        f"{len(compiled.segments)} segments)"
+    )
+    
+    with _template_cache_lock:
+        _template_cache[cache_key] = compiled
+    
+    return compiled
+
+
+def clear_template_cache():
+    """Drop all compiled templates (e.g. after bulk template changes)"""
+    with _template_cache_lock:
+        _template_cache.clear()
+
+
 class HTMLFrameGenerator:
     """
     HTML-based frame generator
@@ -60,6 +204,30 @@ class HTMLFrameGenerator:
     # This is a temporary workaround until the issue is fixed in Chromium.
     CHROMIUM_HEIGHT_OFFSET = 87
     
+    # Render through the persistent headless browser pool (falls back to html2image on failure)
+    USE_BROWSER_POOL = True
+    
+    # Chrome flags for Linux headless environment (shared by html2image and the browser pool)
+    CHROME_FLAGS = [
+        '--default-background-color=00000000',
+        '--no-sandbox',  # Bypass AppArmor/sandbox restrictions
+        '--disable-dev-shm-usage',  # Avoid shared memory issues
+        '--disable-gpu',  # Disable GPU acceleration
+        '--disable-software-rasterizer',  # Disable software rasterizer
+        '--disable-extensions',  # Disable extensions
+        '--disable-setuid-sandbox',  # Additional sandbox bypass
+        '--disable-dbus',  # Disable DBus to avoid permission errors
+        '--hide-scrollbars',  # Hide scrollbars for cleaner output
+        '--mute-audio',  # Mute audio
+        '--disable-background-networking',  # Disable background networking
+        '--disable-features=TranslateUI',  # Disable translate UI
+        '--disable-ipc-flooding-protection',  # Improve performance
+        '--no-first-run',  # Skip first run dialogs
+        '--no-default-browser-check',  # Skip default browser check
+        '--disable-backgrounding-occluded-windows',  # Improve performance
+        '--disable-renderer-backgrounding',  # Improve performance
+    ]
+    
     def __init__(self, template_path: str):
         """
         Initialize HTML frame generator
@@ -68,20 +236,26 @@ class HTMLFrameGenerator:
             template_path: Path to HTML template file (e.g., "templates/1080x1920/default.html")
         """
         self.template_path = template_path
-        self.template = self._load_template(template_path)
         
-        # Parse video size from template path
-        self.width, self.height = parse_template_size(template_path)
+        # Compiled template is shared process-wide (re-read only when the file changes)
+        self._compiled = get_compiled_template(template_path)
+        self.template = self._compiled.source
+        
+        # Video size parsed from template path (cached with the template)
+        self.width, self.height = self._compiled.width, self._compiled.height
         
         self.hti = None  # Lazy init to avoid overhead
         self._check_linux_dependencies()
         logger.debug(f"Loaded HTML template: {template_path} (size: {self.width}x{self.height})")
     
+    # fc-list only needs to run once per process
+    _linux_dependencies_checked = False
     
     def _check_linux_dependencies(self):
         """Check Linux system dependencies and warn if missing"""
-        if os.name != 'posix':
+        if os.name != 'posix' or HTMLFrameGenerator._linux_dependencies_checked:
             return
+        HTMLFrameGenerator._linux_dependencies_checked = True
         
         try:
             import subprocess
@@ -114,18 +288,6 @@ class HTMLFrameGenerator:
         except Exception as e:
             logger.debug(f"Could not check fontconfig status: {e}")
     
-    def _load_template(self, template_path: str) -> str:
-        """Load HTML template from file"""
-        path = Path(template_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        logger.debug(f"Template loaded: {len(content)} chars")
-        return content
-    
     def _parse_media_size_from_meta(self) -> tuple[Optional[int], Optional[int]]:
         """
         Parse media size from meta tags in template
@@ -169,7 +331,10 @@ class HTMLFrameGenerator:
         Returns:
             Tuple of (width, height)
         """
-        media_width, media_height = self._parse_media_size_from_meta()
+        # Meta tags are parsed once per compiled template
+        if self._compiled.media_size is None:
+            self._compiled.media_size = self._parse_media_size_from_meta()
+        media_width, media_height = self._compiled.media_size
         
         if media_width and media_height:
             return media_width, media_height
@@ -200,28 +365,10 @@ class HTMLFrameGenerator:
                 }
             }
         """
-        # Preset parameters that should be ignored (auto-injected by system)
-        PRESET_PARAMS = {'title', 'text', 'image', 'index'}
-        
-        # Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
-        # Param name: must start with letter or underscore, can contain letters, digits, underscores
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
-        
         params = {}
         
-        for match in re.finditer(PARAM_PATTERN, self.template):
-            param_name = match.group(1)
-            param_type = match.group(2) or 'text'  # Default to text
-            default_value = match.group(3)
-            
-            # Skip preset parameters
-            if param_name in PRESET_PARAMS:
-                continue
-            
-            # Skip if already parsed (use first occurrence)
-            if param_name in params:
-                continue
-            
+        # Placeholders were collected at compile time (presets skipped, first occurrence wins)
+        for param_name, param_type, default_value in self._compiled.param_specs:
             # Validate type
             if param_type not in {'text', 'number', 'color', 'bool'}:
                 logger.warning(f"Unknown parameter type '{param_type}' for '{param_name}', defaulting to 'text'")
@@ -302,7 +449,9 @@ class HTMLFrameGenerator:
         Returns:
             HTML with placeholders replaced
         """
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
+        # Fast path: the template itself is already pre-split into segments
+        if html is self.template:
+            return self._compiled.render(values)
         
         def replacer(match):
             param_name = match.group(1)
@@ -325,7 +474,7 @@ class HTMLFrameGenerator:
             else:
                 return ''
         
-        return re.sub(PARAM_PATTERN, replacer, html)
+        return PARAM_PATTERN.sub(replacer, html)
     
     def _find_chrome_executable(self) -> Optional[str]:
         """
@@ -384,25 +533,7 @@ class HTMLFrameGenerator:
         """Lazily initialize Html2Image instance"""
         if self.hti is None:
             # Configure Chrome flags for Linux headless environment
-            custom_flags = [
-                '--default-background-color=00000000',
-                '--no-sandbox',  # Bypass AppArmor/sandbox restrictions
-                '--disable-dev-shm-usage',  # Avoid shared memory issues
-                '--disable-gpu',  # Disable GPU acceleration
-                '--disable-software-rasterizer',  # Disable software rasterizer
-                '--disable-extensions',  # Disable extensions
-                '--disable-setuid-sandbox',  # Additional sandbox bypass
-                '--disable-dbus',  # Disable DBus to avoid permission errors
-                '--hide-scrollbars',  # Hide scrollbars for cleaner output
-                '--mute-audio',  # Mute audio
-                '--disable-background-networking',  # Disable background networking
-                '--disable-features=TranslateUI',  # Disable translate UI
-                '--disable-ipc-flooding-protection',  # Improve performance
-                '--no-first-run',  # Skip first run dialogs
-                '--no-default-browser-check',  # Skip default browser check
-                '--disable-backgrounding-occluded-windows',  # Improve performance
-                '--disable-renderer-backgrounding',  # Improve performance
-            ]
+            custom_flags = list(self.CHROME_FLAGS)
             
             # Try to find non-snap browser
             browser_path = self._find_chrome_executable()
@@ -425,6 +556,27 @@ class HTMLFrameGenerator:
             else:
                 logger.debug(f"Initialized Html2Image with size ({width}, {height}) and {len(custom_flags)} custom flags")
     
+    async def _render_with_pool(self, html: str) -> bytes:
+        """
+        Render HTML with the persistent browser pool
+        
+        Reuses a warm page of the template's size, so no Chrome process is
+        spawned per frame and no CHROMIUM_HEIGHT_OFFSET crop is needed
+        (the screenshot is clipped to the exact viewport).
+        
+        Returns:
+            PNG image bytes
+        """
+        from pixelle_video.services.browser_pool import get_browser_pool
+        
+        pool = await get_browser_pool(flags=self.CHROME_FLAGS)
+        
+        # Resolve browser only when the pool (re)starts, prefer non-snap Chrome
+        if not pool.is_running and pool.browser_executable is None:
+            pool.browser_executable = self._find_chrome_executable()
+        
+        return await pool.render_html(html, self.width, self.height)
+    
     async def generate_frame(
         self,
         title: str,
@@ -489,6 +641,18 @@ class HTMLFrameGenerator:
             import os
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
+        # Render through the warm browser pool (exact viewport, PNG kept in memory)
+        if self.USE_BROWSER_POOL:
+            try:
+                png_bytes = await self._render_with_pool(html)
+                with open(output_path, 'wb') as f:
+                    f.write(png_bytes)
+                
+                logger.info(f"✅ Frame generated: {output_path}")
+                return output_path
+            except Exception as e:
+                logger.warning(f"Browser pool rendering failed, falling back to html2image: {e}")
+        
         # Extract filename from output_path for html2image
         import os
         output_filename = os.path.basename(output_path)
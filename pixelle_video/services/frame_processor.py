@@ -14,23 +14,35 @@
 Frame processor - Process single frame through complete pipeline
 
 Orchestrates: TTS → Image Generation → Frame Composition → Video Segment
+(TTS and image generation run concurrently when the workflow allows it)
 
 Key Feature:
 - TTS-driven video duration: Audio duration from TTS is passed to video generation workflows
   to ensure perfect sync between audio and video (no padding, no trimming needed)
 """
 
-from typing import Callable, Optional
+import asyncio
+import os
+import weakref
+from typing import Callable, Dict, Optional, Tuple
 
-import httpx
 from loguru import logger
 
+from pixelle_video.config import config_manager
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig
 
 
 class FrameProcessor:
-    """Frame processor"""
+    """
+    Frame processor
+    
+    Each step runs under a per-stage concurrency limit (config `concurrency`:
+    tts / media / compose / encode), so many frames can be processed at once
+    while every stage stays within its own budget.
+    """
+    
+    STAGES = ("tts", "media", "compose", "encode")
     
     def __init__(self, pixelle_video_core):
         """
@@ -40,6 +52,33 @@ class FrameProcessor:
             pixelle_video_core: PixelleVideoCore instance
         """
         self.core = pixelle_video_core
+        
+        # Stage semaphores per event loop: loop -> {stage: (limit, semaphore)}
+        self._stage_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Tuple[int, asyncio.Semaphore]]]" = weakref.WeakKeyDictionary()
+    
+    def stage(self, stage: str) -> asyncio.Semaphore:
+        """
+        Get semaphore limiting concurrent frames in a stage
+        
+        Limits are read from config on every call, so changes apply to new
+        work without restarting (frames already inside a stage finish normally).
+        
+        Args:
+            stage: One of STAGES
+        
+        Returns:
+            asyncio.Semaphore for the current event loop
+        """
+        limit = getattr(config_manager.config.concurrency, stage)
+        loop = asyncio.get_running_loop()
+        
+        semaphores = self._stage_semaphores.setdefault(loop, {})
+        current = semaphores.get(stage)
+        if current is None or current[0] != limit:
+            current = (limit, asyncio.Semaphore(limit))
+            semaphores[stage] = current
+        
+        return current[1]
     
     async def __call__(
         self,
@@ -52,11 +91,14 @@ class FrameProcessor:
         """
         Process single frame through complete pipeline
         
-        Steps:
+        Steps (run as a small dependency graph, not strictly in sequence):
         1. Generate audio (TTS)
-        2. Generate image (ComfyKit)
-        3. Compose frame (add subtitle)
-        4. Create video segment (image + audio)
+        2. Generate image (ComfyKit) - concurrent with 1, unless the media
+           workflow generates video (it needs the audio duration)
+        3. Compose frame (add subtitle) - as soon as media is ready
+        4. Create video segment (image + audio) - once 1 and 3 are done
+        
+        Progress events are the same as for the sequential flow (step 1-4).
         
         Args:
             frame: Storyboard frame to process
@@ -77,34 +119,44 @@ class FrameProcessor:
         has_existing_media = frame.image_path is not None or frame.video_path is not None
         needs_generation = frame.image_prompt is not None
         
-        try:
+        # Media generated by an earlier run of this frame (resumed pipeline)
+        if needs_generation and self._has_generated_media(frame):
+            logger.debug(f"  Reusing media generated by a previous run for frame {frame.index}")
+            needs_generation = False
+        
+        # Video workflows use the audio duration as target length, so media must wait for TTS
+        media_needs_audio = needs_generation and self._is_video_workflow(config)
+        
+        def report(progress: float, step: int, action: str):
+            if progress_callback:
+                progress_callback(ProgressEvent(
+                    event_type="frame_step",
+                    progress=progress,
+                    frame_current=frame_num,
+                    frame_total=total_frames,
+                    step=step,
+                    action=action
+                ))
+        
+        async def audio_branch():
             # Step 1: Generate audio (TTS)
             if not frame.audio_path:
-                if progress_callback:
-                    progress_callback(ProgressEvent(
-                        event_type="frame_step",
-                        progress=0.0,
-                        frame_current=frame_num,
-                        frame_total=total_frames,
-                        step=1,
-                        action="audio"
-                    ))
-                await self._step_generate_audio(frame, config)
+                report(0.0, 1, "audio")
+                async with self.stage("tts"):
+                    await self._step_generate_audio(frame, config)
             else:
                 logger.debug(f"  1/4: Using existing audio: {frame.audio_path}")
-            
+                if not frame.duration:
+                    frame.duration = await self._get_audio_duration(frame.audio_path)
+        
+        async def media_branch(audio_task: Optional[asyncio.Task]):
             # Step 2: Generate media (image or video, conditional)
             if needs_generation:
-                if progress_callback:
-                    progress_callback(ProgressEvent(
-                        event_type="frame_step",
-                        progress=0.25,
-                        frame_current=frame_num,
-                        frame_total=total_frames,
-                        step=2,
-                        action="media"
-                    ))
-                await self._step_generate_media(frame, config)
+                if audio_task is not None:
+                    await audio_task
+                report(0.25, 2, "media")
+                async with self.stage("media"):
+                    await self._step_generate_media(frame, config)
             elif has_existing_media:
                 # Log appropriate message based on media type
                 if frame.video_path:
@@ -115,39 +167,47 @@ class FrameProcessor:
                 frame.image_path = None
                 frame.media_type = None
                 logger.debug(f"  2/4: Skipped media generation (not required by template)")
-        
-            # Step 3: Compose frame (add subtitle)
-            if progress_callback:
-                progress_callback(ProgressEvent(
-                    event_type="frame_step",
-                    progress=0.50 if (needs_generation or has_existing_media) else 0.33,
-                    frame_current=frame_num,
-                    frame_total=total_frames,
-                    step=3,
-                    action="compose"
-                ))
-            await self._step_compose_frame(frame, storyboard, config)
             
-            # Step 4: Create video segment
-            if progress_callback:
-                progress_callback(ProgressEvent(
-                    event_type="frame_step",
-                    progress=0.75 if (needs_generation or has_existing_media) else 0.67,
-                    frame_current=frame_num,
-                    frame_total=total_frames,
-                    step=4,
-                    action="video"
-                ))
+            # Step 3: Compose frame (add subtitle) - only depends on media
+            report(0.50 if (needs_generation or has_existing_media) else 0.33, 3, "compose")
+            async with self.stage("compose"):
+                await self._step_compose_frame(frame, storyboard, config)
+        
+        audio_task = asyncio.create_task(audio_branch())
+        media_task = asyncio.create_task(media_branch(audio_task if media_needs_audio else None))
+        
+        try:
+            await asyncio.gather(audio_task, media_task)
             
-            await self._step_create_video_segment(frame, config)
+            # Step 4: Create video segment (needs audio + composed frame)
+            report(0.75 if (needs_generation or has_existing_media) else 0.67, 4, "video")
+            async with self.stage("encode"):
+                await self._step_create_video_segment(frame, config)
             
             logger.info(f"✅ Frame {frame.index} completed")
             return frame
 
-        except Exception as e:
-            logger.error(f"❌ Failed to process frame {frame.index}: {e}")
+        except BaseException as e:
+            # Stop the sibling branch if one failed (or we were cancelled)
+            for task in (audio_task, media_task):
+                task.cancel()
+            await asyncio.gather(audio_task, media_task, return_exceptions=True)
+            
+            if isinstance(e, Exception):
+                logger.error(f"❌ Failed to process frame {frame.index}: {e}")
             raise
     
+    @staticmethod
+    def _has_generated_media(frame: StoryboardFrame) -> bool:
+        """Check whether the frame's media file was already generated"""
+        media_path = frame.video_path if frame.media_type == "video" else frame.image_path
+        return bool(media_path) and os.path.exists(media_path)
+    
+    def _is_video_workflow(self, config: StoryboardConfig) -> bool:
+        """Check whether the media workflow generates video (video_ prefix in workflow name)"""
+        workflow_name = config.media_workflow or ""
+        return "video_" in workflow_name.lower()
+    
     async def _step_generate_audio(
         self,
         frame: StoryboardFrame,
@@ -187,10 +247,11 @@ class FrameProcessor:
         
         audio_path = await self.core.tts(**tts_params)
         
+        # Get audio duration; audio_path is only set together with it, so a
+        # checkpoint never holds audio without its duration
+        duration = await self._get_audio_duration(audio_path)
         frame.audio_path = audio_path
-        
-        # Get audio duration
-        frame.duration = await self._get_audio_duration(audio_path)
+        frame.duration = duration
         
         logger.debug(f"  ✓ Audio generated: {audio_path} ({frame.duration:.2f}s)")
     
@@ -205,7 +266,7 @@ class FrameProcessor:
         # Determine media type based on workflow
         # video_ prefix in workflow name indicates video generation
         workflow_name = config.media_workflow or ""
-        is_video_workflow = "video_" in workflow_name.lower()
+        is_video_workflow = self._is_video_workflow(config)
         media_type = "video" if is_video_workflow else "image"
         
         logger.debug(f"  → Media type: {media_type} (workflow: {workflow_name})")
@@ -347,41 +408,28 @@ class FrameProcessor:
         
         # Branch based on media type
         if frame.media_type == "video":
-            # Video workflow: overlay HTML template on video, then add audio
+            # Video workflow: overlay HTML template on video and add audio in one encode
             logger.debug(f"  → Using video-based composition with HTML overlay")
             
-            # Step 1: Overlay transparent HTML image on video
-            # The composed_image_path contains the rendered HTML with transparent background
-            temp_video_with_overlay = get_task_frame_path(config.task_id, frame.index, "video") + "_overlay.mp4"
-            
-            video_service.overlay_image_on_video(
+            # The composed_image_path contains the rendered HTML with transparent background.
+            # Scale, overlay, duration adjustment and narration audio are fused into a
+            # single ffmpeg pass (no intermediate overlay/padded/trimmed files).
+            segment_path = await video_service.compose_video_segment_async(
                 video=frame.video_path,
                 overlay_image=frame.composed_image_path,
-                output=temp_video_with_overlay,
-                scale_mode="contain"  # Scale video to fit template size (contain mode)
-            )
-            
-            # Step 2: Add narration audio to the overlaid video
-            # Note: The video might have audio (replaced) or be silent (audio added)
-            segment_path = video_service.merge_audio_video(
-                video=temp_video_with_overlay,
                 audio=frame.audio_path,
                 output=output_path,
-                replace_audio=True,  # Replace video audio with narration
-                audio_volume=1.0
+                scale_mode="contain",  # Scale video to fit template size (contain mode)
+                audio_volume=1.0,
+                fps=config.video_fps  # Same fps as image segments (copy-compatible concat)
             )
-            
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_video_with_overlay):
-                os.unlink(temp_video_with_overlay)
         
         elif frame.media_type == "image" or frame.media_type is None:
             # Image workflow: Use composed image directly
             # The asset_default.html template includes the image in the composition
             logger.debug(f"  → Using image-based composition")
             
-            segment_path = video_service.create_video_from_image(
+            segment_path = await video_service.create_video_from_image_async(
                 image=frame.composed_image_path,
                 audio=frame.audio_path,
                 output=output_path,
@@ -398,11 +446,12 @@ class FrameProcessor:
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration in seconds"""
         try:
-            # Try using ffmpeg-python
-            import ffmpeg
-            probe = ffmpeg.probe(audio_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            # Shared probe cache (VideoService reuses the same result when encoding)
+            from pixelle_video.services.media_info import get_media_info
+            info = await get_media_info(audio_path)
+            if info.duration is None:
+                raise ValueError(f"No duration in probe result for {audio_path}")
+            return info.duration
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
@@ -423,23 +472,17 @@ class FrameProcessor:
         from pixelle_video.utils.os_util import get_task_frame_path
         output_path = get_task_frame_path(task_id, frame_index, media_type)
         
-        timeout = httpx.Timeout(connect=10.0, read=60, write=60, pool=60)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-        
-        return output_path
+        # Shared pooled client: streamed to disk, resumed on transient errors
+        return await self.core.http.download(url, output_path)
     
     async def _get_video_duration(self, video_path: str) -> float:
         """Get video duration in seconds"""
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(video_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            from pixelle_video.services.media_info import get_media_info
+            info = await get_media_info(video_path)
+            if info.duration is None:
+                raise ValueError(f"No duration in probe result for {video_path}")
+            return info.duration
         except Exception as e:
             logger.warning(f"Failed to get video duration: {e}, using audio duration")
             # Fallback: use audio duration if available
@@ -105,6 +105,31 @@ class HistoryManager:
             "storyboard": storyboard,
         }
     
+    async def get_task_summary(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get task summary for listings (no storyboard frames, no full input)
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            {
+                "metadata": {...},      # Status, timestamps, result, title, text_preview
+                "storyboard": {...}     # Storyboard fields without frames, n_frames (if available)
+            }
+            or None if task not found
+        """
+        metadata = await self.persistence.load_task_summary(task_id)
+        if not metadata:
+            return None
+        
+        storyboard = await self.persistence.load_storyboard_header(task_id)
+        
+        return {
+            "metadata": metadata,
+            "storyboard": storyboard,
+        }
+    
     async def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about all tasks
@@ -167,9 +192,9 @@ class HistoryManager:
         
         return input_params
     
-    async def rebuild_index(self):
+    async def rebuild_index(self, full: bool = False) -> Dict[str, int]:
         """Rebuild task index (useful for maintenance or after manual changes)"""
-        await self.persistence.rebuild_index()
+        return await self.persistence.rebuild_index(full=full)
     
     # ========================================================================
     # Future Extensions (Phase 3)
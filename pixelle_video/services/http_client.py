@@ -0,0 +1,262 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared HTTP Client
+
+One pooled httpx.AsyncClient per event loop (owned by PixelleVideoCore), used
+for downloading generated media (images, videos, audio) and for fetching small
+result artifacts (e.g. RunningHub raw_data text files).
+
+Features:
+- Connection pooling / keep-alive (no TLS handshake per frame)
+- Chunked streaming to disk (files are never held in memory)
+- Resumable downloads via HTTP Range requests on transient failures
+- Bounded concurrency per host
+- In-flight dedupe of small text fetches (concurrent requests for one URL share one GET)
+"""
+
+import asyncio
+import os
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+
+class HTTPClient:
+    """
+    Shared pooled HTTP client
+    
+    Usage:
+        >>> http = HTTPClient()
+        >>> path = await http.download("https://example.com/image.png", "output/image.png")
+        >>> text = await http.fetch_text("https://example.com/result.txt")
+        >>> await http.close()
+    """
+    
+    def __init__(
+        self,
+        max_connections: int = 32,
+        max_per_host: int = 4,
+        chunk_size: int = 1024 * 1024,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Initialize HTTP client
+        
+        Args:
+            max_connections: Max pooled connections in total
+            max_per_host: Max concurrent downloads per host
+            chunk_size: Streaming chunk size in bytes
+            max_retries: Max retries (resumed with Range requests) on transient errors
+            retry_delay: Base delay between retries in seconds (exponential backoff)
+        """
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        
+        # httpx connection pools are bound to the event loop that created them
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._inflight_texts: Dict[str, asyncio.Task] = {}
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get pooled client for the current event loop (created on first use)"""
+        loop = asyncio.get_running_loop()
+        
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            if self._client is not None and self._client_loop is not loop:
+                logger.debug("Event loop changed, creating new pooled HTTP client")
+            
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(connect=10.0, read=60, write=60, pool=60),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                follow_redirects=True,
+            )
+            self._client_loop = loop
+            self._host_semaphores = {}
+            self._inflight_texts = {}
+        
+        return self._client
+    
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get semaphore bounding concurrent requests to the URL's host"""
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    async def download(self, url: str, output_path: str) -> str:
+        """
+        Download URL to a local file (streamed, resumable)
+        
+        Data is written to "<output_path>.part" and renamed on completion, so
+        a partially downloaded file never appears at output_path.
+        
+        Args:
+            url: HTTP(S) URL
+            output_path: Local file path
+        
+        Returns:
+            output_path
+        
+        Raises:
+            httpx.HTTPStatusError: On non-retryable HTTP errors (4xx)
+            httpx.TransportError: If retries are exhausted
+        """
+        client = self.client
+        
+        parent_dir = os.path.dirname(output_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        part_path = f"{output_path}.part"
+        
+        # Never resume from a stale partial file of a previous run
+        if os.path.exists(part_path):
+            os.unlink(part_path)
+        
+        attempt = 0
+        async with self._host_semaphore(url):
+            while True:
+                try:
+                    await self._stream_to_file(client, url, part_path)
+                    break
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    retryable = (
+                        isinstance(e, httpx.TransportError)
+                        or e.response.status_code >= 500
+                    )
+                    if not retryable or attempt >= self.max_retries:
+                        if os.path.exists(part_path):
+                            os.unlink(part_path)
+                        raise
+                    
+                    attempt += 1
+                    delay = self.retry_delay * (2 ** (attempt - 1))
+                    resumed = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                    logger.warning(
+                        f"Download interrupted ({e}), retrying in {delay:.1f}s "
+                        f"from byte {resumed} (attempt {attempt}/{self.max_retries}): {url}"
+                    )
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    # Cancelled or unexpected error: don't leave partial files behind
+                    if os.path.exists(part_path):
+                        os.unlink(part_path)
+                    raise
+        
+        os.replace(part_path, output_path)
+        logger.debug(f"Downloaded {url} -> {output_path}")
+        return output_path
+    
+    async def _stream_to_file(self, client: httpx.AsyncClient, url: str, part_path: str):
+        """Stream response body to part file, resuming with Range if data already exists"""
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        
+        async with client.stream("GET", url, headers=headers) as response:
+            if offset and response.status_code == 416:
+                # Requested range not satisfiable: we already have the whole file
+                return
+            response.raise_for_status()
+            
+            if offset and response.status_code != 206:
+                # Server ignored the Range header, start over
+                logger.debug(f"Server does not support range requests, restarting download: {url}")
+                offset = 0
+            
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                async for chunk in response.aiter_bytes(self.chunk_size):
+                    f.write(chunk)
+    
+    async def fetch_text(self, url: str) -> str:
+        """
+        Fetch a small text artifact (retried with backoff, deduplicated in flight)
+        
+        Concurrent calls for the same URL share a single request.
+        
+        Args:
+            url: HTTP(S) URL
+        
+        Returns:
+            Response body as text
+        
+        Raises:
+            httpx.HTTPStatusError: On non-retryable HTTP errors (4xx)
+            httpx.TransportError: If retries are exhausted
+        """
+        client = self.client
+        
+        task = self._inflight_texts.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_text(client, url))
+            self._inflight_texts[url] = task
+            
+            def forget(done: asyncio.Task, inflight: Dict[str, asyncio.Task] = self._inflight_texts):
+                if inflight.get(url) is done:
+                    del inflight[url]
+            
+            task.add_done_callback(forget)
+        
+        # Shield: one cancelled caller must not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_text(self, client: httpx.AsyncClient, url: str) -> str:
+        """GET URL as text with retries on transient errors"""
+        attempt = 0
+        async with self._host_semaphore(url):
+            while True:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    return response.text
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    retryable = (
+                        isinstance(e, httpx.TransportError)
+                        or e.response.status_code >= 500
+                    )
+                    if not retryable or attempt >= self.max_retries:
+                        raise
+                    
+                    attempt += 1
+                    delay = self.retry_delay * (2 ** (attempt - 1))
+                    logger.warning(
+                        f"Fetch failed ({e}), retrying in {delay:.1f}s "
+                        f"(attempt {attempt}/{self.max_retries}): {url}"
+                    )
+                    await asyncio.sleep(delay)
+    
+    async def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as e:
+                # Client may belong to an event loop that is already closed
+                logger.debug(f"Failed to close HTTP client: {e}")
+            finally:
+                self._client = None
+                self._client_loop = None
+                self._host_semaphores = {}
+                self._inflight_texts = {}
@@ -16,12 +16,14 @@ Image Analysis Service - ComfyUI Workflow-based implementation
 Uses Florence-2 or other vision models to analyze images and generate descriptions.
 """
 
+import asyncio
 from typing import Optional, Literal
 from pathlib import Path
 
 from comfykit import ComfyKit
 from loguru import logger
 
+from pixelle_video.services.analysis_cache import AnalysisCache
 from pixelle_video.services.comfy_base_service import ComfyBaseService
 
 
@@ -62,6 +64,9 @@ class ImageAnalysisService(ComfyBaseService):
             core: PixelleVideoCore instance (for accessing shared ComfyKit)
         """
         super().__init__(config, service_name="image_analysis", core=core)
+        
+        # Content-addressed description cache (the same image is analyzed only once)
+        self.cache = AnalysisCache()
     
     async def __call__(
         self,
@@ -121,6 +126,22 @@ class ImageAnalysisService(ComfyBaseService):
         # 2. Resolve workflow (returns structured info)
         workflow_info = self._resolve_workflow(workflow=workflow)
         
+        # Reuse an earlier description of the same image content (any file name, any task)
+        # (workflow file content is part of the key: edits invalidate entries)
+        digest = await asyncio.to_thread(self.cache.file_digest, str(image_path_obj))
+        workflow_digest = await asyncio.to_thread(self.cache.file_digest, workflow_info["path"])
+        cache_key = self.cache.make_key(
+            kind="image",
+            content=digest,
+            workflow=workflow_info["key"],
+            workflow_digest=workflow_digest,
+            params=params
+        )
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached:
+            logger.info(f"♻️  Image analysis cache hit ({cache_key[:12]}): {image_path_obj.name}")
+            return cached
+        
         # 3. Build workflow parameters
         workflow_params = {
             "image": str(image_path)  # Pass image path to workflow
@@ -175,14 +196,14 @@ class ImageAnalysisService(ComfyBaseService):
                     # Find text file entry
                     for item in raw_data:
                         if item.get('fileType') == 'txt' and 'fileUrl' in item:
-                            # Download text content from URL
-                            import aiohttp
-                            async with aiohttp.ClientSession() as session:
-                                async with session.get(item['fileUrl']) as resp:
-                                    if resp.status == 200:
-                                        description = await resp.text()
-                                        description = description.strip()
-                                        break
+                            # Download text content from URL (shared pooled client)
+                            try:
+                                description = await self.core.http.fetch_text(item['fileUrl'])
+                            except Exception as e:
+                                logger.warning(f"Failed to download description from {item['fileUrl']}: {e}")
+                                continue
+                            description = description.strip()
+                            break
             
             if not description:
                 logger.error(f"No text found in outputs: {result.outputs}")
@@ -190,6 +211,8 @@ class ImageAnalysisService(ComfyBaseService):
             
             logger.info(f"✅ Image analyzed: {description[:100]}...")
             
+            await asyncio.to_thread(self.cache.put, cache_key, description)
+            
             return description
         
         except Exception as e:
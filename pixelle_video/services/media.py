@@ -51,7 +51,7 @@ class MediaService(ComfyBaseService):
         workflows = pixelle_video.media.list_workflows()
     """
     
-    WORKFLOW_PREFIX = ""  # Will be overridden by _scan_workflows
+    WORKFLOW_PREFIXES = ("image_", "video_")
     DEFAULT_WORKFLOW = None  # No hardcoded default, must be configured
     WORKFLOWS_DIR = "workflows"
     
@@ -65,48 +65,6 @@ class MediaService(ComfyBaseService):
         """
         super().__init__(config, service_name="image", core=core)  # Keep "image" for config compatibility
     
-    def _scan_workflows(self):
-        """
-        Scan workflows for both image_ and video_ prefixes
-        
-        Override parent method to support multiple prefixes
-        """
-        from pixelle_video.utils.os_util import list_resource_dirs, list_resource_files, get_resource_path
-        from pathlib import Path
-        
-        workflows = []
-        
-        # Get all workflow source directories
-        source_dirs = list_resource_dirs("workflows")
-        
-        if not source_dirs:
-            logger.warning("No workflow source directories found")
-            return workflows
-        
-        # Scan each source directory for workflow files
-        for source_name in source_dirs:
-            # Get all JSON files for this source
-            workflow_files = list_resource_files("workflows", source_name)
-            
-            # Filter to only files matching image_ or video_ prefix
-            matching_files = [
-                f for f in workflow_files 
-                if (f.startswith("image_") or f.startswith("video_")) and f.endswith('.json')
-            ]
-            
-            for filename in matching_files:
-                try:
-                    # Get actual file path
-                    file_path = Path(get_resource_path("workflows", source_name, filename))
-                    workflow_info = self._parse_workflow_file(file_path, source_name)
-                    workflows.append(workflow_info)
-                    logger.debug(f"Found workflow: {workflow_info['key']}")
-                except Exception as e:
-                    logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
-        
-        # Sort by key (source/name)
-        return sorted(workflows, key=lambda w: w["key"])
-    
     async def __call__(
         self,
         prompt: str,
@@ -0,0 +1,188 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Media Info Cache
+
+One ffprobe per media file version: results are cached by (path, size, mtime)
+so repeated duration / stream / resolution lookups on the same file during a
+pipeline run cost no extra subprocess.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.services.ffmpeg_runner import probe
+
+# Max number of cached probe results (LRU)
+_MAX_CACHE_ENTRIES = 1024
+
+# (abs_path, size, mtime_ns) -> MediaInfo
+_cache: "OrderedDict[Tuple[str, int, int], MediaInfo]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@dataclass
+class MediaInfo:
+    """Parsed ffprobe result of a media file"""
+    path: str
+    duration: Optional[float] = None  # Container duration in seconds (None for still images)
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    video_codec: Optional[str] = None
+    audio_codec: Optional[str] = None
+    pix_fmt: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    streams: List[Dict[str, Any]] = field(default_factory=list)
+    format: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def has_video(self) -> bool:
+        return self.video_codec is not None
+    
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_codec is not None
+    
+    @property
+    def video_stream(self) -> Optional[Dict[str, Any]]:
+        """First video stream (raw ffprobe dict)"""
+        return next((s for s in self.streams if s.get('codec_type') == 'video'), None)
+    
+    @property
+    def audio_stream(self) -> Optional[Dict[str, Any]]:
+        """First audio stream (raw ffprobe dict)"""
+        return next((s for s in self.streams if s.get('codec_type') == 'audio'), None)
+    
+    @classmethod
+    def from_probe(cls, path: str, probe_result: Dict[str, Any]) -> "MediaInfo":
+        """Build MediaInfo from ffprobe JSON output"""
+        info = cls(
+            path=path,
+            streams=probe_result.get('streams', []),
+            format=probe_result.get('format', {}),
+        )
+        
+        duration = info.format.get('duration')
+        if duration not in (None, 'N/A'):
+            info.duration = float(duration)
+        
+        video = info.video_stream
+        if video:
+            info.video_codec = video.get('codec_name')
+            info.pix_fmt = video.get('pix_fmt')
+            if video.get('width') and video.get('height'):
+                info.width = int(video['width'])
+                info.height = int(video['height'])
+            info.fps = _parse_frame_rate(video.get('r_frame_rate'))
+        
+        audio = info.audio_stream
+        if audio:
+            info.audio_codec = audio.get('codec_name')
+            if audio.get('sample_rate'):
+                info.sample_rate = int(audio['sample_rate'])
+            if audio.get('channels'):
+                info.channels = int(audio['channels'])
+        
+        return info
+
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """Parse ffprobe frame rate ("30/1", "30000/1001")"""
+    if not rate:
+        return None
+    try:
+        num, _, den = rate.partition('/')
+        num, den = int(num), int(den or 1)
+        return num / den if den != 0 else None
+    except ValueError:
+        return None
+
+
+def _cache_key(path: str) -> Tuple[str, int, int]:
+    """Build cache key; a rewritten file gets a new key automatically"""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+async def get_media_info(path: str) -> MediaInfo:
+    """
+    Get media info for a file (probed once per file version)
+    
+    Args:
+        path: Local media file path
+    
+    Returns:
+        MediaInfo instance
+    
+    Raises:
+        FileNotFoundError: If file does not exist
+        FFmpegError: If ffprobe fails
+    """
+    key = _cache_key(path)
+    
+    with _cache_lock:
+        info = _cache.get(key)
+        if info is not None:
+            _cache.move_to_end(key)
+            return info
+    
+    info = MediaInfo.from_probe(path, await probe(path))
+    
+    with _cache_lock:
+        _cache[key] = info
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    
+    logger.debug(
+        f"Probed {path}: duration={info.duration}, "
+        f"video={info.video_codec} {info.width}x{info.height}@{info.fps}, audio={info.audio_codec}"
+    )
+    return info
+
+
+def prime_media_info(path: str, info: MediaInfo):
+    """
+    Seed the cache with a known probe result (e.g. a file restored from a cache)
+    
+    Args:
+        path: Local media file path (must exist)
+        info: Probe result describing the file's current content
+    """
+    key = _cache_key(path)
+    
+    with _cache_lock:
+        _cache[key] = info
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def get_media_info_sync(path: str) -> MediaInfo:
+    """Blocking variant of get_media_info (for sync code without an event loop)"""
+    from pixelle_video.services.ffmpeg_runner import run_sync
+    
+    return run_sync(get_media_info(path))
+
+
+def clear_media_info_cache():
+    """Drop all cached probe results"""
+    with _cache_lock:
+        _cache.clear()
@@ -16,13 +16,28 @@ Persistence Service
 Handles task metadata and storyboard persistence to filesystem.
 """
 
+import asyncio
+import atexit
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from loguru import logger
 
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig, ContentMetadata
+from pixelle_video.services import task_codec
+from pixelle_video.services.task_index import TaskIndex
+from pixelle_video.utils.os_util import atomic_write_bytes, atomic_write_json
+
+# Task file names per storage format; readers accept either
+_METADATA_FILES = {"json": "metadata.json", "binary": "metadata.bin"}
+_STORYBOARD_FILES = {"json": "storyboard.json", "binary": "storyboard.bin"}
+
+# Length of the input text preview kept in task summaries
+_TEXT_PREVIEW_CHARS = 200
 
 
 class PersistenceService:
@@ -31,9 +46,12 @@ class PersistenceService:
     
     File structure:
         output/
+        ├── .index.db                  # SQLite task index (listing, statistics)
         └── {task_id}/
             ├── metadata.json          # Task metadata (input, result, config)
             ├── storyboard.json        # Storyboard data (frames, prompts)
+            │                          # (metadata.bin / storyboard.bin with storage_format="binary")
+            ├── checkpoint.json        # Pipeline state of an unfinished run (resume)
             ├── final.mp4
             └── frames/
                 ├── 01_audio.mp3
@@ -55,33 +73,96 @@ class PersistenceService:
         
         # List all tasks
         tasks = await persistence.list_tasks(status="completed", limit=50)
+    
+    Writes are atomic (temp file + fsync + rename) and metadata updates of a
+    task are serialized, so concurrent pipelines never leave truncated JSON.
+    Index updates are coalesced and flushed in batches.
+    
+    With storage_format="binary" task files use the compact task_codec format,
+    whose summary header can be read without parsing storyboard frames
+    (load_task_summary / load_storyboard_header). Both formats are readable
+    regardless of the configured one.
     """
     
-    def __init__(self, output_dir: str = "output"):
+    # Seconds index updates are buffered before being written in one transaction
+    INDEX_FLUSH_DELAY = 0.5
+    
+    def __init__(
+        self,
+        output_dir: str = "output",
+        index_workers: int = 8,
+        storage_format: str = "json"
+    ):
         """
         Initialize persistence service
         
         Args:
             output_dir: Base output directory (default: "output")
+            index_workers: Threads scanning task directories during index rebuilds
+            storage_format: Format of written task files: "json" or "binary"
         """
+        if storage_format not in _METADATA_FILES:
+            raise ValueError(f"Unknown storage format: {storage_format} (expected 'json' or 'binary')")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.storage_format = storage_format
         
-        # Index file for fast listing
+        # SQLite index for fast listing (legacy JSON index is imported once)
+        self.index_db = self.output_dir / ".index.db"
         self.index_file = self.output_dir / ".index.json"
-        self._ensure_index()
+        self._index: Optional[TaskIndex] = None
+    
+        # Per-task locks serializing metadata read-modify-write
+        self._task_locks: Dict[str, threading.Lock] = {}
+        self._task_locks_guard = threading.Lock()
+        
+        # Pipeline checkpoint snapshot sequence numbers (issued / written)
+        self._checkpoint_seq: Dict[str, int] = {}
+        self._checkpoint_written: Dict[str, int] = {}
+        
+        # Coalesced index updates: task_id -> entry (latest wins)
+        self._pending_index: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self.flush_index)
+        
+        # Index rebuild / background reconciler
+        self.index_workers = index_workers
+        self._reconciler: Optional[threading.Thread] = None
+        self._reconciler_stop: Optional[threading.Event] = None
     
     def get_task_dir(self, task_id: str) -> Path:
         """Get task directory path"""
         return self.output_dir / task_id
     
     def get_metadata_path(self, task_id: str) -> Path:
-        """Get metadata.json path"""
-        return self.get_task_dir(task_id) / "metadata.json"
+        """Get metadata file path (existing file, else the configured format's)"""
+        return self._find_file(self.get_task_dir(task_id), _METADATA_FILES)
     
     def get_storyboard_path(self, task_id: str) -> Path:
-        """Get storyboard.json path"""
-        return self.get_task_dir(task_id) / "storyboard.json"
+        """Get storyboard file path (existing file, else the configured format's)"""
+        return self._find_file(self.get_task_dir(task_id), _STORYBOARD_FILES)
+    
+    def _find_file(self, task_dir: Path, names: Dict[str, str]) -> Path:
+        """Existing task file (configured format first), else path in configured format"""
+        preferred = task_dir / names[self.storage_format]
+        if preferred.exists():
+            return preferred
+        for name in names.values():
+            path = task_dir / name
+            if path.exists():
+                return path
+        return preferred
+    
+    def _task_lock(self, task_id: str) -> threading.Lock:
+        """Get lock serializing metadata writes of a task"""
+        with self._task_locks_guard:
+            lock = self._task_locks.get(task_id)
+            if lock is None:
+                lock = self._task_locks[task_id] = threading.Lock()
+            return lock
     
     # ========================================================================
     # Metadata Operations
@@ -109,11 +190,6 @@ class PersistenceService:
                 }
         """
         try:
-            task_dir = self.get_task_dir(task_id)
-            task_dir.mkdir(parents=True, exist_ok=True)
-            
-            metadata_path = self.get_metadata_path(task_id)
-            
             # Ensure task_id is set
             metadata["task_id"] = task_id
             
@@ -123,8 +199,7 @@ class PersistenceService:
             if "completed_at" in metadata and isinstance(metadata["completed_at"], datetime):
                 metadata["completed_at"] = metadata["completed_at"].isoformat()
             
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_metadata, task_id, metadata)
             
             logger.debug(f"Saved task metadata: {task_id}")
             
@@ -135,6 +210,16 @@ class PersistenceService:
             logger.error(f"Failed to save task metadata {task_id}: {e}")
             raise
     
+    def _write_metadata(self, task_id: str, metadata: Dict[str, Any]):
+        """Write metadata file atomically (blocking)"""
+        with self._task_lock(task_id):
+            self._write_task_file(
+                self.get_task_dir(task_id), _METADATA_FILES, metadata,
+                lambda: task_codec.encode_record(
+                    task_codec.KIND_METADATA, self._metadata_summary(metadata), metadata
+                )
+            )
+    
     async def load_task_metadata(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Load task metadata from filesystem
@@ -146,15 +231,7 @@ class PersistenceService:
             Metadata dict or None if not found
         """
         try:
-            metadata_path = self.get_metadata_path(task_id)
-            
-            if not metadata_path.exists():
-                return None
-            
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
-            
-            return metadata
+            return await asyncio.to_thread(self._read_metadata_file, self.get_task_dir(task_id))
             
         except Exception as e:
             logger.error(f"Failed to load task metadata {task_id}: {e}")
@@ -175,11 +252,30 @@ class PersistenceService:
             error: Error message (optional, for failed status)
         """
         try:
-            metadata = await self.load_task_metadata(task_id)
+            metadata = await asyncio.to_thread(self._update_status_sync, task_id, status, error)
             if not metadata:
                 logger.warning(f"Cannot update status: task {task_id} not found")
                 return
             
+            await self._update_index_for_task(task_id, metadata)
+        
+        except Exception as e:
+            logger.error(f"Failed to update task status {task_id}: {e}")
+    
+    def _update_status_sync(
+        self,
+        task_id: str,
+        status: str,
+        error: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Read-modify-write metadata status under the task lock (blocking)"""
+        task_dir = self.get_task_dir(task_id)
+        
+        with self._task_lock(task_id):
+            metadata = self._read_metadata_file(task_dir)
+            if metadata is None:
+                return None
+            
             metadata["status"] = status
             
             if status in ["completed", "failed", "cancelled"]:
@@ -188,10 +284,13 @@ class PersistenceService:
             if error:
                 metadata["error"] = error
             
-            await self.save_task_metadata(task_id, metadata)
-            
-        except Exception as e:
-            logger.error(f"Failed to update task status {task_id}: {e}")
+            self._write_task_file(
+                task_dir, _METADATA_FILES, metadata,
+                lambda: task_codec.encode_record(
+                    task_codec.KIND_METADATA, self._metadata_summary(metadata), metadata
+                )
+            )
+            return metadata
     
     # ========================================================================
     # Storyboard Operations
@@ -210,19 +309,21 @@ class PersistenceService:
             storyboard: Storyboard instance
         """
         try:
-            task_dir = self.get_task_dir(task_id)
-            task_dir.mkdir(parents=True, exist_ok=True)
-            
-            storyboard_path = self.get_storyboard_path(task_id)
-            
             # Convert storyboard to dict
             storyboard_dict = self._storyboard_to_dict(storyboard)
             
-            with open(storyboard_path, "w", encoding="utf-8") as f:
-                json.dump(storyboard_dict, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(
+                self._write_task_file,
+                self.get_task_dir(task_id), _STORYBOARD_FILES, storyboard_dict,
+                lambda: self._encode_storyboard(storyboard_dict)
+            )
             
             logger.debug(f"Saved storyboard: {task_id}")
             
+            # Metadata is usually saved first: replace its text-preview title
+            if storyboard.title:
+                self._set_index_title(task_id, storyboard.title)
+            
         except Exception as e:
             logger.error(f"Failed to save storyboard {task_id}: {e}")
             raise
@@ -238,14 +339,10 @@ class PersistenceService:
             Storyboard instance or None if not found
         """
         try:
-            storyboard_path = self.get_storyboard_path(task_id)
-            
-            if not storyboard_path.exists():
+            storyboard_dict = await asyncio.to_thread(self._read_storyboard_file, self.get_task_dir(task_id))
+            if storyboard_dict is None:
                 return None
             
-            with open(storyboard_path, "r", encoding="utf-8") as f:
-                storyboard_dict = json.load(f)
-            
             # Convert dict to storyboard
             storyboard = self._dict_to_storyboard(storyboard_dict)
             
@@ -255,6 +352,140 @@ class PersistenceService:
             logger.error(f"Failed to load storyboard {task_id}: {e}")
             return None
     
+    # ========================================================================
+    # Pipeline Checkpoints
+    # ========================================================================
+    
+    def get_checkpoint_path(self, task_id: str) -> Path:
+        """Get checkpoint.json path"""
+        return self.get_task_dir(task_id) / "checkpoint.json"
+    
+    async def save_checkpoint(
+        self,
+        task_id: str,
+        checkpoint: Dict[str, Any],
+        storyboard: Optional[Storyboard] = None
+    ):
+        """
+        Save pipeline checkpoint (state of an unfinished run)
+        
+        The checkpoint is serialized immediately, so callers may keep mutating
+        the storyboard. Values that are not JSON-serializable are dropped from
+        checkpoint["params"] (pass them again when resuming).
+        
+        Args:
+            task_id: Task ID
+            checkpoint: JSON-serializable pipeline state
+            storyboard: Storyboard to include (optional)
+        """
+        data = dict(checkpoint)
+        data["params"] = self._json_safe_params(checkpoint.get("params") or {})
+        data["storyboard"] = self._storyboard_to_dict(storyboard) if storyboard else None
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        
+        # Concurrent saves (one per finished frame) may finish out of order:
+        # only the newest snapshot is written
+        with self._task_locks_guard:
+            seq = self._checkpoint_seq.get(task_id, 0) + 1
+            self._checkpoint_seq[task_id] = seq
+        
+        def write():
+            with self._task_lock(task_id):
+                if self._checkpoint_written.get(task_id, 0) > seq:
+                    return
+                atomic_write_bytes(str(self.get_checkpoint_path(task_id)), payload)
+                self._checkpoint_written[task_id] = seq
+        
+        await asyncio.to_thread(write)
+        logger.debug(f"Saved checkpoint: {task_id} (stages: {checkpoint.get('completed_stages')})")
+    
+    async def load_checkpoint(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load pipeline checkpoint
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            Checkpoint dict ("storyboard" converted to a Storyboard) or None if not found
+        """
+        checkpoint_path = self.get_checkpoint_path(task_id)
+        
+        def read():
+            try:
+                with open(checkpoint_path, "r", encoding="utf-8") as f:
+                    checkpoint = json.load(f)
+            except FileNotFoundError:
+                return None
+        
+            if checkpoint.get("storyboard"):
+                checkpoint["storyboard"] = self._dict_to_storyboard(checkpoint["storyboard"])
+            return checkpoint
+        
+        return await asyncio.to_thread(read)
+    
+    async def delete_checkpoint(self, task_id: str):
+        """Delete pipeline checkpoint (run finished)"""
+        with self._task_lock(task_id):
+            self.get_checkpoint_path(task_id).unlink(missing_ok=True)
+        with self._task_locks_guard:
+            self._checkpoint_seq.pop(task_id, None)
+            self._checkpoint_written.pop(task_id, None)
+    
+    @staticmethod
+    def _json_safe_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only JSON-serializable params"""
+        safe = {}
+        for key, value in params.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                logger.debug(f"Checkpoint: dropping non-serializable param '{key}'")
+                continue
+            safe[key] = value
+        return safe
+    
+    # ========================================================================
+    # Summaries (lazy loading)
+    # ========================================================================
+    
+    async def load_task_summary(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load task summary without full input and config
+        
+        Reads only the record header for binary task files.
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            {"task_id", "created_at", "completed_at", "status", "error",
+             "title", "text_preview", "result"} or None if not found
+        """
+        try:
+            return await asyncio.to_thread(self._read_metadata_summary, self.get_task_dir(task_id))
+        except Exception as e:
+            logger.error(f"Failed to load task summary {task_id}: {e}")
+            return None
+    
+    async def load_storyboard_header(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load storyboard fields without frames
+        
+        Reads only the record header for binary task files.
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            Storyboard dict without "frames", plus "n_frames"; None if not found
+        """
+        try:
+            return await asyncio.to_thread(self._read_storyboard_header, self.get_task_dir(task_id))
+        except Exception as e:
+            logger.error(f"Failed to load storyboard header {task_id}: {e}")
+            return None
+    
     # ========================================================================
     # Task Listing & Querying
     # ========================================================================
@@ -284,13 +515,10 @@ class PersistenceService:
                 if not task_dir.is_dir():
                     continue
                 
-                metadata_path = task_dir / "metadata.json"
-                if not metadata_path.exists():
-                    continue
-                
                 try:
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
+                    metadata = self._read_metadata_file(task_dir)
+                    if metadata is None:
+                        continue
                     
                     # Filter by status
                     if status and metadata.get("status") != status:
@@ -335,6 +563,106 @@ class PersistenceService:
             logger.error(f"Failed to delete task {task_id}: {e}")
             raise
     
+    # ========================================================================
+    # Task File I/O (blocking, run in threads)
+    # ========================================================================
+    
+    def _write_task_file(
+        self,
+        task_dir: Path,
+        names: Dict[str, str],
+        data: Dict[str, Any],
+        encode_binary: Callable[[], bytes]
+    ):
+        """Write a task file in the configured format and drop the other format's copy"""
+        path = task_dir / names[self.storage_format]
+        if self.storage_format == "binary":
+            atomic_write_bytes(str(path), encode_binary())
+        else:
+            atomic_write_json(str(path), data, indent=2)
+        
+        for storage_format, name in names.items():
+            if storage_format != self.storage_format:
+                (task_dir / name).unlink(missing_ok=True)
+    
+    @staticmethod
+    def _is_binary(path: Path) -> bool:
+        return path.suffix == ".bin"
+    
+    def _read_metadata_file(self, task_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read full metadata (None if missing)"""
+        path = self._find_file(task_dir, _METADATA_FILES)
+        if not path.exists():
+            return None
+        if self._is_binary(path):
+            return task_codec.read_record(path, task_codec.KIND_METADATA)[1]
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def _read_metadata_summary(self, task_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read metadata summary (header only for binary files; None if missing)"""
+        path = self._find_file(task_dir, _METADATA_FILES)
+        if not path.exists():
+            return None
+        if self._is_binary(path):
+            return task_codec.read_header(path, task_codec.KIND_METADATA)
+        with open(path, "r", encoding="utf-8") as f:
+            return self._metadata_summary(json.load(f))
+    
+    def _read_storyboard_file(self, task_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read full storyboard dict (None if missing)"""
+        path = self._find_file(task_dir, _STORYBOARD_FILES)
+        if not path.exists():
+            return None
+        if self._is_binary(path):
+            header, body = task_codec.read_record(path, task_codec.KIND_STORYBOARD)
+            storyboard_dict = {k: v for k, v in header.items() if k != "n_frames"}
+            storyboard_dict["frames"] = task_codec.columns_to_rows((body or {}).get("frames", {}))
+            return storyboard_dict
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def _read_storyboard_header(self, task_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read storyboard dict without frames (header only for binary files; None if missing)"""
+        path = self._find_file(task_dir, _STORYBOARD_FILES)
+        if not path.exists():
+            return None
+        if self._is_binary(path):
+            return task_codec.read_header(path, task_codec.KIND_STORYBOARD)
+        with open(path, "r", encoding="utf-8") as f:
+            return self._storyboard_header(json.load(f))
+    
+    @staticmethod
+    def _metadata_summary(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Small summary of task metadata (binary metadata header)"""
+        input_params = metadata.get("input") or {}
+        text = input_params.get("text") or ""
+        return {
+            "task_id": metadata.get("task_id"),
+            "created_at": metadata.get("created_at"),
+            "completed_at": metadata.get("completed_at"),
+            "status": metadata.get("status", "unknown"),
+            "error": metadata.get("error"),
+            "title": input_params.get("title"),
+            "text_preview": text[:_TEXT_PREVIEW_CHARS],
+            "result": metadata.get("result") or {},
+        }
+    
+    @staticmethod
+    def _storyboard_header(storyboard_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Storyboard dict without frames (binary storyboard header)"""
+        header = {k: v for k, v in storyboard_dict.items() if k != "frames"}
+        header["n_frames"] = len(storyboard_dict.get("frames") or [])
+        return header
+    
+    def _encode_storyboard(self, storyboard_dict: Dict[str, Any]) -> bytes:
+        """Encode storyboard dict as binary record (frames stored column-wise)"""
+        return task_codec.encode_record(
+            task_codec.KIND_STORYBOARD,
+            self._storyboard_header(storyboard_dict),
+            {"frames": task_codec.rows_to_columns(storyboard_dict["frames"])}
+        )
+    
     # ========================================================================
     # Serialization Helpers
     # ========================================================================
@@ -469,119 +797,281 @@ class PersistenceService:
     # Index Management (for fast listing)
     # ========================================================================
     
-    def _ensure_index(self):
-        """Ensure index file exists, create if not"""
-        if not self.index_file.exists():
-            self._save_index({"version": "1.0", "tasks": []})
+    @property
+    def index(self) -> TaskIndex:
+        """Task index (opened on first use, imports a legacy .index.json once)"""
+        if self._index is None:
+            self._index = TaskIndex(str(self.index_db))
+            self._import_legacy_index()
+        return self._index
     
-    def _load_index(self) -> Dict[str, Any]:
-        """Load index from file"""
+    def _import_legacy_index(self):
+        """Import entries of the former JSON index into an empty SQLite index"""
+        if not self.index_file.exists() or self._index.count() > 0:
+            return
+        
         try:
             with open(self.index_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                entries = json.load(f).get("tasks", [])
+            self._index.upsert_many(entry for entry in entries if entry.get("task_id"))
+            logger.info(f"Imported {len(entries)} tasks from legacy index {self.index_file}")
         except Exception as e:
-            logger.error(f"Failed to load index: {e}")
-            return {"version": "1.0", "tasks": []}
+            logger.warning(f"Failed to import legacy index {self.index_file}: {e}")
     
-    def _save_index(self, index_data: Dict[str, Any]):
-        """Save index to file"""
-        try:
-            index_data["last_updated"] = datetime.now().isoformat()
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save index: {e}")
+    def _build_index_entry(
+        self,
+        task_id: str,
+        metadata: Dict[str, Any],
+        storyboard_title: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build index entry from task metadata
     
-    async def _update_index_for_task(self, task_id: str, metadata: Dict[str, Any]):
-        """Update index entry for a specific task"""
-        index = self._load_index()
-        
-        # Try to get title from multiple sources
+        Title sources, in order: input title, storyboard title, input text
+        preview (flagged as fallback so a later storyboard title replaces it),
+        "Untitled".
+        """
         title = metadata.get("input", {}).get("title")
-        if not title or title == "":
-            # Try to get title from storyboard if input title is empty
-            storyboard = await self.load_storyboard(task_id)
-            if storyboard and storyboard.title:
-                title = storyboard.title
+        title_is_fallback = False
+        if not title:
+            title = storyboard_title
+        if not title:
+            # Input text preview: first 30 characters
+            input_text = metadata.get("input", {}).get("text", "")
+            if input_text:
+                title = input_text[:30] + ("..." if len(input_text) > 30 else "")
             else:
-                # Fall back to using input text preview
-                input_text = metadata.get("input", {}).get("text", "")
-                if input_text:
-                    # Use first 30 characters of input text as title
-                    title = input_text[:30] + ("..." if len(input_text) > 30 else "")
-                else:
-                    title = "Untitled"
-        
-        # Extract key info for index
-        index_entry = {
+                title = "Untitled"
+            title_is_fallback = True
+        
+        result = metadata.get("result") or {}
+        return {
             "task_id": task_id,
             "created_at": metadata.get("created_at"),
             "completed_at": metadata.get("completed_at"),
             "status": metadata.get("status", "unknown"),
             "title": title,
-            "duration": metadata.get("result", {}).get("duration", 0),
-            "n_frames": metadata.get("result", {}).get("n_frames", 0),
-            "file_size": metadata.get("result", {}).get("file_size", 0),
-            "video_path": metadata.get("result", {}).get("video_path"),
+            "title_is_fallback": title_is_fallback,
+            "duration": result.get("duration", 0),
+            "n_frames": result.get("n_frames", 0),
+            "file_size": result.get("file_size", 0),
+            "video_path": result.get("video_path"),
+            # Listing preview: cards render these without opening task files
+            "poster_path": result.get("poster_path"),
+            "preview_path": result.get("preview_path"),
+            "text_preview": (metadata.get("input", {}).get("text") or "")[:_TEXT_PREVIEW_CHARS],
         }
         
-        # Update or append
-        tasks = index.get("tasks", [])
-        existing_idx = next((i for i, t in enumerate(tasks) if t["task_id"] == task_id), None)
+    async def _update_index_for_task(self, task_id: str, metadata: Dict[str, Any]):
+        """Update index entry for a specific task"""
+        storyboard_title = None
+        if not metadata.get("input", {}).get("title"):
+            # Keep a storyboard title already in the index instead of reloading the storyboard
+            with self._pending_lock:
+                existing = self._pending_index.get(task_id)
+            if existing is None:
+                existing = self.index.get(task_id)
+            if existing and not existing.get("title_is_fallback"):
+                storyboard_title = existing.get("title")
         
-        if existing_idx is not None:
-            tasks[existing_idx] = index_entry
-        else:
-            tasks.append(index_entry)
+        self._queue_index_update(self._build_index_entry(task_id, metadata, storyboard_title))
+    
+    def _queue_index_update(self, entry: Dict[str, Any]):
+        """Buffer an index entry; buffered entries are flushed together"""
+        with self._pending_lock:
+            self._pending_index[entry["task_id"]] = entry
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.INDEX_FLUSH_DELAY, self.flush_index)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _set_index_title(self, task_id: str, title: str):
+        """Replace a fallback (text preview) title, buffered or already indexed"""
+        with self._flush_lock:
+            with self._pending_lock:
+                entry = self._pending_index.get(task_id)
+                if entry is not None:
+                    if entry.get("title_is_fallback"):
+                        entry["title"] = title
+                        entry["title_is_fallback"] = False
+                    return
+            self.index.set_title(task_id, title)
+    
+    def flush_index(self):
+        """Write buffered index updates in one transaction (called before index reads)"""
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending_index = self._pending_index, {}
+                timer, self._flush_timer = self._flush_timer, None
+            if timer is not None:
+                timer.cancel()
+            if pending:
+                # Record source signatures so incremental rebuilds skip these tasks
+                for task_id, entry in pending.items():
+                    entry["signature"] = self._task_signature(self.get_task_dir(task_id))
+                try:
+                    self.index.upsert_many(pending.values())
+                except Exception as e:
+                    logger.error(f"Failed to update task index: {e}")
+    
+    def _task_signature(self, task_dir: Path) -> Optional[str]:
+        """
+        Change signature of a task's source files (mtime + size)
         
-        index["tasks"] = tasks
-        self._save_index(index)
+        Returns:
+            Signature string, or None if the directory has no metadata file
+        """
+        try:
+            meta = self._find_file(task_dir, _METADATA_FILES).stat()
+        except FileNotFoundError:
+            return None
+        try:
+            sb = self._find_file(task_dir, _STORYBOARD_FILES).stat()
+            storyboard_part = f"{sb.st_mtime_ns}:{sb.st_size}"
+        except FileNotFoundError:
+            storyboard_part = "-"
+        return f"{meta.st_mtime_ns}:{meta.st_size}:{storyboard_part}"
     
-    async def rebuild_index(self):
-        """Rebuild index by scanning all task directories"""
-        logger.info("Rebuilding task index...")
-        index = {"version": "1.0", "tasks": []}
+    def _scan_task(
+        self,
+        task_dir: Path,
+        known_signature: Optional[str]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Re-read a task directory if it changed since it was indexed (blocking)
         
-        # Scan all directories
-        for task_dir in self.output_dir.iterdir():
-            if not task_dir.is_dir() or task_dir.name.startswith("."):
-                continue
+        Returns:
+            (is_task, entry): entry is None when unchanged or unreadable
+        """
+        signature = self._task_signature(task_dir)
+        if signature is None:
+            return False, None
+        if signature == known_signature:
+            return True, None
+        
+        task_id = task_dir.name
+        try:
+            metadata = self._read_metadata_file(task_dir)
+            if metadata is None:
+                return False, None
+        except Exception as e:
+            logger.warning(f"Failed to load metadata from {task_dir}: {e}")
+            return True, None
+        
+        storyboard_title = None
+        if not metadata.get("input", {}).get("title"):
+            try:
+                header = self._read_storyboard_header(task_dir)
+                if header:
+                    storyboard_title = header.get("title")
+            except Exception as e:
+                logger.warning(f"Failed to load storyboard title from {task_dir}: {e}")
+        
+        entry = self._build_index_entry(task_id, metadata, storyboard_title)
+        entry["signature"] = signature
+        return True, entry
+    
+    def _reconcile_index(self, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the index in line with the task directories (blocking)
+        
+        Only tasks whose metadata/storyboard mtime or size changed are re-read;
+        directories are stat-ed and read in a thread pool (network storage).
+        
+        Args:
+            full: Re-read every task and replace the whole index
+        
+        Returns:
+            {"scanned": n, "updated": n, "removed": n}
+        """
+        self.flush_index()
+        known = {} if full else self.index.signatures()
+        
+        task_dirs = [
+            Path(entry.path) for entry in os.scandir(self.output_dir)
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+        with ThreadPoolExecutor(max_workers=self.index_workers, thread_name_prefix="index-scan") as pool:
+            results = list(pool.map(lambda d: self._scan_task(d, known.get(d.name)), task_dirs))
+            
+        present = set()
+        changed = []
+        for task_dir, (is_task, entry) in zip(task_dirs, results):
+            if is_task:
+                present.add(task_dir.name)
+            if entry is not None:
+                changed.append(entry)
             
-            task_id = task_dir.name
-            metadata = await self.load_task_metadata(task_id)
-            
-            if metadata:
-                # Try to get title from multiple sources
-                title = metadata.get("input", {}).get("title")
-                if not title or title == "":
-                    # Try to get title from storyboard if input title is empty
-                    storyboard = await self.load_storyboard(task_id)
-                    if storyboard and storyboard.title:
-                        title = storyboard.title
-                    else:
-                        # Fall back to using input text preview
-                        input_text = metadata.get("input", {}).get("text", "")
-                        if input_text:
-                            # Use first 30 characters of input text as title
-                            title = input_text[:30] + ("..." if len(input_text) > 30 else "")
-                        else:
-                            title = "Untitled"
+        if full:
+            self.index.replace_all(changed)
+            removed = []
+        else:
+            removed = [task_id for task_id in known if task_id not in present]
+            self.index.upsert_many(changed)
+            self.index.delete_many(removed)
                 
-                # Add to index
-                index["tasks"].append({
-                    "task_id": task_id,
-                    "created_at": metadata.get("created_at"),
-                    "completed_at": metadata.get("completed_at"),
-                    "status": metadata.get("status", "unknown"),
-                    "title": title,
-                    "duration": metadata.get("result", {}).get("duration", 0),
-                    "n_frames": metadata.get("result", {}).get("n_frames", 0),
-                    "file_size": metadata.get("result", {}).get("file_size", 0),
-                    "video_path": metadata.get("result", {}).get("video_path"),
-                })
-        
-        self._save_index(index)
-        logger.info(f"Index rebuilt: {len(index['tasks'])} tasks")
+        return {"scanned": len(task_dirs), "updated": len(changed), "removed": len(removed)}
+        
+    async def rebuild_index(self, full: bool = False) -> Dict[str, int]:
+        """
+        Rebuild index by scanning all task directories
+        
+        Incremental by default: unchanged tasks are not re-read.
+        
+        Args:
+            full: Re-read every task (e.g. after restoring files with preserved mtimes)
+        
+        Returns:
+            {"scanned": n, "updated": n, "removed": n}
+        """
+        logger.info(f"Rebuilding task index ({'full' if full else 'incremental'})...")
+        stats = await asyncio.to_thread(self._reconcile_index, full)
+        logger.info(
+            f"Index rebuilt: {stats['scanned']} directories, "
+            f"{stats['updated']} updated, {stats['removed']} removed"
+        )
+        return stats
+    
+    def start_reconciler(self, interval: float):
+        """
+        Reconcile the index in a background thread every `interval` seconds
+        
+        Picks up tasks written by other processes or changed on disk. The first
+        pass runs immediately.
+        
+        Args:
+            interval: Seconds between passes
+        """
+        if self._reconciler is not None:
+            return
+        
+        stop_event = threading.Event()
+        
+        def run():
+            while True:
+                try:
+                    stats = self._reconcile_index()
+                    if stats["updated"] or stats["removed"]:
+                        logger.info(
+                            f"🔄 Task index reconciled: {stats['updated']} updated, {stats['removed']} removed"
+                        )
+                except Exception as e:
+                    logger.error(f"Task index reconcile failed: {e}")
+                if stop_event.wait(interval):
+                    return
+        
+        self._reconciler_stop = stop_event
+        self._reconciler = threading.Thread(target=run, name="index-reconciler", daemon=True)
+        self._reconciler.start()
+        logger.info(f"Task index reconciler started (every {interval}s)")
+    
+    def stop_reconciler(self):
+        """Stop the background reconciler (waits for a running pass)"""
+        if self._reconciler is None:
+            return
+        self._reconciler_stop.set()
+        self._reconciler.join()
+        self._reconciler = None
     
     # ========================================================================
     # Paginated Listing
@@ -602,7 +1092,7 @@ class PersistenceService:
             page: Page number (1-indexed)
             page_size: Items per page
             status: Filter by status (optional)
-            sort_by: Sort field (created_at, completed_at, title, duration)
+            sort_by: Sort field (created_at, completed_at, title, duration, n_frames)
             sort_order: Sort order (asc, desc)
         
         Returns:
@@ -614,29 +1104,20 @@ class PersistenceService:
                 "total_pages": 5         # Total pages
             }
         """
-        index = self._load_index()
-        tasks = index.get("tasks", [])
+        page = max(page, 1)
         
-        # Filter by status
-        if status:
-            tasks = [t for t in tasks if t.get("status") == status]
-        
-        # Sort
-        reverse = (sort_order == "desc")
-        if sort_by in ["created_at", "completed_at"]:
-            tasks.sort(
-                key=lambda t: datetime.fromisoformat(t.get(sort_by, "1970-01-01T00:00:00")),
-                reverse=reverse
+        def query():
+            self.flush_index()
+            return self.index.query(
+                status=status,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=page_size,
+                offset=(page - 1) * page_size
             )
-        elif sort_by in ["title", "duration", "n_frames"]:
-            tasks.sort(key=lambda t: t.get(sort_by, ""), reverse=reverse)
         
-        # Paginate
-        total = len(tasks)
+        page_tasks, total = await asyncio.to_thread(query)
         total_pages = (total + page_size - 1) // page_size
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        page_tasks = tasks[start_idx:end_idx]
         
         return {
             "tasks": page_tasks,
@@ -663,18 +1144,11 @@ class PersistenceService:
                 "total_size": 1024000000,  # bytes
             }
         """
-        index = self._load_index()
-        tasks = index.get("tasks", [])
-        
-        stats = {
-            "total_tasks": len(tasks),
-            "completed": len([t for t in tasks if t.get("status") == "completed"]),
-            "failed": len([t for t in tasks if t.get("status") == "failed"]),
-            "total_duration": sum(t.get("duration", 0) for t in tasks),
-            "total_size": sum(t.get("file_size", 0) for t in tasks),
-        }
+        def statistics():
+            self.flush_index()
+            return self.index.statistics()
         
-        return stats
+        return await asyncio.to_thread(statistics)
     
     # ========================================================================
     # Delete Task
@@ -693,20 +1167,20 @@ class PersistenceService:
         try:
             import shutil
             
-            task_dir = self.get_task_dir(task_id)
-            if task_dir.exists():
-                shutil.rmtree(task_dir)
-                logger.info(f"Deleted task directory: {task_dir}")
+            def delete():
+                task_dir = self.get_task_dir(task_id)
+                if task_dir.exists():
+                    shutil.rmtree(task_dir)
+                    logger.info(f"Deleted task directory: {task_dir}")
             
-            # Update index
-            index = self._load_index()
-            tasks = index.get("tasks", [])
-            tasks = [t for t in tasks if t["task_id"] != task_id]
-            index["tasks"] = tasks
-            self._save_index(index)
+                # Update index
+                with self._pending_lock:
+                    self._pending_index.pop(task_id, None)
+                self.flush_index()
+                self.index.delete(task_id)
             
+            await asyncio.to_thread(delete)
             return True
         except Exception as e:
             logger.error(f"Failed to delete task {task_id}: {e}")
             return False
-
@@ -0,0 +1,143 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Task Record Codec
+
+Compact, versioned binary format for task files (metadata.bin, storyboard.bin):
+
+    magic "PVTR" | version u8 | kind u8 | header_len u32 | body_len u32
+    header: compact JSON (small summary fields, readable without the body)
+    body:   zlib-compressed compact JSON (bulk data, e.g. storyboard frames)
+
+Readers can load the header alone (read_header) to list thousands of tasks
+without parsing frames. Storyboard frames are stored column-wise (one list
+per field), which compresses much better than a list of frame objects.
+"""
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+MAGIC = b"PVTR"
+VERSION = 1
+
+# Record kinds
+KIND_METADATA = 1
+KIND_STORYBOARD = 2
+
+_PREFIX = struct.Struct("<4sBBII")
+
+
+class TaskCodecError(ValueError):
+    """Raised when a file is not a valid task record"""
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_record(kind: int, header: Dict[str, Any], body: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Encode a task record
+    
+    Args:
+        kind: Record kind (KIND_METADATA, KIND_STORYBOARD)
+        header: Summary fields (stored uncompressed, loadable on their own)
+        body: Bulk data (stored compressed), optional
+    
+    Returns:
+        Encoded bytes
+    """
+    header_bytes = _dumps(header)
+    body_bytes = zlib.compress(_dumps(body), 6) if body is not None else b""
+    return _PREFIX.pack(MAGIC, VERSION, kind, len(header_bytes), len(body_bytes)) + header_bytes + body_bytes
+
+
+def _parse_prefix(prefix: bytes, kind: int) -> Tuple[int, int]:
+    """Validate prefix and return (header_len, body_len)"""
+    if len(prefix) < _PREFIX.size:
+        raise TaskCodecError("Truncated task record")
+    
+    magic, version, record_kind, header_len, body_len = _PREFIX.unpack(prefix[:_PREFIX.size])
+    if magic != MAGIC:
+        raise TaskCodecError("Not a task record")
+    if version > VERSION:
+        raise TaskCodecError(f"Unsupported task record version {version} (max {VERSION})")
+    if record_kind != kind:
+        raise TaskCodecError(f"Unexpected task record kind {record_kind} (expected {kind})")
+    return header_len, body_len
+
+
+def decode_record(data: bytes, kind: int) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Decode a whole task record
+    
+    Returns:
+        (header, body) - body is None if the record has none
+    
+    Raises:
+        TaskCodecError: If data is not a valid record of this kind
+    """
+    header_len, body_len = _parse_prefix(data, kind)
+    start = _PREFIX.size
+    if len(data) < start + header_len + body_len:
+        raise TaskCodecError("Truncated task record")
+    
+    header = json.loads(data[start:start + header_len])
+    body = None
+    if body_len:
+        body_start = start + header_len
+        body = json.loads(zlib.decompress(data[body_start:body_start + body_len]))
+    return header, body
+
+
+def read_record(path: Union[str, Path], kind: int) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Read and decode a whole task record file"""
+    with open(path, "rb") as f:
+        return decode_record(f.read(), kind)
+
+
+def read_header(path: Union[str, Path], kind: int) -> Dict[str, Any]:
+    """
+    Read only the header of a task record file (body is not read)
+    
+    Raises:
+        TaskCodecError: If the file is not a valid record of this kind
+    """
+    with open(path, "rb") as f:
+        header_len, _ = _parse_prefix(f.read(_PREFIX.size), kind)
+        header_bytes = f.read(header_len)
+    if len(header_bytes) < header_len:
+        raise TaskCodecError("Truncated task record")
+    return json.loads(header_bytes)
+
+
+def rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Convert a list of dicts with the same keys to column lists"""
+    columns: Dict[str, List[Any]] = {}
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            # Keys missing from earlier rows are padded with None
+            columns.setdefault(key, [None] * i).append(value)
+        for key, column in columns.items():
+            if len(column) <= i:
+                column.append(None)
+    return columns
+
+
+def columns_to_rows(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Inverse of rows_to_columns"""
+    n_rows = max((len(column) for column in columns.values()), default=0)
+    return [{key: column[i] for key, column in columns.items()} for i in range(n_rows)]
@@ -0,0 +1,391 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Task Index
+
+SQLite index of generated tasks (output/.index.db) used by PersistenceService
+for history listing and statistics.
+
+- One row per task with indexed sort/filter columns; updates are O(log n)
+- Aggregate statistics maintained incrementally by triggers
+- In-process read cache, invalidated by this process' writes and by commits
+  of other processes (PRAGMA data_version)
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+# Sortable columns (API sort_by values)
+SORT_COLUMNS = ("created_at", "completed_at", "title", "duration", "n_frames")
+
+# Entry keys stored only as columns (not returned in listings)
+_COLUMN_ONLY_KEYS = ("title_is_fallback", "signature")
+
+# Schema version (PRAGMA user_version); bumped when columns or indexes change
+_SCHEMA_VERSION = 2
+
+
+class TaskIndex:
+    """
+    SQLite-backed task index
+    
+    Entries are the dicts produced by PersistenceService (task_id, created_at,
+    completed_at, status, title, duration, n_frames, file_size, video_path, ...);
+    they are stored as JSON alongside the indexed columns and returned as-is.
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL DEFAULT '',
+            completed_at TEXT NOT NULL DEFAULT '',
+            status TEXT NOT NULL DEFAULT 'unknown',
+            title TEXT NOT NULL DEFAULT '',
+            title_is_fallback INTEGER NOT NULL DEFAULT 0,
+            duration REAL NOT NULL DEFAULT 0,
+            n_frames INTEGER NOT NULL DEFAULT 0,
+            file_size INTEGER NOT NULL DEFAULT 0,
+            signature TEXT,
+            data TEXT NOT NULL
+        );
+        -- Listing order is (sort column, task_id); status filters use the status-prefixed indexes
+        CREATE INDEX IF NOT EXISTS idx_tasks_created_id ON tasks (created_at, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_completed_id ON tasks (completed_at, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_title_id ON tasks (title, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_duration_id ON tasks (duration, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_n_frames_id ON tasks (n_frames, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_created_id ON tasks (status, created_at, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_completed_id ON tasks (status, completed_at, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_title_id ON tasks (status, title, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_duration_id ON tasks (status, duration, task_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_n_frames_id ON tasks (status, n_frames, task_id);
+        
+        CREATE TABLE IF NOT EXISTS task_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_tasks INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0,
+            total_duration REAL NOT NULL DEFAULT 0,
+            total_size INTEGER NOT NULL DEFAULT 0
+        );
+        INSERT OR IGNORE INTO task_stats (id) VALUES (1);
+        
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_insert AFTER INSERT ON tasks BEGIN
+            UPDATE task_stats SET
+                total_tasks = total_tasks + 1,
+                completed = completed + (NEW.status = 'completed'),
+                failed = failed + (NEW.status = 'failed'),
+                total_duration = total_duration + NEW.duration,
+                total_size = total_size + NEW.file_size
+            WHERE id = 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_delete AFTER DELETE ON tasks BEGIN
+            UPDATE task_stats SET
+                total_tasks = total_tasks - 1,
+                completed = completed - (OLD.status = 'completed'),
+                failed = failed - (OLD.status = 'failed'),
+                total_duration = total_duration - OLD.duration,
+                total_size = total_size - OLD.file_size
+            WHERE id = 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_update AFTER UPDATE ON tasks BEGIN
+            UPDATE task_stats SET
+                completed = completed - (OLD.status = 'completed') + (NEW.status = 'completed'),
+                failed = failed - (OLD.status = 'failed') + (NEW.status = 'failed'),
+                total_duration = total_duration - OLD.duration + NEW.duration,
+                total_size = total_size - OLD.file_size + NEW.file_size
+            WHERE id = 1;
+        END;
+    """
+    
+    _UPSERT = """
+        INSERT INTO tasks
+            (task_id, created_at, completed_at, status, title, title_is_fallback,
+             duration, n_frames, file_size, signature, data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(task_id) DO UPDATE SET
+            created_at = excluded.created_at,
+            completed_at = excluded.completed_at,
+            status = excluded.status,
+            title = excluded.title,
+            title_is_fallback = excluded.title_is_fallback,
+            duration = excluded.duration,
+            n_frames = excluded.n_frames,
+            file_size = excluded.file_size,
+            signature = excluded.signature,
+            data = excluded.data
+    """
+    
+    def __init__(self, db_path: str):
+        """
+        Initialize task index
+        
+        Args:
+            db_path: SQLite database path (created if missing)
+        """
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._migrate()
+        self._conn.executescript(self._SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        
+        # Read cache: query key -> result; valid while data_version is unchanged
+        self._cache: Dict[Tuple, Any] = {}
+        self._data_version: Optional[int] = None
+    
+    def _migrate(self):
+        """Upgrade a table created by an older schema version"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if not columns:
+            return
+        if "signature" not in columns:
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN signature TEXT")
+        
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 2:
+            # Sort columns used to be nullable and sorted via COALESCE(), which
+            # no index can serve: fill the defaults and replace the indexes
+            self._conn.executescript("""
+                BEGIN;
+                UPDATE tasks SET
+                    created_at = COALESCE(created_at, ''),
+                    completed_at = COALESCE(completed_at, ''),
+                    title = COALESCE(title, '')
+                WHERE created_at IS NULL OR completed_at IS NULL OR title IS NULL;
+                DROP INDEX IF EXISTS idx_tasks_created;
+                DROP INDEX IF EXISTS idx_tasks_completed;
+                DROP INDEX IF EXISTS idx_tasks_title;
+                DROP INDEX IF EXISTS idx_tasks_duration;
+                DROP INDEX IF EXISTS idx_tasks_n_frames;
+                DROP INDEX IF EXISTS idx_tasks_status_created;
+                COMMIT;
+            """)
+    
+    # ========================================================================
+    # Writes
+    # ========================================================================
+    
+    @staticmethod
+    def _row(entry: Dict[str, Any]) -> tuple:
+        """Build row values from an index entry (sort columns are never NULL)"""
+        return (
+            entry["task_id"],
+            entry.get("created_at") or "",
+            entry.get("completed_at") or "",
+            entry.get("status") or "unknown",
+            entry.get("title") or "",
+            1 if entry.get("title_is_fallback") else 0,
+            float(entry.get("duration") or 0),
+            int(entry.get("n_frames") or 0),
+            int(entry.get("file_size") or 0),
+            entry.get("signature"),
+            json.dumps(
+                {k: v for k, v in entry.items() if k not in _COLUMN_ONLY_KEYS},
+                ensure_ascii=False
+            ),
+        )
+    
+    def upsert(self, entry: Dict[str, Any]):
+        """Insert or update one entry"""
+        self.upsert_many([entry])
+    
+    def upsert_many(self, entries: Iterable[Dict[str, Any]]):
+        """Insert or update entries in a single transaction"""
+        rows = [self._row(entry) for entry in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(self._UPSERT, rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._cache.clear()
+    
+    def replace_all(self, entries: Iterable[Dict[str, Any]]):
+        """Replace the whole index (rebuild)"""
+        rows = [self._row(entry) for entry in entries]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM tasks")
+                self._conn.executemany(self._UPSERT, rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._cache.clear()
+    
+    def delete(self, task_id: str):
+        """Remove entry"""
+        self.delete_many([task_id])
+    
+    def delete_many(self, task_ids: Iterable[str]):
+        """Remove entries in a single transaction"""
+        rows = [(task_id,) for task_id in task_ids]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("DELETE FROM tasks WHERE task_id = ?", rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._cache.clear()
+    
+    def set_title(self, task_id: str, title: str) -> bool:
+        """
+        Replace a fallback title (input text preview) with a real one
+        
+        Returns:
+            True if the entry was updated
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tasks WHERE task_id = ? AND title_is_fallback = 1",
+                (task_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            
+            entry = json.loads(row[0])
+            entry["title"] = title
+            self._conn.execute(
+                "UPDATE tasks SET title = ?, title_is_fallback = 0, data = ? WHERE task_id = ?",
+                (title, json.dumps(entry, ensure_ascii=False), task_id)
+            )
+            self._cache.clear()
+            return True
+    
+    # ========================================================================
+    # Reads (cached)
+    # ========================================================================
+    
+    def _cached(self, key: Tuple, compute):
+        """Return cached result, recomputing after any commit by any process"""
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._data_version:
+                self._cache.clear()
+                self._data_version = version
+            
+            if key not in self._cache:
+                self._cache[key] = compute()
+            return self._cache[key]
+    
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get entry by task ID (with title_is_fallback flag)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, title_is_fallback FROM tasks WHERE task_id = ?",
+                (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = json.loads(row[0])
+        entry["title_is_fallback"] = bool(row[1])
+        return entry
+    
+    def signatures(self) -> Dict[str, Optional[str]]:
+        """Source file signatures of all entries (task_id -> signature)"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT task_id, signature FROM tasks").fetchall())
+    
+    def count(self) -> int:
+        """Number of indexed tasks"""
+        return self.statistics()["total_tasks"]
+    
+    def query(
+        self,
+        status: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        limit: int = 20,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Filtered, sorted page of entries
+        
+        Args:
+            status: Filter by status (optional)
+            sort_by: One of SORT_COLUMNS (unknown values sort by created_at)
+            sort_order: "asc" or "desc"
+            limit: Page size
+            offset: Entries to skip
+        
+        Returns:
+            (entries, total matching entries)
+        """
+        if sort_by not in SORT_COLUMNS:
+            sort_by = "created_at"
+        direction = "DESC" if sort_order == "desc" else "ASC"
+        
+        def compute():
+            where, params = ("WHERE status = ?", [status]) if status else ("", [])
+            # Raw columns so the (column, task_id) / (status, column, task_id) indexes serve the order
+            order = f"{sort_by} {direction}, task_id {direction}"
+            rows = self._conn.execute(
+                f"SELECT data FROM tasks {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                (*params, limit, offset)
+            ).fetchall()
+            if status:
+                total = self._conn.execute(
+                    "SELECT COUNT(*) FROM tasks WHERE status = ?", (status,)
+                ).fetchone()[0]
+            else:
+                total = self._conn.execute("SELECT total_tasks FROM task_stats WHERE id = 1").fetchone()[0]
+            return [json.loads(row[0]) for row in rows], total
+        
+        entries, total = self._cached(("query", status, sort_by, direction, limit, offset), compute)
+        # Callers may mutate entries: hand out copies of cached data
+        return [dict(entry) for entry in entries], total
+    
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Aggregate statistics (maintained incrementally, O(1))
+        
+        Returns:
+            {"total_tasks", "completed", "failed", "total_duration", "total_size"}
+        """
+        def compute():
+            row = self._conn.execute(
+                "SELECT total_tasks, completed, failed, total_duration, total_size "
+                "FROM task_stats WHERE id = 1"
+            ).fetchone()
+            return {
+                "total_tasks": row[0],
+                "completed": row[1],
+                "failed": row[2],
+                "total_duration": row[3],
+                "total_size": row[4],
+            }
+        
+        return dict(self._cached(("statistics",), compute))
+    
+    def close(self):
+        """Close database connection"""
+        with self._lock:
+            self._conn.close()
+            logger.debug(f"Task index closed: {self.db_path}")
@@ -0,0 +1,272 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed TTS audio cache
+
+Generated speech is stored under data/cache/tts, keyed by a hash of everything
+that determines the audio (text, voice, speed/rate, workflow, reference audio
+content, ...). Each entry keeps the audio file and its probe result, so a hit
+costs neither a TTS call nor an ffprobe.
+
+Layout:
+    data/cache/tts/<key>.<ext>   audio
+    data/cache/tts/<key>.json    metadata (probe result, size, created_at)
+
+Eviction is LRU by total size (last use = file mtime, touched on every hit).
+File I/O runs in worker threads, never on the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import get_data_path
+
+
+class TTSCache:
+    """
+    Size-bounded, content-addressed TTS audio cache
+    
+    Usage:
+        >>> cache = TTSCache()
+        >>> key = cache.make_key(mode="local", text="Hello", voice="en-US-AriaNeural", rate="+0%")
+        >>> if not await cache.fetch(key, "output/a.mp3"):
+        ...     await generate("output/a.mp3")
+        ...     await cache.store(key, "output/a.mp3")
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: int = 512):
+        """
+        Initialize TTS cache
+        
+        Args:
+            cache_dir: Cache directory (default: data/cache/tts)
+            max_size_mb: Max total size of cached audio in MB (LRU eviction above this)
+        """
+        self.cache_dir = cache_dir or get_data_path("cache", "tts")
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        
+        # key -> (audio filename, size, last_used); built lazily from disk
+        self._index: Optional[Dict[str, Tuple[str, int, float]]] = None
+        self._lock = threading.Lock()
+        
+        # (path, size, mtime_ns) -> sha256 of reference audio files
+        self._file_digests: Dict[Tuple[str, int, int], str] = {}
+    
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build cache key from the parameters that determine the audio
+        
+        Args:
+            **parts: JSON-serializable key parts (None values are ignored)
+        
+        Returns:
+            Hex digest
+        """
+        payload = {k: v for k, v in parts.items() if v is not None}
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def file_digest(self, path: str) -> str:
+        """
+        Content hash of a local file (e.g. reference audio for voice cloning)
+        
+        Non-local values (URLs, voice names) are returned unchanged.
+        """
+        if not os.path.isfile(path):
+            return path
+        
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._file_digests.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._file_digests[key] = digest
+        return digest
+    
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_index(self) -> Dict[str, Tuple[str, int, float]]:
+        """Scan cache directory once (caller holds the lock)"""
+        if self._index is not None:
+            return self._index
+        
+        index = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for name in os.listdir(self.cache_dir):
+            key, ext = os.path.splitext(name)
+            if ext == ".json" or ext == ".tmp":
+                continue
+            if not os.path.exists(self._meta_path(key)):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                index[key] = (name, stat.st_size, stat.st_mtime)
+            except OSError:
+                continue
+        
+        self._index = index
+        logger.debug(f"TTS cache index loaded: {len(index)} entries")
+        return index
+    
+    async def fetch(self, key: str, output_path: str) -> Optional[str]:
+        """
+        Materialize cached audio at output_path
+        
+        Args:
+            key: Cache key from make_key()
+            output_path: Where the caller expects the audio
+        
+        Returns:
+            output_path on hit, None on miss
+        """
+        meta = await asyncio.to_thread(self._fetch_sync, key, output_path)
+        if meta is None:
+            return None
+        
+        # Seed the probe cache so the caller's duration lookup costs no ffprobe
+        probe_result = meta.get("probe")
+        if probe_result:
+            from pixelle_video.services.media_info import MediaInfo, prime_media_info
+            prime_media_info(output_path, MediaInfo.from_probe(output_path, probe_result))
+        
+        logger.info(f"♻️  TTS cache hit ({key[:12]}): {output_path}")
+        return output_path
+    
+    def _fetch_sync(self, key: str, output_path: str) -> Optional[Dict[str, Any]]:
+        """Copy cached audio to output_path (blocking), return entry metadata or None on miss"""
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                return None
+            
+            filename, size, _ = entry
+            cached_path = os.path.join(self.cache_dir, filename)
+            
+            try:
+                parent_dir = os.path.dirname(output_path)
+                if parent_dir:
+                    os.makedirs(parent_dir, exist_ok=True)
+                # Copy rather than hard link: touching the entry below must not
+                # change the mtime (and thus the probe cache key) of earlier outputs
+                shutil.copyfile(cached_path, output_path)
+                
+                # Mark as recently used
+                now = time.time()
+                os.utime(cached_path, (now, now))
+                self._index[key] = (filename, size, now)
+                
+                with open(self._meta_path(key), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"TTS cache entry {key[:12]} unusable, dropping: {e}")
+                self._remove(key)
+                return None
+        
+        return meta
+    
+    async def store(self, key: str, audio_path: str):
+        """
+        Add generated audio to the cache (errors are logged, never raised)
+        
+        Args:
+            key: Cache key from make_key()
+            audio_path: Local audio file produced by TTS
+        """
+        try:
+            from pixelle_video.services.media_info import get_media_info
+            
+            # Probe once here; the same result is reused by the caller and by future hits
+            info = await get_media_info(audio_path)
+            
+            size = await asyncio.to_thread(self._store_sync, key, audio_path, info)
+            logger.debug(f"TTS audio cached ({key[:12]}): {size} bytes")
+        except Exception as e:
+            logger.warning(f"Failed to cache TTS audio: {e}")
+    
+    def _store_sync(self, key: str, audio_path: str, info) -> int:
+        """Copy audio and metadata into the cache (blocking), return cached size"""
+        ext = os.path.splitext(audio_path)[1] or ".mp3"
+        filename = f"{key}{ext}"
+        cached_path = os.path.join(self.cache_dir, filename)
+        
+        with self._lock:
+            index = self._load_index()
+            
+            tmp_path = f"{cached_path}.tmp"
+            shutil.copyfile(audio_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+            
+            size = os.path.getsize(cached_path)
+            meta = {
+                "key": key,
+                "file": filename,
+                "size": size,
+                "duration": info.duration,
+                "probe": {"format": info.format, "streams": info.streams},
+                "created_at": time.time(),
+            }
+            with open(self._meta_path(key), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            
+            index[key] = (filename, size, time.time())
+            self._evict()
+        
+        return size
+    
+    def _evict(self):
+        """Evict least recently used entries above the size limit (caller holds the lock)"""
+        index = self._index
+        total = sum(size for _, size, _ in index.values())
+        if total <= self.max_size_bytes:
+            return
+        
+        for key, (_, size, _) in sorted(index.items(), key=lambda item: item[1][2]):
+            if total <= self.max_size_bytes:
+                break
+            self._remove(key)
+            total -= size
+            logger.debug(f"TTS cache evicted {key[:12]} ({size} bytes)")
+    
+    def _remove(self, key: str):
+        """Remove entry files and index record (caller holds the lock)"""
+        entry = self._index.pop(key, None) if self._index is not None else None
+        paths = [self._meta_path(key)]
+        if entry:
+            paths.append(os.path.join(self.cache_dir, entry[0]))
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove TTS cache file {path}: {e}")
+    
+    def clear(self):
+        """Remove all cached audio"""
+        with self._lock:
+            for key in list(self._load_index().keys()):
+                self._remove(key)
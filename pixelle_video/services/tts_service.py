@@ -14,6 +14,7 @@
 TTS (Text-to-Speech) Service - Supports both local and ComfyUI inference
 """
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
@@ -23,6 +24,7 @@ from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.services.tts_cache import TTSCache
 from pixelle_video.utils.tts_util import edge_tts
 from pixelle_video.tts_voices import speed_to_rate
 
@@ -60,6 +62,12 @@ class TTSService(ComfyBaseService):
             core: PixelleVideoCore instance (for accessing shared ComfyKit)
         """
         super().__init__(config, service_name="tts", core=core)
+        
+        # Content-addressed audio cache (identical requests skip synthesis)
+        cache_config = self.config.get("cache", {})
+        self.cache: Optional[TTSCache] = None
+        if cache_config.get("enabled", True):
+            self.cache = TTSCache(max_size_mb=cache_config.get("max_size_mb", 512))
     
     
     async def __call__(
@@ -178,6 +186,12 @@ class TTSService(ComfyBaseService):
             # Ensure output directory exists
             Path("output").mkdir(parents=True, exist_ok=True)
         
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(mode="local", text=text, voice=final_voice, rate=rate)
+            if await self.cache.fetch(cache_key, output_path):
+                return output_path
+        
         # Call Edge TTS
         try:
             audio_bytes = await edge_tts(
@@ -187,6 +201,9 @@ class TTSService(ComfyBaseService):
                 output_path=output_path
             )
             
+            if cache_key:
+                await self.cache.store(cache_key, output_path)
+            
             logger.info(f"✅ Generated audio (local Edge TTS): {output_path}")
             return output_path
         
@@ -237,6 +254,14 @@ class TTSService(ComfyBaseService):
         
         logger.debug(f"Workflow parameters: {workflow_params}")
         
+        # Only locally materialized results are cacheable (URL results have no output_path)
+        cache_key = None
+        if self.cache and output_path:
+            # Hashes the workflow file and reference audio: keep it off the event loop
+            cache_key = await asyncio.to_thread(self._comfyui_cache_key, workflow_info, workflow_params)
+            if await self.cache.fetch(cache_key, output_path):
+                return output_path
+        
         # 3. Execute workflow using shared ComfyKit instance from core
         try:
             # Get shared ComfyKit instance (lazy initialization + config hot-reload)
@@ -293,19 +318,12 @@ class TTSService(ComfyBaseService):
             
             # If output_path provided and audio_path is URL, download to local
             if output_path and audio_path.startswith(('http://', 'https://')):
-                import httpx
-                import os
-                
-                # Ensure parent directory exists
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                
+                # Shared pooled client (creates parent directory, streams to disk)
                 logger.info(f"Downloading audio from {audio_path} to {output_path}")
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(audio_path)
-                    response.raise_for_status()
-                    
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                await self.core.http.download(audio_path, output_path)
+                
+                if cache_key:
+                    await self.cache.store(cache_key, output_path)
                 
                 logger.info(f"✅ Generated audio (ComfyUI): {output_path}")
                 return output_path
@@ -316,3 +334,24 @@ class TTSService(ComfyBaseService):
         except Exception as e:
             logger.error(f"TTS generation error: {e}")
             raise
+    
+    def _comfyui_cache_key(self, workflow_info: dict, workflow_params: dict) -> str:
+        """
+        Build TTS cache key for a ComfyUI workflow call
+        
+        The workflow file content is part of the key (edits invalidate entries),
+        and reference audio is keyed by content rather than path. The frame
+        index only names outputs, so it is left out to share audio across frames.
+        """
+        key_params = {k: v for k, v in workflow_params.items() if k != "index"}
+        
+        ref_audio = key_params.get("ref_audio")
+        if isinstance(ref_audio, str) and ref_audio:
+            key_params["ref_audio"] = self.cache.file_digest(ref_audio)
+        
+        return self.cache.make_key(
+            mode="comfyui",
+            workflow=workflow_info["key"],
+            workflow_digest=self.cache.file_digest(workflow_info["path"]),
+            params=key_params,
+        )
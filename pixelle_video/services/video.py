@@ -17,9 +17,16 @@ High-performance video composition service built on ffmpeg-python.
 
 Features:
 - Video concatenation
+- Audio concatenation (multi-narration scenes)
 - Audio/video merging
 - Background music addition
 - Image to video conversion
+- Poster images and preview clips (listings)
+
+All ffmpeg work runs through the async execution layer (ffmpeg_runner):
+`*_async` methods never block the event loop, respect the global ffmpeg
+worker limit, kill ffmpeg on cancellation and can stream progress. The sync
+methods are thin wrappers kept for backward compatibility.
 
 Note: Requires FFmpeg to be installed on the system.
 """
@@ -27,13 +34,22 @@ Note: Requires FFmpeg to be installed on the system.
 import os
 import shutil
 import tempfile
+import asyncio
 import uuid
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
 import ffmpeg
 from loguru import logger
 
+from pixelle_video.services.ffmpeg_runner import (
+    FFmpegError,
+    ProgressCallback,
+    run_ffmpeg,
+    run_sync,
+)
+from pixelle_video.services.media_info import MediaInfo, get_media_info
 from pixelle_video.utils.os_util import (
     get_resource_path,
     list_resource_files,
@@ -61,6 +77,74 @@ def check_ffmpeg() -> None:
 check_ffmpeg()
 
 
+@dataclass(frozen=True)
+class SegmentEncodingProfile:
+    """
+    Encoding parameters shared by every segment producer
+    
+    All segments (image + audio, video + overlay + audio, padded, ...) are
+    encoded with the same codec, pixel format, frame rate, timebase, GOP and
+    audio layout, so the final concat can always use stream copy.
+    """
+    vcodec: str = 'libx264'
+    pix_fmt: str = 'yuv420p'
+    fps: int = 30
+    video_timescale: int = 90000  # MP4 track timescale (identical timebase across segments)
+    gop_seconds: float = 2.0  # Fixed keyframe interval
+    preset: str = 'medium'
+    crf: int = 23
+    acodec: str = 'aac'
+    audio_bitrate: str = '192k'
+    audio_rate: int = 44100
+    audio_channels: int = 2
+    
+    def with_fps(self, fps: Optional[int]) -> "SegmentEncodingProfile":
+        """Return a copy with a different frame rate (None keeps the current one)"""
+        if not fps or fps == self.fps:
+            return self
+        return replace(self, fps=fps)
+    
+    def video_kwargs(self) -> Dict[str, Any]:
+        """ffmpeg-python output kwargs for the video stream"""
+        gop = max(1, round(self.fps * self.gop_seconds))
+        return {
+            'vcodec': self.vcodec,
+            'pix_fmt': self.pix_fmt,
+            'r': self.fps,
+            'video_track_timescale': self.video_timescale,
+            'g': gop,
+            'keyint_min': gop,
+            'sc_threshold': 0,
+            'preset': self.preset,
+            'crf': self.crf,
+        }
+    
+    def audio_kwargs(self) -> Dict[str, Any]:
+        """ffmpeg-python output kwargs for the audio stream"""
+        return {
+            'acodec': self.acodec,
+            'audio_bitrate': self.audio_bitrate,
+            'ar': self.audio_rate,
+            'ac': self.audio_channels,
+        }
+    
+    def output_kwargs(self) -> Dict[str, Any]:
+        """ffmpeg-python output kwargs for a segment with video and audio"""
+        return {**self.video_kwargs(), **self.audio_kwargs()}
+    
+    def output_args(self) -> List[str]:
+        """Raw ffmpeg output arguments (for hand-built commands)"""
+        flags = {'vcodec': 'c:v', 'acodec': 'c:a', 'audio_bitrate': 'b:a'}
+        args = []
+        for key, value in self.output_kwargs().items():
+            args.extend([f"-{flags.get(key, key)}", str(value)])
+        return args
+
+
+# Default profile for storyboard segments
+DEFAULT_SEGMENT_PROFILE = SegmentEncodingProfile()
+
+
 class VideoService:
     """
     Video compositor for common video processing tasks
@@ -68,6 +152,9 @@ class VideoService:
     Uses ffmpeg-python for high-performance video processing.
     All operations preserve video quality when possible (stream copy).
     
+    Every operation has an async variant (e.g. `concat_videos_async`) that
+    should be preferred from async code; the sync variants block the caller.
+    
     Examples:
         >>> compositor = VideoCompositor()
         >>> 
@@ -98,8 +185,49 @@ class VideoService:
         ...     "narration.mp3",
         ...     "segment.mp4"
         ... )
+        >>> 
+        >>> # From async code (non-blocking)
+        >>> await compositor.create_video_from_image_async(
+        ...     "frame.png",
+        ...     "narration.mp3",
+        ...     "segment.mp4"
+        ... )
     """
     
+    def __init__(self, profile: Optional[SegmentEncodingProfile] = None):
+        """
+        Initialize video service
+        
+        Args:
+            profile: Segment encoding profile (defaults to DEFAULT_SEGMENT_PROFILE)
+        """
+        self.profile = profile or DEFAULT_SEGMENT_PROFILE
+    
+    async def _run(
+        self,
+        stream_or_args: Union[List[str], "ffmpeg.nodes.OutputStream"],
+        description: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        duration: Optional[float] = None
+    ):
+        """
+        Run an ffmpeg-python output stream (or raw argument list) asynchronously
+        
+        Raises:
+            FFmpegError: If ffmpeg fails
+        """
+        if isinstance(stream_or_args, list):
+            args = stream_or_args
+        else:
+            args = stream_or_args.get_args()
+        
+        await run_ffmpeg(
+            args,
+            progress_callback=progress_callback,
+            duration=duration,
+            description=description
+        )
+    
     def concat_videos(
         self,
         videos: List[str],
@@ -108,6 +236,28 @@ class VideoService:
         bgm_path: Optional[str] = None,
         bgm_volume: float = 0.2,
         bgm_mode: Literal["once", "loop"] = "loop"
+    ) -> str:
+        """
+        Concatenate multiple videos into one (blocking, see concat_videos_async)
+        """
+        return run_sync(self.concat_videos_async(
+            videos=videos,
+            output=output,
+            method=method,
+            bgm_path=bgm_path,
+            bgm_volume=bgm_volume,
+            bgm_mode=bgm_mode
+        ))
+    
+    async def concat_videos_async(
+        self,
+        videos: List[str],
+        output: str,
+        method: Literal["demuxer", "filter"] = "demuxer",
+        bgm_path: Optional[str] = None,
+        bgm_volume: float = 0.2,
+        bgm_mode: Literal["once", "loop"] = "loop",
+        progress_callback: Optional[ProgressCallback] = None
     ) -> str:
         """
         Concatenate multiple videos into one
@@ -126,6 +276,7 @@ class VideoService:
             bgm_mode: BGM playback mode
                 - "once": Play BGM once
                 - "loop": Loop BGM to match video duration
+            progress_callback: Optional callback receiving FFmpegProgress
         
         Returns:
             Path to the output video file
@@ -147,22 +298,36 @@ class VideoService:
             shutil.copy(videos[0], output)
             return output
         
+        # Preflight: stream copy is only safe if all segments share one encoding profile
+        if method == "demuxer":
+            problems = await self.check_concat_compatibility(videos)
+            if problems:
+                logger.warning(
+                    f"⚠️ Segments are not stream-copy compatible, falling back to filter concat:\n  "
+                    + "\n  ".join(problems[:10])
+                )
+                method = "filter"
+        
         logger.info(f"Concatenating {len(videos)} videos using {method} method")
         
         # Step 1: Concatenate videos
         if bgm_path:
             # If BGM needed, concatenate to temp file first
             temp_output = output.replace('.mp4', '_no_bgm.mp4')
-            concat_result = self._concat_demuxer(videos, temp_output) if method == "demuxer" else self._concat_filter(videos, temp_output)
+            if method == "demuxer":
+                concat_result = await self._concat_demuxer_async(videos, temp_output, progress_callback)
+            else:
+                concat_result = await self._concat_filter_async(videos, temp_output, progress_callback)
             
             # Step 2: Add BGM
             logger.info(f"Adding BGM: {bgm_path} (volume={bgm_volume}, mode={bgm_mode})")
-            final_result = self._add_bgm_to_video(
+            final_result = await self._add_bgm_to_video_async(
                 video=concat_result,
                 bgm_path=bgm_path,
                 output=output,
                 volume=bgm_volume,
-                mode=bgm_mode
+                mode=bgm_mode,
+                progress_callback=progress_callback
             )
             
             # Clean up temp file
@@ -173,11 +338,61 @@ class VideoService:
         else:
             # No BGM, direct concatenation
             if method == "demuxer":
-                return self._concat_demuxer(videos, output)
+                return await self._concat_demuxer_async(videos, output, progress_callback)
             else:
-                return self._concat_filter(videos, output)
+                return await self._concat_filter_async(videos, output, progress_callback)
     
-    def _concat_demuxer(self, videos: List[str], output: str) -> str:
+    @staticmethod
+    def _concat_signature(info: MediaInfo) -> Dict[str, Any]:
+        """Stream parameters that must match for concat demuxer stream copy"""
+        video_stream = info.video_stream or {}
+        return {
+            'video_codec': info.video_codec,
+            'resolution': f"{info.width}x{info.height}",
+            'pix_fmt': info.pix_fmt,
+            'fps': round(info.fps, 3) if info.fps else None,
+            'time_base': video_stream.get('time_base'),
+            'has_audio': info.has_audio,
+            'audio_codec': info.audio_codec,
+            'sample_rate': info.sample_rate,
+            'channels': info.channels,
+        }
+    
+    async def check_concat_compatibility(self, videos: List[str]) -> List[str]:
+        """
+        Check whether videos can be concatenated with stream copy
+        
+        Compares codec, resolution, pixel format, frame rate, timebase and
+        audio layout of every video against the first one.
+        
+        Args:
+            videos: List of video file paths
+        
+        Returns:
+            List of mismatch descriptions (empty if copy concat is safe)
+        """
+        try:
+            infos = await asyncio.gather(*(get_media_info(video) for video in videos))
+        except Exception as e:
+            return [f"Failed to probe segments: {e}"]
+        
+        reference = self._concat_signature(infos[0])
+        problems = []
+        
+        for info in infos[1:]:
+            signature = self._concat_signature(info)
+            for key, expected in reference.items():
+                if signature[key] != expected:
+                    problems.append(f"{info.path}: {key}={signature[key]} (expected {expected})")
+        
+        return problems
+    
+    async def _concat_demuxer_async(
+        self,
+        videos: List[str],
+        output: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> str:
         """
         Concatenate using concat demuxer (fast, no re-encoding)
         
@@ -199,24 +414,30 @@ class VideoService:
         
         try:
             logger.debug(f"Created filelist: {filelist}")
-            (
+            await self._run(
                 ffmpeg
                 .input(filelist, format='concat', safe=0)
                 .output(output, c='copy')
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .overwrite_output(),
+                description="ffmpeg concat",
+                progress_callback=progress_callback
             )
             logger.success(f"Videos concatenated successfully: {output}")
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg concat error: {error_msg}")
             raise RuntimeError(f"Failed to concatenate videos: {error_msg}")
         finally:
             if os.path.exists(filelist):
                 os.unlink(filelist)
     
-    def _concat_filter(self, videos: List[str], output: str) -> str:
+    async def _concat_filter_async(
+        self,
+        videos: List[str],
+        output: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> str:
         """
         Concatenate using concat filter (slower but handles different formats)
         
@@ -232,31 +453,30 @@ class VideoService:
             stream_spec = "".join([f"[{i}:v][{i}:a]" for i in range(n)])
             filter_complex = f"{stream_spec}concat=n={n}:v=1:a=1[v][a]"
             
-            # Build ffmpeg command
-            cmd = ['ffmpeg']
+            # Build ffmpeg arguments
+            args = []
             for video in videos:
-                cmd.extend(['-i', video])
-            cmd.extend([
+                args.extend(['-i', video])
+            args.extend([
                 '-filter_complex', filter_complex,
                 '-map', '[v]',
                 '-map', '[a]',
+            ])
+            
+            # Re-encode with the segment profile so the output is normalized
+            args.extend(self.profile.output_args())
+            
+            args.extend([
                 '-y',  # Overwrite output
                 output
             ])
             
-            # Run command
-            import subprocess
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            await self._run(args, description="ffmpeg concat filter", progress_callback=progress_callback)
             
             logger.success(f"Videos concatenated successfully: {output}")
             return output
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg concat filter error: {error_msg}")
             raise RuntimeError(f"Failed to concatenate videos: {error_msg}")
         except Exception as e:
@@ -264,25 +484,91 @@ class VideoService:
             raise RuntimeError(f"Failed to concatenate videos: {e}")
     
     def _get_video_duration(self, video: str) -> float:
+        """Get video duration in seconds"""
+        return run_sync(self._get_video_duration_async(video))
+    
+    async def _get_video_duration_async(self, video: str) -> float:
         """Get video duration in seconds"""
         try:
-            probe = ffmpeg.probe(video)
-            duration = float(probe['format']['duration'])
-            return duration
+            info = await get_media_info(video)
+            if info.duration is None:
+                raise ValueError(f"No duration in probe result for {video}")
+            return info.duration
         except Exception as e:
             logger.warning(f"Failed to get video duration: {e}")
             return 0.0
     
+    def concat_audios(self, audios: List[str], output: str) -> str:
+        """
+        Concatenate audio files into one (blocking, see concat_audios_async)
+        """
+        return run_sync(self.concat_audios_async(audios, output))
+    
+    async def concat_audios_async(self, audios: List[str], output: str) -> str:
+        """
+        Concatenate audio files of the same format into one (stream copy)
+        
+        FFmpeg equivalent:
+            ffmpeg -f concat -safe 0 -i filelist.txt -c copy output.mp3
+        
+        Args:
+            audios: Audio file paths, in playback order
+            output: Output audio path
+        
+        Returns:
+            Path to the output audio
+        
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        if len(audios) == 1:
+            shutil.copy(audios[0], output)
+            return output
+        
+        # Create temporary file list
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            delete=False,
+            suffix='.txt',
+            encoding='utf-8'
+        ) as f:
+            for audio in audios:
+                escaped_path = str(Path(audio).absolute()).replace("'", "'\\''")
+                f.write(f"file '{escaped_path}'\n")
+            filelist = f.name
+        
+        try:
+            await self._run(
+                ffmpeg
+                .input(filelist, format='concat', safe=0)
+                .output(output, c='copy')
+                .overwrite_output(),
+                description="ffmpeg audio concat"
+            )
+            logger.debug(f"Audio concatenated: {output}")
+            return output
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
+            logger.error(f"FFmpeg audio concat error: {error_msg}")
+            raise RuntimeError(f"Failed to concatenate audios: {error_msg}")
+        finally:
+            if os.path.exists(filelist):
+                os.unlink(filelist)
+    
     def _get_audio_duration(self, audio: str) -> float:
+        """Get audio duration in seconds"""
+        return run_sync(self._get_audio_duration_async(audio))
+    
+    async def _get_audio_duration_async(self, audio: str) -> float:
         """Get audio duration in seconds"""
         try:
-            probe = ffmpeg.probe(audio)
-            duration = float(probe['format']['duration'])
-            return duration
+            info = await get_media_info(audio)
+            if info.duration is None:
+                raise ValueError(f"No duration in probe result for {audio}")
+            return info.duration
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
-            import os
             file_size = os.path.getsize(audio)
             # Assume ~16kbps for MP3, so 2KB per second
             estimated_duration = file_size / 2000
@@ -292,6 +578,18 @@ class VideoService:
         """
         Check if video has audio stream
         
+        Args:
+            video: Video file path
+        
+        Returns:
+            True if video has audio stream, False otherwise
+        """
+        return run_sync(self.has_audio_stream_async(video))
+    
+    async def has_audio_stream_async(self, video: str) -> bool:
+        """
+        Check if video has audio stream (non-blocking)
+        
         Args:
             video: Video file path
         
@@ -299,16 +597,49 @@ class VideoService:
             True if video has audio stream, False otherwise
         """
         try:
-            probe = ffmpeg.probe(video)
-            audio_streams = [s for s in probe.get('streams', []) if s['codec_type'] == 'audio']
-            has_audio = len(audio_streams) > 0
+            info = await get_media_info(video)
+            has_audio = info.has_audio
             logger.debug(f"Video {video} has_audio={has_audio}")
             return has_audio
         except Exception as e:
             logger.warning(f"Failed to probe video audio streams: {e}, assuming no audio")
             return False
     
+    async def _get_video_geometry_async(self, video: str) -> tuple[int, int, float]:
+        """Get (width, height, fps) of the first video stream"""
+        info = await get_media_info(video)
+        if not info.width or not info.height:
+            raise RuntimeError(f"No video stream found in {video}")
+        return info.width, info.height, info.fps or 30
+    
     def merge_audio_video(
+        self,
+        video: str,
+        audio: str,
+        output: str,
+        replace_audio: bool = True,
+        audio_volume: float = 1.0,
+        video_volume: float = 0.0,
+        pad_strategy: str = "freeze",
+        auto_adjust_duration: bool = True,
+        duration_tolerance: float = 0.3,
+    ) -> str:
+        """
+        Merge audio with video (blocking, see merge_audio_video_async)
+        """
+        return run_sync(self.merge_audio_video_async(
+            video=video,
+            audio=audio,
+            output=output,
+            replace_audio=replace_audio,
+            audio_volume=audio_volume,
+            video_volume=video_volume,
+            pad_strategy=pad_strategy,
+            auto_adjust_duration=auto_adjust_duration,
+            duration_tolerance=duration_tolerance
+        ))
+    
+    async def merge_audio_video_async(
         self,
         video: str,
         audio: str,
@@ -319,6 +650,7 @@ class VideoService:
         pad_strategy: str = "freeze",  # "freeze" (freeze last frame) or "black" (black screen)
         auto_adjust_duration: bool = True,  # Automatically adjust video duration to match audio
         duration_tolerance: float = 0.3,  # Tolerance for video being longer than audio (seconds)
+        progress_callback: Optional[ProgressCallback] = None
     ) -> str:
         """
         Merge audio with video with intelligent duration adjustment
@@ -347,6 +679,7 @@ class VideoService:
             auto_adjust_duration: Enable intelligent duration adjustment (default: True)
             duration_tolerance: Tolerance for video being longer than audio in seconds (default: 0.3)
                               Videos within this tolerance won't be trimmed
+            progress_callback: Optional callback receiving FFmpegProgress of the final encode
         
         Returns:
             Path to the output video file
@@ -364,8 +697,8 @@ class VideoService:
             - When replace_audio=False and video has audio, original and new audio are mixed
         """
         # Get durations of video and audio
-        video_duration = self._get_video_duration(video)
-        audio_duration = self._get_audio_duration(audio)
+        video_duration = await self._get_video_duration_async(video)
+        audio_duration = await self._get_audio_duration_async(audio)
         
         logger.info(f"Video duration: {video_duration:.2f}s, Audio duration: {audio_duration:.2f}s")
         
@@ -376,14 +709,14 @@ class VideoService:
             if diff < 0:
                 # Video shorter than audio → Must pad to avoid black screen
                 logger.warning(f"⚠️ Video shorter than audio by {abs(diff):.2f}s, padding required")
-                video = self._pad_video_to_duration(video, audio_duration, pad_strategy)
+                video = await self._pad_video_to_duration_async(video, audio_duration, pad_strategy)
                 video_duration = audio_duration  # Update duration after padding
                 logger.info(f"📌 Padded video to {audio_duration:.2f}s")
             
             elif diff > duration_tolerance:
                 # Video significantly longer than audio → Trim
                 logger.info(f"⚠️ Video longer than audio by {diff:.2f}s (tolerance: {duration_tolerance}s)")
-                video = self._trim_video_to_duration(video, audio_duration)
+                video = await self._trim_video_to_duration_async(video, audio_duration)
                 video_duration = audio_duration  # Update duration after trimming
                 logger.info(f"✂️ Trimmed video to {audio_duration:.2f}s")
             
@@ -396,7 +729,7 @@ class VideoService:
         logger.info(f"Target output duration: {target_duration:.2f}s")
         
         # Check if video has audio stream
-        video_has_audio = self.has_audio_stream(video)
+        video_has_audio = await self.has_audio_stream_async(video)
         
         # Prepare video stream (potentially with padding)
         input_video = ffmpeg.input(video)
@@ -412,17 +745,7 @@ class VideoService:
                 video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
             else:  # black
                 # Generate black frames for padding duration
-                # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
-                
-                # Create black video for padding
-                black_video_path = self._get_unique_temp_path("black_pad", os.path.basename(output))
+                width, height, fps = await self._get_video_geometry_async(video)
                 black_input = ffmpeg.input(
                     f'color=c=black:s={width}x{height}:r={fps}',
                     f='lavfi',
@@ -447,24 +770,24 @@ class VideoService:
             logger.info(f"Video has no audio stream, adding audio track")
             # Video is silent, just add the audio
             try:
-                (
+                await self._run(
                     ffmpeg
                     .output(
                         video_stream,
                         audio_stream,
                         output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
+                        **self.profile.output_kwargs()  # Normalized segment encoding
                     )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
+                    .overwrite_output(),
+                    description="ffmpeg add audio",
+                    progress_callback=progress_callback,
+                    duration=target_duration
                 )
                 
                 logger.success(f"Audio added to silent video: {output}")
                 return output
-            except ffmpeg.Error as e:
-                error_msg = e.stderr.decode() if e.stderr else str(e)
+            except FFmpegError as e:
+                error_msg = e.stderr or str(e)
                 logger.error(f"FFmpeg error adding audio to silent video: {error_msg}")
                 raise RuntimeError(f"Failed to add audio to video: {error_msg}")
         
@@ -474,22 +797,10 @@ class VideoService:
         try:
             if replace_audio:
                 # Replace audio: use only new audio, ignore original
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        audio_stream,
-                        output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
+                output_audio = audio_stream
             else:
                 # Mix audio: combine original and new audio
-                mixed_audio = ffmpeg.filter(
+                output_audio = ffmpeg.filter(
                     [
                         input_video.audio.filter('volume', video_volume),
                         audio_stream
@@ -498,34 +809,84 @@ class VideoService:
                     inputs=2,
                     duration='longest'  # Use longest audio
                 )
-                
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        mixed_audio,
-                        output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
+            
+            await self._run(
+                ffmpeg
+                .output(
+                    video_stream,
+                    output_audio,
+                    output,
+                    **self.profile.output_kwargs()  # Normalized segment encoding
                 )
+                .overwrite_output(),
+                description="ffmpeg merge audio",
+                progress_callback=progress_callback,
+                duration=target_duration
+            )
             
             logger.success(f"Audio merged successfully: {output}")
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg merge error: {error_msg}")
             raise RuntimeError(f"Failed to merge audio and video: {error_msg}")
     
+    def _scale_to_canvas(self, video_stream, width: int, height: int, scale_mode: str = "contain"):
+        """
+        Scale a video stream to the canvas size
+        
+        Args:
+            video_stream: ffmpeg-python video stream
+            width: Canvas width
+            height: Canvas height
+            scale_mode: "contain" (letterbox/pillarbox), "cover" (crop) or "stretch"
+        
+        Returns:
+            Scaled ffmpeg-python video stream
+        """
+        if scale_mode == "contain":
+            # Scale to fit (letterbox/pillarbox if aspect ratio differs)
+            # Use scale filter with force_original_aspect_ratio=decrease and pad to center
+            return (
+                video_stream
+                .filter('scale', width, height, force_original_aspect_ratio='decrease')
+                .filter('pad', width, height, '(ow-iw)/2', '(oh-ih)/2', color='black')
+            )
+        elif scale_mode == "cover":
+            # Scale to cover (crop if aspect ratio differs)
+            return (
+                video_stream
+                .filter('scale', width, height, force_original_aspect_ratio='increase')
+                .filter('crop', width, height)
+            )
+        else:  # stretch
+            # Stretch to exact dimensions
+            return video_stream.filter('scale', width, height)
+    
     def overlay_image_on_video(
         self,
         video: str,
         overlay_image: str,
         output: str,
         scale_mode: str = "contain"
+    ) -> str:
+        """
+        Overlay a transparent image on top of video (blocking, see overlay_image_on_video_async)
+        """
+        return run_sync(self.overlay_image_on_video_async(
+            video=video,
+            overlay_image=overlay_image,
+            output=output,
+            scale_mode=scale_mode
+        ))
+    
+    async def overlay_image_on_video_async(
+        self,
+        video: str,
+        overlay_image: str,
+        output: str,
+        scale_mode: str = "contain",
+        progress_callback: Optional[ProgressCallback] = None
     ) -> str:
         """
         Overlay a transparent image on top of video
@@ -538,6 +899,7 @@ class VideoService:
                 - "contain": Scale video to fit within overlay dimensions (letterbox/pillarbox)
                 - "cover": Scale video to cover overlay dimensions (may crop)
                 - "stretch": Stretch video to exact overlay dimensions
+            progress_callback: Optional callback receiving FFmpegProgress
         
         Returns:
             Path to the output video file
@@ -555,10 +917,11 @@ class VideoService:
         
         try:
             # Get overlay image dimensions
-            overlay_probe = ffmpeg.probe(overlay_image)
-            overlay_stream = next(s for s in overlay_probe['streams'] if s['codec_type'] == 'video')
-            overlay_width = int(overlay_stream['width'])
-            overlay_height = int(overlay_stream['height'])
+            overlay_info = await get_media_info(overlay_image)
+            if not overlay_info.width or not overlay_info.height:
+                raise RuntimeError(f"Overlay image has no video stream: {overlay_image}")
+            overlay_width = overlay_info.width
+            overlay_height = overlay_info.height
             
             logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
             
@@ -566,52 +929,227 @@ class VideoService:
             input_overlay = ffmpeg.input(overlay_image)
             
             # Scale video to fit overlay size using scale_mode
-            if scale_mode == "contain":
-                # Scale to fit (letterbox/pillarbox if aspect ratio differs)
-                # Use scale filter with force_original_aspect_ratio=decrease and pad to center
-                scaled_video = (
-                    input_video
-                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='decrease')
-                    .filter('pad', overlay_width, overlay_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
-                )
-            elif scale_mode == "cover":
-                # Scale to cover (crop if aspect ratio differs)
-                scaled_video = (
-                    input_video
-                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='increase')
-                    .filter('crop', overlay_width, overlay_height)
-                )
-            else:  # stretch
-                # Stretch to exact dimensions
-                scaled_video = input_video.filter('scale', overlay_width, overlay_height)
+            scaled_video = self._scale_to_canvas(input_video.video, overlay_width, overlay_height, scale_mode)
             
             # Overlay the transparent image on top of the scaled video
             output_stream = ffmpeg.overlay(scaled_video, input_overlay)
             
-            (
+            await self._run(
                 ffmpeg
-                .output(output_stream, output, 
-                        vcodec='libx264',
-                        pix_fmt='yuv420p',
-                        preset='medium',
-                        crf=23)
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .output(output_stream, output, **self.profile.video_kwargs())
+                .overwrite_output(),
+                description="ffmpeg overlay",
+                progress_callback=progress_callback,
+                duration=await self._get_video_duration_async(video) if progress_callback else None
             )
             
             logger.success(f"Image overlaid on video: {output}")
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg overlay error: {error_msg}")
             raise RuntimeError(f"Failed to overlay image on video: {error_msg}")
     
+    def compose_video_segment(
+        self,
+        video: str,
+        overlay_image: str,
+        audio: str,
+        output: str,
+        scale_mode: str = "contain",
+        pad_strategy: str = "freeze",
+        duration_tolerance: float = 0.3,
+        audio_volume: float = 1.0,
+        fps: Optional[int] = None,
+    ) -> str:
+        """
+        Compose a video segment in a single encode (blocking, see compose_video_segment_async)
+        """
+        return run_sync(self.compose_video_segment_async(
+            video=video,
+            overlay_image=overlay_image,
+            audio=audio,
+            output=output,
+            scale_mode=scale_mode,
+            pad_strategy=pad_strategy,
+            duration_tolerance=duration_tolerance,
+            audio_volume=audio_volume,
+            fps=fps
+        ))
+    
+    async def _plan_video_segment(
+        self,
+        video: str,
+        overlay_image: Optional[str],
+        audio: str,
+        output: str,
+        scale_mode: str = "contain",
+        pad_strategy: str = "freeze",
+        duration_tolerance: float = 0.3,
+        audio_volume: float = 1.0,
+        fps: Optional[int] = None,
+    ) -> tuple:
+        """
+        Plan the filter graph for a video segment
+        
+        Builds one ffmpeg invocation that does what overlay_image_on_video +
+        merge_audio_video (+ _pad/_trim_video_to_duration) used to do with up
+        to three encodes:
+        
+            [0:v] scale/pad (canvas) -> overlay [1:v] -> tpad (if audio longer)
+            [2:a] volume -> apad (if video longer, within tolerance)
+            -t target_duration (trims video longer than audio + tolerance)
+        
+        Returns:
+            Tuple of (ffmpeg-python output stream, target duration in seconds)
+        """
+        profile = self.profile.with_fps(fps)
+        
+        video_duration = await self._get_video_duration_async(video)
+        audio_duration = await self._get_audio_duration_async(audio)
+        
+        # Same duration rules as merge_audio_video(auto_adjust_duration=True)
+        diff = video_duration - audio_duration
+        if diff < 0 or diff > duration_tolerance:
+            target_duration = audio_duration
+        else:
+            target_duration = video_duration
+        
+        logger.info(
+            f"Segment plan: video={video_duration:.2f}s, audio={audio_duration:.2f}s, "
+            f"target={target_duration:.2f}s"
+        )
+        
+        video_stream = ffmpeg.input(video).video
+        
+        if overlay_image:
+            overlay_info = await get_media_info(overlay_image)
+            if not overlay_info.width or not overlay_info.height:
+                raise RuntimeError(f"Overlay image has no video stream: {overlay_image}")
+            
+            video_stream = self._scale_to_canvas(video_stream, overlay_info.width, overlay_info.height, scale_mode)
+            video_stream = ffmpeg.overlay(video_stream, ffmpeg.input(overlay_image))
+        
+        # Video shorter than audio: extend the last frame (or black) inside the graph
+        if diff < 0:
+            pad_duration = audio_duration - video_duration
+            logger.info(f"Audio is longer, padding video by {pad_duration:.2f}s using '{pad_strategy}' strategy")
+            if pad_strategy == "freeze":
+                video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
+            else:  # black
+                video_stream = video_stream.filter('tpad', stop_mode='add', stop_duration=pad_duration, color='black')
+        
+        audio_stream = ffmpeg.input(audio).audio.filter('volume', audio_volume)
+        
+        # Video longer than audio (within tolerance): pad audio with silence
+        if target_duration > audio_duration:
+            audio_stream = audio_stream.filter('apad', whole_dur=target_duration)
+        
+        output_stream = (
+            ffmpeg
+            .output(
+                video_stream,
+                audio_stream,
+                output,
+                t=target_duration,  # Trims video that is longer than audio + tolerance
+                **profile.output_kwargs()
+            )
+            .overwrite_output()
+        )
+        
+        return output_stream, target_duration
+    
+    async def compose_video_segment_async(
+        self,
+        video: str,
+        overlay_image: Optional[str],
+        audio: str,
+        output: str,
+        scale_mode: str = "contain",
+        pad_strategy: str = "freeze",
+        duration_tolerance: float = 0.3,
+        audio_volume: float = 1.0,
+        fps: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Compose a video segment (media + overlay + narration) in a single encode
+        
+        Equivalent to overlay_image_on_video followed by
+        merge_audio_video(replace_audio=True), but without intermediate files
+        or generational re-encodes.
+        
+        Args:
+            video: Base video file path (e.g. AI-generated clip)
+            overlay_image: Transparent overlay image path (None to skip overlay)
+            audio: Narration audio file path (replaces the video's own audio)
+            output: Output video file path
+            scale_mode: How to scale the video to the overlay size ("contain", "cover", "stretch")
+            pad_strategy: How to extend video shorter than audio ("freeze" or "black")
+            duration_tolerance: Video longer than audio by up to this many seconds is kept as-is
+            audio_volume: Volume of the narration audio
+            fps: Output frame rate (defaults to the encoding profile's fps)
+            progress_callback: Optional callback receiving FFmpegProgress
+        
+        Returns:
+            Path to the output video file
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        logger.info(f"Composing video segment in a single pass (scale_mode={scale_mode})")
+        
+        output_stream, target_duration = await self._plan_video_segment(
+            video=video,
+            overlay_image=overlay_image,
+            audio=audio,
+            output=output,
+            scale_mode=scale_mode,
+            pad_strategy=pad_strategy,
+            duration_tolerance=duration_tolerance,
+            audio_volume=audio_volume,
+            fps=fps
+        )
+        
+        try:
+            await self._run(
+                output_stream,
+                description="ffmpeg compose segment",
+                progress_callback=progress_callback,
+                duration=target_duration
+            )
+            
+            logger.success(f"Video segment composed: {output} (duration: {target_duration:.3f}s)")
+            return output
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
+            logger.error(f"FFmpeg segment composition error: {error_msg}")
+            raise RuntimeError(f"Failed to compose video segment: {error_msg}")
+    
     def create_video_from_image(
         self,
         image: str,
         audio: str,
         output: str,
         fps: int = 30,
+    ) -> str:
+        """
+        Create video from static image and audio (blocking, see create_video_from_image_async)
+        """
+        return run_sync(self.create_video_from_image_async(
+            image=image,
+            audio=audio,
+            output=output,
+            fps=fps
+        ))
+    
+    async def create_video_from_image_async(
+        self,
+        image: str,
+        audio: str,
+        output: str,
+        fps: int = 30,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> str:
         """
         Create video from static image and audio
@@ -621,6 +1159,7 @@ class VideoService:
             audio: Audio file path
             output: Output video path
             fps: Frames per second
+            progress_callback: Optional callback receiving FFmpegProgress
         
         Returns:
             Path to the output video
@@ -634,7 +1173,7 @@ class VideoService:
             - Useful for creating video segments from storyboard frames
         
         Example:
-            >>> compositor.create_video_from_image(
+            >>> await compositor.create_video_from_image_async(
             ...     "frame.png",
             ...     "narration.mp3",
             ...     "segment.mp4"
@@ -644,8 +1183,10 @@ class VideoService:
         
         try:
             # Get audio duration to ensure exact video duration match
-            probe = ffmpeg.probe(audio)
-            audio_duration = float(probe['format']['duration'])
+            audio_info = await get_media_info(audio)
+            if audio_info.duration is None:
+                raise RuntimeError(f"Could not determine audio duration: {audio}")
+            audio_duration = audio_info.duration
             logger.debug(f"Audio duration: {audio_duration:.3f}s")
             
             # Input image with loop (loop=1 means loop indefinitely)
@@ -655,29 +1196,25 @@ class VideoService:
             
             # Combine image and audio
             # Use -t to explicitly set video duration = audio duration
-            (
+            await self._run(
                 ffmpeg
                 .output(
                     input_image,
                     input_audio,
                     output,
                     t=audio_duration,  # Force video duration to match audio exactly
-                    vcodec='libx264',
-                    acodec='aac',
-                    pix_fmt='yuv420p',
-                    audio_bitrate='192k',
-                    preset='medium',
-                    crf=23,
-                    **{'b:v': '2M'}  # Video bitrate
+                    **self.profile.with_fps(fps).output_kwargs()  # Normalized segment encoding
                 )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .overwrite_output(),
+                description="ffmpeg image to video",
+                progress_callback=progress_callback,
+                duration=audio_duration
             )
             
             logger.success(f"Video created from image: {output} (duration: {audio_duration:.3f}s)")
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg error creating video from image: {error_msg}")
             raise RuntimeError(f"Failed to create video from image: {error_msg}")
     
@@ -690,6 +1227,30 @@ class VideoService:
         loop: bool = True,
         fade_in: float = 0.0,
         fade_out: float = 0.0,
+    ) -> str:
+        """
+        Add background music to video (blocking, see add_bgm_async)
+        """
+        return run_sync(self.add_bgm_async(
+            video=video,
+            bgm=bgm,
+            output=output,
+            bgm_volume=bgm_volume,
+            loop=loop,
+            fade_in=fade_in,
+            fade_out=fade_out
+        ))
+    
+    async def add_bgm_async(
+        self,
+        video: str,
+        bgm: str,
+        output: str,
+        bgm_volume: float = 0.3,
+        loop: bool = True,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> str:
         """
         Add background music to video
@@ -702,6 +1263,7 @@ class VideoService:
             loop: If True, loop BGM to match video duration
             fade_in: BGM fade-in duration in seconds
             fade_out: BGM fade-out duration in seconds (not yet implemented)
+            progress_callback: Optional callback receiving FFmpegProgress
         
         Returns:
             Path to the output video file
@@ -746,34 +1308,36 @@ class VideoService:
                 duration='first'  # Use video's duration
             )
             
-            (
+            await self._run(
                 ffmpeg
                 .output(
                     input_video.video,
                     mixed_audio,
                     output,
                     vcodec='copy',
-                    acodec='aac',
-                    audio_bitrate='192k'
+                    **self.profile.audio_kwargs()
                 )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .overwrite_output(),
+                description="ffmpeg add bgm",
+                progress_callback=progress_callback,
+                duration=await self._get_video_duration_async(video) if progress_callback else None
             )
             
             logger.success(f"BGM added successfully: {output}")
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg BGM error: {error_msg}")
             raise RuntimeError(f"Failed to add BGM: {error_msg}")
     
-    def _add_bgm_to_video(
+    async def _add_bgm_to_video_async(
         self,
         video: str,
         bgm_path: str,
         output: str,
         volume: float = 0.2,
-        mode: Literal["once", "loop"] = "loop"
+        mode: Literal["once", "loop"] = "loop",
+        progress_callback: Optional[ProgressCallback] = None
     ) -> str:
         """
         Internal helper to add BGM to video with path resolution
@@ -784,6 +1348,7 @@ class VideoService:
             output: Output file path
             volume: BGM volume (0.0-1.0)
             mode: "once" or "loop"
+            progress_callback: Optional callback receiving FFmpegProgress
         
         Returns:
             Path to output video
@@ -796,15 +1361,109 @@ class VideoService:
         
         # Add BGM using existing method
         loop = (mode == "loop")
-        return self.add_bgm(
+        return await self.add_bgm_async(
             video=video,
             bgm=resolved_bgm,
             output=output,
             bgm_volume=volume,
             loop=loop,
-            fade_in=0.0
+            fade_in=0.0,
+            progress_callback=progress_callback
         )
     
+    async def create_poster_async(
+        self,
+        video: str,
+        output: str,
+        width: int = 480,
+        timestamp: Optional[float] = None
+    ) -> str:
+        """
+        Extract a small poster image (thumbnail) from a video
+        
+        The image format follows the output extension (.jpg / .jpeg / .webp).
+        
+        Args:
+            video: Input video file path
+            output: Output image path
+            width: Poster width in pixels (height keeps the aspect ratio)
+            timestamp: Frame time in seconds (default: 1s, or the middle of shorter videos)
+        
+        Returns:
+            Path to the poster image
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        if timestamp is None:
+            duration = await self._get_video_duration_async(video)
+            timestamp = min(1.0, duration / 2) if duration > 0 else 0.0
+        
+        if output.lower().endswith(".webp"):
+            codec_kwargs = {"vcodec": "libwebp", "quality": 75}
+        else:
+            codec_kwargs = {"q:v": 4}
+        
+        try:
+            await self._run(
+                ffmpeg
+                .input(video, ss=timestamp)
+                .output(output, vframes=1, vf=f"scale={width}:-2", **codec_kwargs)
+                .overwrite_output(),
+                description="ffmpeg poster"
+            )
+            return output
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
+            logger.error(f"FFmpeg error creating poster: {error_msg}")
+            raise RuntimeError(f"Failed to create poster: {error_msg}")
+    
+    async def create_preview_clip_async(
+        self,
+        video: str,
+        output: str,
+        duration: float = 6.0,
+        width: int = 360
+    ) -> str:
+        """
+        Create a short, low-bitrate, muted preview clip of a video
+        
+        Args:
+            video: Input video file path
+            output: Output MP4 path
+            duration: Clip length in seconds (from the start of the video)
+            width: Clip width in pixels (height keeps the aspect ratio)
+        
+        Returns:
+            Path to the preview clip
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        try:
+            await self._run(
+                ffmpeg
+                .input(video, t=duration)
+                .output(
+                    output,
+                    vf=f"scale={width}:-2",
+                    vcodec="libx264",
+                    preset="veryfast",
+                    crf=32,
+                    pix_fmt="yuv420p",
+                    movflags="+faststart",
+                    an=None
+                )
+                .overwrite_output(),
+                description="ffmpeg preview clip",
+                duration=duration
+            )
+            return output
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
+            logger.error(f"FFmpeg error creating preview clip: {error_msg}")
+            raise RuntimeError(f"Failed to create preview clip: {error_msg}")
+    
     def _get_unique_temp_path(self, prefix: str, original_filename: str) -> str:
         """
         Generate unique temporary file path to avoid concurrent conflicts
@@ -890,6 +1549,10 @@ class VideoService:
             return []
     
     def _trim_video_to_duration(self, video: str, target_duration: float) -> str:
+        """Trim video to specified duration (blocking, see _trim_video_to_duration_async)"""
+        return run_sync(self._trim_video_to_duration_async(video, target_duration))
+    
+    async def _trim_video_to_duration_async(self, video: str, target_duration: float) -> str:
         """
         Trim video to specified duration
         
@@ -906,21 +1569,25 @@ class VideoService:
         output = self._get_unique_temp_path("trimmed", os.path.basename(video))
         
         try:
-            # Use stream copy when possible for fast trimming
-            (
+            # Use stream copy for fast trimming
+            await self._run(
                 ffmpeg
                 .input(video, t=target_duration)
-                .output(output, vcodec='copy', acodec='copy' if self.has_audio_stream(video) else 'copy')
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True, quiet=True)
+                .output(output, vcodec='copy', acodec='copy')
+                .overwrite_output(),
+                description="ffmpeg trim"
             )
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg error trimming video: {error_msg}")
             raise RuntimeError(f"Failed to trim video: {error_msg}")
     
     def _pad_video_to_duration(self, video: str, target_duration: float, pad_strategy: str = "freeze") -> str:
+        """Pad video to specified duration (blocking, see _pad_video_to_duration_async)"""
+        return run_sync(self._pad_video_to_duration_async(video, target_duration, pad_strategy))
+    
+    async def _pad_video_to_duration_async(self, video: str, target_duration: float, pad_strategy: str = "freeze") -> str:
         """
         Pad video to specified duration by extending the last frame or adding black frames
         
@@ -937,7 +1604,7 @@ class VideoService:
         """
         output = self._get_unique_temp_path("padded", os.path.basename(video))
         
-        video_duration = self._get_video_duration(video)
+        video_duration = await self._get_video_duration_async(video)
         pad_duration = target_duration - video_duration
         
         if pad_duration <= 0:
@@ -949,34 +1616,11 @@ class VideoService:
             video_stream = input_video.video
             
             if pad_strategy == "freeze":
-                # Freeze last frame using tpad filter
+                # Freeze last frame using tpad filter (requires re-encoding)
                 video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
-                
-                # Output with re-encoding (tpad requires it)
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        output,
-                        vcodec='libx264',
-                        preset='fast',
-                        crf=23
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True, quiet=True)
-                )
             else:  # black
                 # Generate black frames for padding duration
-                # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
-                
-                # Create black video for padding
+                width, height, fps = await self._get_video_geometry_async(video)
                 black_input = ffmpeg.input(
                     f'color=c=black:s={width}x{height}:r={fps}',
                     f='lavfi',
@@ -985,23 +1629,21 @@ class VideoService:
                 
                 # Concatenate original video with black padding
                 video_stream = ffmpeg.concat(video_stream, black_input.video, v=1, a=0)
-                
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        output,
-                        vcodec='libx264',
-                        preset='fast',
-                        crf=23
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True, quiet=True)
+            
+            await self._run(
+                ffmpeg
+                .output(
+                    video_stream,
+                    output,
+                    **self.profile.video_kwargs()
                 )
+                .overwrite_output(),
+                description="ffmpeg pad",
+                duration=target_duration
+            )
             
             return output
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except FFmpegError as e:
+            error_msg = e.stderr or str(e)
             logger.error(f"FFmpeg error padding video: {error_msg}")
             raise RuntimeError(f"Failed to pad video: {error_msg}")
-
@@ -0,0 +1,284 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Workflow Registry
+
+Process-wide index of ComfyUI workflow files, shared by all ComfyUI-based
+services (TTS, media, image/video analysis).
+
+Workflows live in {workflows,data/workflows}/{source}/*.json; for the same
+source and file name, data/workflows (custom) overrides workflows (default).
+The registry is built once and looked up by key ("source/name") in O(1).
+
+A polling watcher thread compares a signature of the workflow tree (path,
+mtime and size of every workflow file) every few seconds and rebuilds the
+registry when it changes; only new or changed files are parsed again.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import get_data_path, get_root_path
+
+# Signature of the workflow tree: ((path, mtime_ns, size), ...)
+_Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def parse_workflow_file(file_path: Path, source: str) -> Dict[str, Any]:
+    """
+    Parse workflow file and extract metadata
+    
+    Args:
+        file_path: Path to workflow JSON file
+        source: Source directory name (e.g., "selfhost", "runninghub")
+    
+    Returns:
+        Workflow info dict with structure:
+        {
+            "name": "image_flux.json",
+            "display_name": "image_flux.json - Runninghub",
+            "source": "runninghub",
+            "path": "workflows/runninghub/image_flux.json",
+            "key": "runninghub/image_flux.json",
+            "workflow_id": "123456"  # Only for RunningHub
+        }
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+    
+    # Build base info
+    workflow_info = {
+        "name": file_path.name,
+        "display_name": f"{file_path.name} - {source.title()}",
+        "source": source,
+        "path": str(file_path),
+        "key": f"{source}/{file_path.name}"
+    }
+    
+    # Check if it's a wrapper format (RunningHub, etc.)
+    if "source" in content:
+        # Wrapper format: {"source": "runninghub", "workflow_id": "xxx", ...}
+        if "workflow_id" in content:
+            workflow_info["workflow_id"] = content["workflow_id"]
+    
+    return workflow_info
+
+
+class WorkflowRegistry:
+    """
+    Shared workflow index with change detection
+    
+    Usage:
+        >>> from pixelle_video.services.workflow_registry import workflow_registry
+        >>> workflow_registry.start_watcher()
+        >>> info = workflow_registry.get("runninghub/image_flux.json")
+        >>> tts_workflows = workflow_registry.list_workflows(("tts_",))
+    """
+    
+    POLL_INTERVAL = 2.0  # Seconds between watcher checks
+    
+    def __init__(self, resource_type: str = "workflows", poll_interval: Optional[float] = None):
+        """
+        Initialize registry (nothing is scanned until first use)
+        
+        Args:
+            resource_type: Resource directory name under the project root and data/
+            poll_interval: Seconds between watcher checks (default: POLL_INTERVAL)
+        """
+        self.resource_type = resource_type
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+        
+        self._lock = threading.RLock()
+        self._signature: Optional[_Signature] = None
+        self._workflows: Dict[str, Dict[str, Any]] = {}  # key -> workflow info
+        self._by_prefixes: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        
+        # Parsed files: path -> ((mtime_ns, size), info or None if unparsable)
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Optional[Dict[str, Any]]]] = {}
+        
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+    
+    # ========================================================================
+    # Lookups
+    # ========================================================================
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get workflow info by key
+        
+        Args:
+            key: Workflow key (e.g., "runninghub/image_flux.json")
+        
+        Returns:
+            Workflow info dict (shared, do not modify), or None if not found
+        """
+        self._ensure_built()
+        return self._workflows.get(key)
+    
+    def list_workflows(self, prefixes: Tuple[str, ...] = ("",)) -> List[Dict[str, Any]]:
+        """
+        List workflows whose file name starts with one of the prefixes
+        
+        Args:
+            prefixes: File name prefixes (e.g., ("image_", "video_"))
+        
+        Returns:
+            Workflow info dicts sorted by key (shared, do not modify)
+        """
+        self._ensure_built()
+        with self._lock:
+            workflows = self._by_prefixes.get(prefixes)
+            if workflows is None:
+                workflows = [
+                    info for key, info in sorted(self._workflows.items())
+                    if info["name"].startswith(prefixes)
+                ]
+                self._by_prefixes[prefixes] = workflows
+            return workflows
+    
+    # ========================================================================
+    # Building
+    # ========================================================================
+    
+    def _roots(self) -> List[str]:
+        """Workflow root directories, lowest priority first"""
+        return [get_root_path(self.resource_type), get_data_path(self.resource_type)]
+    
+    def _scan(self) -> Tuple[_Signature, Dict[Tuple[str, str], str]]:
+        """
+        Stat the workflow tree
+        
+        Returns:
+            (signature, {(source, filename): path}) - custom files override defaults
+        """
+        signature = []
+        files: Dict[Tuple[str, str], str] = {}
+        
+        for root in self._roots():
+            try:
+                source_entries = sorted(os.scandir(root), key=lambda e: e.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            
+            for source_entry in source_entries:
+                if not source_entry.is_dir():
+                    continue
+                try:
+                    file_entries = sorted(os.scandir(source_entry.path), key=lambda e: e.name)
+                except OSError:
+                    continue
+                
+                for entry in file_entries:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    signature.append((entry.path, stat.st_mtime_ns, stat.st_size))
+                    files[(source_entry.name, entry.name)] = entry.path
+        
+        return tuple(signature), files
+    
+    def _build(self, signature: _Signature, files: Dict[Tuple[str, str], str]):
+        """Rebuild the index, parsing only new or changed files"""
+        stats = {path: (mtime_ns, size) for path, mtime_ns, size in signature}
+        parsed = {}
+        workflows = {}
+        
+        for (source, filename), path in files.items():
+            cached = self._parsed.get(path)
+            if cached is not None and cached[0] == stats[path]:
+                info = cached[1]
+            else:
+                try:
+                    info = parse_workflow_file(Path(path), source)
+                    logger.debug(f"Found workflow: {info['key']}")
+                except Exception as e:
+                    logger.error(f"Failed to parse workflow {source}/{filename}: {e}")
+                    info = None
+            parsed[path] = (stats[path], info)
+            if info is not None:
+                workflows[info["key"]] = info
+        
+        with self._lock:
+            self._parsed = parsed
+            self._workflows = workflows
+            self._by_prefixes = {}
+            self._signature = signature
+    
+    def _ensure_built(self):
+        """Build on first use"""
+        if self._signature is not None:
+            return
+        with self._lock:
+            if self._signature is None:
+                self._build(*self._scan())
+                if not self._workflows:
+                    logger.warning("No workflows found")
+    
+    def refresh(self) -> bool:
+        """
+        Rebuild the registry if any workflow file or directory changed
+        
+        Returns:
+            True if the registry was rebuilt
+        """
+        signature, files = self._scan()
+        with self._lock:
+            if signature == self._signature:
+                return False
+            was_built = self._signature is not None
+            self._build(signature, files)
+        if was_built:
+            logger.info(f"🔄 Workflow registry reloaded ({len(self._workflows)} workflows)")
+        return True
+    
+    # ========================================================================
+    # Watcher
+    # ========================================================================
+    
+    def start_watcher(self):
+        """Start the polling watcher thread (idempotent)"""
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._stop_event.clear()
+            self._watcher = threading.Thread(target=self._watch, name="workflow-registry-watcher", daemon=True)
+            self._watcher.start()
+    
+    def stop_watcher(self):
+        """Stop the polling watcher thread"""
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            self._stop_event.set()
+            watcher.join()
+    
+    def _watch(self):
+        """Watcher loop: refresh whenever the workflow tree changes"""
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Workflow registry refresh failed: {e}")
+
+
+# Process-wide registry shared by all ComfyUI-based services
+workflow_registry = WorkflowRegistry()
@@ -183,6 +183,68 @@ def save_bytes_to_file(data: bytes, file_path: str) -> str:
     return os.path.abspath(file_path)
 
 
+def atomic_write_bytes(file_path: str, data: bytes) -> str:
+    """
+    Write file atomically (temp file + fsync + rename)
+    
+    Readers see either the previous or the new content, never a truncated
+    file, even if the process crashes mid-write.
+    
+    Args:
+        file_path: Target file path
+        data: Binary data to write
+    
+    Returns:
+        Absolute path of written file
+    """
+    import tempfile
+    
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Persist the rename itself (not supported on Windows)
+    if os.name == "posix":
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    return os.path.abspath(file_path)
+
+
+def atomic_write_json(file_path: str, data, **dump_kwargs) -> str:
+    """
+    Write JSON file atomically (see atomic_write_bytes)
+    
+    Args:
+        file_path: Target file path
+        data: JSON-serializable object
+        **dump_kwargs: Extra json.dumps arguments (indent, ...)
+    
+    Returns:
+        Absolute path of written file
+    """
+    import json
+    
+    dump_kwargs.setdefault("ensure_ascii", False)
+    return atomic_write_bytes(file_path, json.dumps(data, **dump_kwargs).encode("utf-8"))
+
+
 def ensure_dir(path: str) -> str:
     """
     Ensure directory exists, create if not
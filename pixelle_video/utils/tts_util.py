@@ -211,9 +211,40 @@ async def edge_tts(
             raise RuntimeError("Edge TTS failed without error (unexpected)")
 
 
+def _estimate_audio_duration(audio_path: str) -> float:
+    """Rough duration estimate from file size (fallback when probing fails)"""
+    import os
+    file_size = os.path.getsize(audio_path)
+    # Assume ~16kbps for MP3, so 2KB per second
+    estimated_duration = file_size / 2000
+    return max(1.0, estimated_duration)  # At least 1 second
+
+
 def get_audio_duration(audio_path: str) -> float:
     """
-    Get audio file duration in seconds
+    Get audio file duration in seconds (blocking, see get_audio_duration_async)
+    
+    Args:
+        audio_path: Path to audio file
+    
+    Returns:
+        Duration in seconds
+    """
+    try:
+        # Shared probe cache (same result is reused when the audio is encoded)
+        from pixelle_video.services.media_info import get_media_info_sync
+        info = get_media_info_sync(audio_path)
+        if info.duration is None:
+            raise ValueError(f"No duration in probe result for {audio_path}")
+        return info.duration
+    except Exception as e:
+        logger.warning(f"Failed to get audio duration: {e}, using estimate")
+        return _estimate_audio_duration(audio_path)
+
+
+async def get_audio_duration_async(audio_path: str) -> float:
+    """
+    Get audio file duration in seconds (for async code: never blocks the event loop)
     
     Args:
         audio_path: Path to audio file
@@ -222,19 +253,15 @@ def get_audio_duration(audio_path: str) -> float:
         Duration in seconds
     """
     try:
-        # Try using ffmpeg-python
-        import ffmpeg
-        probe = ffmpeg.probe(audio_path)
-        duration = float(probe['format']['duration'])
-        return duration
+        # Shared probe cache (same result is reused when the audio is encoded)
+        from pixelle_video.services.media_info import get_media_info
+        info = await get_media_info(audio_path)
+        if info.duration is None:
+            raise ValueError(f"No duration in probe result for {audio_path}")
+        return info.duration
     except Exception as e:
         logger.warning(f"Failed to get audio duration: {e}, using estimate")
-        # Fallback: estimate based on file size (very rough)
-        import os
-        file_size = os.path.getsize(audio_path)
-        # Assume ~16kbps for MP3, so 2KB per second
-        estimated_duration = file_size / 2000
-        return max(1.0, estimated_duration)  # At least 1 second
+        return _estimate_audio_duration(audio_path)
 
 
 async def list_voices(locale: str = None, retry_count: int = _RETRY_COUNT, retry_base_delay: float = _RETRY_BASE_DELAY) -> list[str]:
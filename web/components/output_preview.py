@@ -15,6 +15,7 @@ Output preview components for web UI (right column)
 """
 
 import base64
+import math
 import os
 from pathlib import Path
 
@@ -233,7 +234,9 @@ def render_batch_output(pixelle_video, video_params):
         st.info(tr("batch.prepare_info", count=batch_count))
         
         # Estimated time (optional)
-        estimated_minutes = batch_count * 3  # Assume 3 minutes per video
+        # Assume 3 minutes per video, `batch.concurrency` videos at once
+        concurrency = config_manager.config.batch.concurrency
+        estimated_minutes = math.ceil(batch_count / concurrency) * 3
         st.caption(tr("batch.estimated_time", minutes=estimated_minutes))
         
         # Generate button with batch semantics
@@ -285,24 +288,35 @@ def render_batch_output(pixelle_video, video_params):
             overall_progress_bar = overall_progress_container.progress(0)
             overall_status = overall_progress_container.empty()
             
-            # Current task progress UI
-            current_task_title = current_task_container.empty()
-            current_task_progress = current_task_container.progress(0)
-            current_task_status = current_task_container.empty()
+            # One progress row per in-flight task (several run at once with batch.concurrency > 1)
+            task_rows = {}
             
-            # Overall progress callback
-            def update_overall_progress(current, total, topic):
-                progress = (current - 1) / total
+            def get_task_row(task_idx):
+                if task_idx not in task_rows:
+                    row = current_task_container.container()
+                    task_rows[task_idx] = (row.empty(), row.progress(0), row.empty())
+                return task_rows[task_idx]
+            
+            # Overall progress callback (items finish in any order)
+            def update_overall_progress(finished, total, index, topic, status):
+                progress = finished / total
                 overall_progress_bar.progress(progress)
                 overall_status.markdown(
-                    f"📊 **{tr('batch.overall_progress')}**: {current}/{total} ({int(progress * 100)}%)"
+                    f"📊 **{tr('batch.overall_progress')}**: {finished}/{total} ({int(progress * 100)}%)"
                 )
+                
+                # Finished tasks free their row
+                if status in ("success", "failed") and index in task_rows:
+                    for placeholder in task_rows.pop(index):
+                        placeholder.empty()
             
             # Single task progress callback factory
             def make_task_progress_callback(task_idx, topic):
                 def callback(event: ProgressEvent):
-                    # Display current task title
-                    current_task_title.markdown(f"🎬 **{tr('batch.current_task')} {task_idx}**: {topic}")
+                    task_title, task_progress, task_status = get_task_row(task_idx)
+                    
+                    # Display task title
+                    task_title.markdown(f"🎬 **{tr('batch.current_task')} {task_idx}**: {topic}")
                     
                     # Update task detailed progress
                     if event.event_type == "frame_step":
@@ -324,8 +338,8 @@ def render_batch_output(pixelle_video, video_params):
                     else:
                         message = tr(f"progress.{event.event_type}")
                     
-                    current_task_progress.progress(event.progress)
-                    current_task_status.text(message)
+                    task_progress.progress(event.progress)
+                    task_status.text(message)
                 
                 return callback
             
@@ -349,9 +363,9 @@ def render_batch_output(pixelle_video, video_params):
             # Clear progress displays
             overall_progress_bar.progress(1.0)
             overall_status.markdown(f"✅ **{tr('batch.completed')}**")
-            current_task_title.empty()
-            current_task_progress.empty()
-            current_task_status.empty()
+            for placeholders in task_rows.values():
+                for placeholder in placeholders:
+                    placeholder.empty()
             
             # Display results summary
             st.markdown("---")
@@ -28,6 +28,7 @@ if str(_project_root) not in sys.path:
 import streamlit as st
 from loguru import logger
 
+from pixelle_video.config import config_manager
 from web.state.session import init_session_state, init_i18n, get_pixelle_video
 from web.components.header import render_header
 from web.i18n import tr
@@ -161,6 +162,44 @@ def render_sidebar_controls(pixelle_video):
         return filter_status, sort_by, sort_order, page_size
 
 
+def get_card_poster(task: dict, pixelle_video) -> str:
+    """
+    Get the card poster, creating it on demand for tasks that have none
+    
+    Tasks created before posters existed (or whose preview step failed) get a
+    poster next to their video on first display. Returns None if previews are
+    disabled or the poster cannot be created; the card then shows the video.
+    """
+    poster_path = task.get("poster_path")
+    if poster_path and os.path.exists(poster_path):
+        return poster_path
+    
+    video_path = task.get("video_path")
+    preview_config = config_manager.config.preview
+    if not video_path or not os.path.exists(video_path) or not preview_config.enabled:
+        return None
+    
+    poster_path = os.path.join(os.path.dirname(video_path), f"poster.{preview_config.poster_format}")
+    if os.path.exists(poster_path):
+        return poster_path
+    
+    # Don't retry a failed poster on every rerun
+    failed = st.session_state.setdefault("poster_failed", set())
+    if task["task_id"] in failed:
+        return None
+    
+    try:
+        return run_async(pixelle_video.video.create_poster_async(
+            video_path,
+            poster_path,
+            width=preview_config.poster_width
+        ))
+    except Exception as e:
+        logger.warning(f"Failed to create poster for task {task['task_id']}: {e}")
+        failed.add(task["task_id"])
+        return None
+
+
 def render_grid_task_card(task: dict, pixelle_video):
     """Render a compact grid task card"""
     task_id = task["task_id"]
@@ -180,18 +219,28 @@ def render_grid_task_card(task: dict, pixelle_video):
     }
     status_icon = status_map.get(status, "❓")
     
-    # Get input text
-    detail = run_async(pixelle_video.history.get_task_detail(task_id))
-    input_text = ""
-    if detail and detail.get("metadata"):
-        input_params = detail["metadata"].get("input", {})
-        input_text = input_params.get("text", "")
+    # Input text preview is cached in the index; entries indexed before it
+    # was added fall back to the task summary (no storyboard frames)
+    input_text = task.get("text_preview")
+    if input_text is None:
+        summary = run_async(pixelle_video.history.get_task_summary(task_id))
+        input_text = ""
+        if summary and summary.get("metadata"):
+            input_text = summary["metadata"].get("text_preview", "")
+    
+    poster_path = get_card_poster(task, pixelle_video)
+    preview_path = task.get("preview_path")
     
     # Card container
     with st.container():
-        # Video preview at top
-        if video_path and os.path.exists(video_path):
-            st.video(video_path, autoplay=False, loop=False, muted=False)
+        # Poster (or short preview clip) at top - the full video is only loaded
+        # when neither exists (previews disabled or poster creation failed)
+        if poster_path:
+            st.image(poster_path, use_container_width=True)
+        elif preview_path and os.path.exists(preview_path):
+            st.video(preview_path, autoplay=False, loop=True, muted=True)
+        elif video_path and os.path.exists(video_path):
+            st.video(video_path)
         else:
             st.markdown(
                 f"<div style='background: #f0f0f0; height: 180px; display: flex; align-items: center; "
@@ -219,16 +268,21 @@ def render_grid_task_card(task: dict, pixelle_video):
         
         with col2:
             if video_path and os.path.exists(video_path):
-                with open(video_path, "rb") as f:
-                    st.download_button(
-                        "⬇️",
-                        data=f,
-                        file_name=f"{title}.mp4",
-                        mime="video/mp4",
-                        key=f"download_{task_id}",
-                        help=tr("history.task_card.download"),
-                        use_container_width=True
-                    )
+                # The video is only read once download is requested (not on every page render)
+                if st.session_state.get(f"prepare_download_{task_id}", False):
+                    with open(video_path, "rb") as f:
+                        st.download_button(
+                            "⬇️",
+                            data=f,
+                            file_name=f"{title}.mp4",
+                            mime="video/mp4",
+                            key=f"download_{task_id}",
+                            help=tr("history.task_card.download"),
+                            use_container_width=True
+                        )
+                elif st.button("⬇️", key=f"prepare_download_btn_{task_id}", help=tr("history.task_card.download"), use_container_width=True):
+                    st.session_state[f"prepare_download_{task_id}"] = True
+                    st.rerun()
             else:
                 st.button("⬇️", key=f"download_disabled_{task_id}", disabled=True, use_container_width=True)
         
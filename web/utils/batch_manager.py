@@ -13,8 +13,6 @@
 """
 Lightweight batch manager for Streamlit (Simplified YAGNI version)
 """
-import time
-import traceback
 from typing import List, Dict, Any, Optional, Callable
 from loguru import logger
 
@@ -26,7 +24,7 @@ class SimpleBatchManager:
     Design principles:
     1. Only supports "AI generate content" mode
     2. Same config for all videos, only topics differ
-    3. No CSV, no complex validation, just loop and execute
+    3. No CSV, no complex validation: execution is delegated to the core BatchEngine
     """
     
     def __init__(self):
@@ -50,7 +48,8 @@ class SimpleBatchManager:
             pixelle_video: PixelleVideoCore instance
             topics: List of topics (one per video)
             shared_config: Shared configuration for all videos
-            overall_progress_callback: Callback for overall progress
+            overall_progress_callback: Callback for overall progress, called on every item
+                status change with (finished, total, index, topic, status)
             task_progress_callback_factory: Factory function to create per-task callback
         
         Returns:
@@ -68,83 +67,81 @@ class SimpleBatchManager:
         
         logger.info(f"Starting batch generation: {self.total_count} topics")
         
-        for idx, topic in enumerate(topics, 1):
-            self.current_index = idx
+        # Extract title_prefix from shared_config (not a valid parameter for generate_video)
+        title_prefix = shared_config.get("title_prefix")
             
-            # Report overall progress
+        items = []
+        for topic in topics:
+            # Build task params (merge topic with shared config, excluding title_prefix)
+            task_params = {
+                "text": topic,  # Topic as input
+                "mode": "generate",  # Fixed mode
+            }
+            
+            # Merge shared config, excluding title_prefix and None values
+            # Filter out None values to avoid interfering with parameter logic in generate_video
+            for key, value in shared_config.items():
+                if key != "title_prefix" and value is not None:
+                    task_params[key] = value
+            
+            # Generate title using title_prefix
+            if title_prefix:
+                task_params["title"] = f"{title_prefix} - {topic}"
+            else:
+                # Use topic as title
+                task_params["title"] = topic
+            
+            items.append(task_params)
+        
+        # Run the whole batch on one event loop (shared HTTP pools / ComfyKit session),
+        # several videos at once, with per-item retry and resumable state on disk
+        from pixelle_video.services.batch_engine import BatchEngine
+        from web.utils.async_helpers import run_async
+        
+        engine = BatchEngine(pixelle_video)
+        batch = engine.create_batch(items)
+        
+        def on_item_update(item, state):
+            # Items run concurrently and finish in any order: report the finished count
+            finished = sum(1 for i in state["items"] if i["status"] in ("success", "failed"))
+            self.current_index = min(finished + 1, self.total_count)
             if overall_progress_callback:
                 overall_progress_callback(
-                    current=idx,
+                    finished=finished,
                     total=self.total_count,
-                    topic=topic
+                    index=item["index"],
+                    topic=item["params"]["text"],
+                    status=item["status"]
                 )
             
-            try:
-                logger.info(f"Task {idx}/{self.total_count} started: {topic}")
-                
-                # Extract title_prefix from shared_config (not a valid parameter for generate_video)
-                title_prefix = shared_config.get("title_prefix")
-                
-                # Build task params (merge topic with shared config, excluding title_prefix)
-                task_params = {
-                    "text": topic,  # Topic as input
-                    "mode": "generate",  # Fixed mode
-                }
-                
-                # Merge shared config, excluding title_prefix and None values
-                # Filter out None values to avoid interfering with parameter logic in generate_video
-                for key, value in shared_config.items():
-                    if key != "title_prefix" and value is not None:
-                        task_params[key] = value
-                
-                # Generate title using title_prefix
-                if title_prefix:
-                    task_params["title"] = f"{title_prefix} - {topic}"
-                else:
-                    # Use topic as title
-                    task_params["title"] = topic
-                
-                # Add per-task progress callback
-                if task_progress_callback_factory:
-                    task_params["progress_callback"] = task_progress_callback_factory(idx, topic)
-                
-                # Execute generation
-                from web.utils.async_helpers import run_async
-                result = run_async(pixelle_video.generate_video(**task_params))
-                
-                # Extract task_id from video_path (e.g., output/20251118_173821_f96a/final.mp4)
-                from pathlib import Path
-                task_id = Path(result.video_path).parent.name
-                
-                # Record success
-                self.results.append({
-                    "index": idx,
-                    "topic": topic,
-                    "task_id": task_id,
-                    "video_path": result.video_path,
-                    "status": "success"
-                })
-                
-                logger.info(f"Task {idx}/{self.total_count} completed: {result.video_path}")
-                
-            except Exception as e:
-                # Record error but continue
-                error_msg = str(e)
-                error_trace = traceback.format_exc()
+        progress_callback_factory = None
+        if task_progress_callback_factory:
+            def progress_callback_factory(item):
+                return task_progress_callback_factory(item["index"], item["params"]["text"])
                 
-                logger.error(f"Task {idx}/{self.total_count} failed: {error_msg}")
-                logger.debug(f"Error traceback:\n{error_trace}")
+        summary = run_async(engine.run(
+            batch,
+            progress_callback_factory=progress_callback_factory,
+            on_item_update=on_item_update
+        ))
                 
-                self.errors.append({
-                    "index": idx,
-                    "topic": topic,
-                    "error": error_msg,
-                    "traceback": error_trace,
-                    "status": "failed"
-                })
+        for item in summary["results"]:
+            self.results.append({
+                "index": item["index"],
+                "topic": item["params"]["text"],
+                "task_id": item["task_id"],
+                "video_path": item["video_path"],
+                "status": "success"
+            })
                 
-                # Continue to next task
-                continue
+        for item in summary["errors"]:
+            self.errors.append({
+                "index": item["index"],
+                "topic": item["params"]["text"],
+                "error": item["error"],
+                "traceback": item["traceback"],
+                "status": "failed"
+            })
         
         success_count = len(self.results)
         failed_count = len(self.errors)